@@ -1,9 +1,23 @@
+import argparse
 import concurrent.futures
+import hashlib
+import json
 import multiprocessing as mp
 import os
-import numpy as np
+from collections import Counter
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Iterator
+from blackjack.comparison import compare_players
+from blackjack.distributed import Coordinator, run_worker
+from blackjack.enums import RunOutcome, ShoeRNG, ShoeSampling
+from blackjack.importance_sampling import ImportanceSampler, RoundOutcomes
+from blackjack.results_export import FORMATS, ResultsWriter
+from blackjack.runs import play_runs
+from blackjack.winnings_distribution import WinningsDistribution
 
 try:
+    import simulation_template
     from simulation_template import SIMULATION_PARAMS, make_blackjack, make_player
 except ImportError as exc:
     raise SystemExit(
@@ -11,108 +25,317 @@ except ImportError as exc:
         "simulation_template.py and adjust your settings."
     ) from exc
 
+try:
+    from simulation_template import COMPARISON_PLAYERS
+except ImportError:
+    COMPARISON_PLAYERS = None
+
+try:
+    from simulation_template import make_log_policy
+except ImportError:
+    make_log_policy = None
+
+# seed of the importance sampling pilot run unless SIMULATION_PARAMS sets
+# "importance_sampling_seed". Runs are seeded 0, 1, 2, ..., so the pilot never
+# plays the shoes of a run, whatever the number of runs or sessions.
+IMPORTANCE_SAMPLING_SEED = 2 ** 32
+
 
 def _fmt_money(amount: float) -> str:
     """Format a numeric amount as USD-style string."""
     return f"${amount:,.2f}" if amount >= 0 else f"-${abs(amount):,.2f}"
 
 
-def _run_once(seed: int, number_of_shoes: int, penetration: float, shoe_size: int):
+def _template_fingerprint() -> str:
+    """
+    Hash of simulation_template.py and its SIMULATION_PARAMS. Chunks carry only
+    the simulation params, and workers build the table and player from their
+    own template, so a coordinator only serves workers with the same fingerprint.
+    """
+    digest = hashlib.sha256(Path(simulation_template.__file__).read_bytes())
+    digest.update(json.dumps(SIMULATION_PARAMS, sort_keys=True, default=repr).encode())
+    return digest.hexdigest()
+
+
+def _run_chunk(
+    first_seed: int,
+    number_of_runs: int,
+    number_of_shoes: int,
+    penetration: float,
+    shoe_size: int,
+    shoe_sampling: ShoeSampling = ShoeSampling.RANDOM,
+    shoe_rng: ShoeRNG = ShoeRNG.MT19937,
+    export: bool = False
+):
     """
-    Execute one simulation run and return (outcome, winnings, hands_played).
-    Outcome is one of {'bankrupt', 'goal', 'ran_out'}.
+    Play the template's player for consecutive runs starting at first_seed and
+    return their summary, see blackjack.runs.play_runs. With export, the
+    chunk's runs and count_stats columns follow as a dict of tables, and its
+    rounds too when the template defines make_log_policy.
     """
-    # Diagnostic: show which process is running which seed.
-    # Remove or comment out if noisy.
-    # print(f"Seed {seed} running on PID {os.getpid()}")
+    return play_runs(
+        make_blackjack=make_blackjack,
+        make_player=make_player,
+        first_run=first_seed,
+        number_of_runs=number_of_runs,
+        number_of_shoes=number_of_shoes,
+        penetration=penetration,
+        shoe_size=shoe_size,
+        shoe_sampling=shoe_sampling,
+        shoe_rng=shoe_rng,
+        export=export,
+        make_log_policy=make_log_policy
+    )
+
 
+def _importance_sampling_estimate(
+    number_of_sessions: int,
+    number_of_shoes: int,
+    penetration: float,
+    shoe_size: int,
+    seed: int = IMPORTANCE_SAMPLING_SEED
+):
+    """
+    Play one pilot run seeded with seed to collect the player's round outcomes,
+    then estimate the risk of ruin for sessions of the same length by importance
+    sampling. The bankroll is reset after every pilot round so the player never
+    leaves early.
+    """
     blackjack = make_blackjack()
     player = make_player()
     initial_bankroll = player.bankroll
+    round_outcomes = RoundOutcomes(player=player, reset_bankroll=True)
     blackjack.add_player(player=player)
     blackjack.simulate(
         penetration=penetration,
         number_of_shoes=number_of_shoes,
         shoe_size=shoe_size,
         seed=seed,
-        reset_bankroll=False,
+        reset_bankroll=True,
         progress_bar=False,
         _logfile=None
     )
-    stats_dict = player.stats.summary(string=False)
-    hands_played = stats_dict.get('TOTAL HANDS PLAYED', 0)
-    winnings = player.bankroll - initial_bankroll
-    if player.is_ruined:
-        outcome = 'bankrupt'
-    elif player.bankroll_goal_reached:
-        outcome = 'goal'
-    else:
-        outcome = 'ran_out'
-    return outcome, winnings, hands_played
+    outcomes = round_outcomes.outcomes
+    sampler = ImportanceSampler(round_outcomes=outcomes)
+    return sampler.estimate(
+        bankroll=initial_bankroll,
+        rounds=len(outcomes),
+        number_of_sessions=number_of_sessions,
+        bankroll_goal=player.bankroll_goal if player.stop_on_goal else None,
+        seed=0
+    )
+
+
+def _print_comparison(number_of_runs: int, number_of_shoes: int, penetration: float, shoe_size: int) -> None:
+    """Play every configuration in COMPARISON_PLAYERS on identical shoes and print paired differences."""
+    results = compare_players(
+        make_blackjack=make_blackjack,
+        player_factories=COMPARISON_PLAYERS,
+        number_of_runs=number_of_runs,
+        number_of_shoes=number_of_shoes,
+        penetration=penetration,
+        shoe_size=shoe_size
+    )
+    baseline = results[0]
+    print(f"Paired comparison against {baseline.name} (common shoes)")
+    for result in results[1:]:
+        print(
+            f"{result.name}: winnings difference {_fmt_money(result.winnings_difference)} "
+            f"[{_fmt_money(result.winnings_difference_lower)}, {_fmt_money(result.winnings_difference_upper)}], "
+            f"risk of ruin difference {result.risk_of_ruin_difference:.2%} "
+            f"[{result.risk_of_ruin_difference_lower:.2%}, {result.risk_of_ruin_difference_upper:.2%}]"
+        )
+
+
+def _chunk_arguments(
+    number_of_runs: int,
+    runs_per_chunk: int,
+    number_of_shoes: int,
+    penetration: float,
+    shoe_size: int,
+    shoe_sampling: ShoeSampling,
+    shoe_rng: ShoeRNG = ShoeRNG.MT19937,
+    export: bool = False
+) -> list[tuple]:
+    """
+    Split the runs into chunks of consecutive seeds, returning the _run_chunk
+    arguments of every chunk. The chunks depend only on the params, so every
+    mode merges identical chunk summaries.
+    """
+    return [
+        (
+            first_seed, min(runs_per_chunk, number_of_runs - first_seed), number_of_shoes, penetration, shoe_size,
+            shoe_sampling, shoe_rng, export
+        )
+        for first_seed in range(0, number_of_runs, runs_per_chunk)
+    ]
+
+
+def _local_results(chunk_arguments: list[tuple], max_workers: int) -> Iterator[tuple]:
+    """Run every chunk on this machine and yield the summaries in chunk order."""
+    columns = list(zip(*chunk_arguments))
+    try:
+        executor_cls = concurrent.futures.ProcessPoolExecutor
+        executor_kwargs = {"max_workers": max_workers, "mp_context": mp.get_context("fork")}
+        with executor_cls(**executor_kwargs) as executor:
+            yield from executor.map(_run_chunk, *columns)
+    except PermissionError:
+        # Some environments forbid process pools; fall back to threads.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            yield from executor.map(_run_chunk, *columns)
+
+
+def _distributed_results(
+    chunk_arguments: list[tuple],
+    address: tuple[str, int],
+    authkey: bytes | None,
+    local_workers: int
+) -> Iterator[tuple]:
+    """
+    Serve the chunks to workers started with --worker on any machine and
+    yield the summaries in chunk order, optionally with local workers too.
+    Without an authkey a random one is generated and printed for the workers.
+    Workers whose simulation_template.py differs are rejected.
+    """
+    fingerprint = _template_fingerprint()
+    with Coordinator(chunks=chunk_arguments, address=address, authkey=authkey, fingerprint=fingerprint) as coordinator:
+        print(f"Coordinating {len(chunk_arguments)} chunks on {coordinator.address[0]}:{coordinator.address[1]}")
+        if authkey is None:
+            print(f"Start workers with BLACKJACK_AUTHKEY={coordinator.authkey.decode()}")
+        processes = [
+            mp.get_context("fork").Process(
+                target=run_worker,
+                kwargs={
+                    "address": coordinator.address,
+                    "function": _run_chunk,
+                    "authkey": coordinator.authkey,
+                    "fingerprint": fingerprint
+                }
+            )
+            for _ in range(local_workers)
+        ]
+        for process in processes:
+            process.start()
+        yield from coordinator.results()
+        for process in processes:
+            process.join()
+
+
+def _parse_address(address: str) -> tuple[str, int]:
+    host, _, port = address.rpartition(":")
+    return host, int(port)
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Simulate the player in simulation_template.py over many runs.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--coordinate", metavar="HOST:PORT", help="serve chunks of runs to workers on other machines")
+    mode.add_argument("--worker", metavar="HOST:PORT", help="run chunks served by a coordinator")
+    parser.add_argument("--local-workers", type=int, default=0, help="workers the coordinator starts on its own machine")
+    parser.add_argument(
+        "--export",
+        metavar="DIR",
+        help="write per-run outcomes, per-count stats and rounds to columnar files in DIR"
+    )
+    parser.add_argument(
+        "--export-format",
+        choices=FORMATS,
+        help="format of the exported files (default: parquet when pyarrow is installed, npz otherwise)"
+    )
+    parser.add_argument(
+        "--authkey",
+        default=os.environ.get("BLACKJACK_AUTHKEY"),
+        help=(
+            "secret key shared by the coordinator and its workers (default: $BLACKJACK_AUTHKEY). "
+            "Required by --worker. A coordinator without one generates and prints a key"
+        )
+    )
+    args = parser.parse_args(argv)
+    if args.worker and not args.authkey:
+        parser.error("--worker requires --authkey or $BLACKJACK_AUTHKEY")
+    return args
 
 
-def main():
+def main(argv: list[str] | None = None):
     """
     Run simulate multiple times and report counts of bankrupt/goal/ran-out,
     average winnings, and total hands played across runs.
     """
+    args = _parse_args(argv)
+    authkey = args.authkey.encode() if args.authkey else None
+    if args.worker:
+        try:
+            chunks_run = run_worker(
+                address=_parse_address(args.worker),
+                function=_run_chunk,
+                authkey=authkey,
+                fingerprint=_template_fingerprint()
+            )
+        except ValueError as exc:
+            raise SystemExit(f"{exc} Use the coordinator's simulation_template.py.") from None
+        print(f"Ran {chunks_run} chunks")
+        return 0
+
     params = SIMULATION_PARAMS
     number_of_runs = params["number_of_runs"]
     number_of_shoes = params["number_of_shoes"]
     penetration = params["penetration"]
     shoe_size = params["shoe_size"]
+    shoe_sampling = ShoeSampling(params.get("shoe_sampling", ShoeSampling.RANDOM.value))
+    shoe_rng = ShoeRNG(params.get("shoe_rng", ShoeRNG.MT19937.value))
 
-    bankrupt_count = 0
-    goal_count = 0
-    ran_out_count = 0
+    outcome_counts: Counter = Counter()
     total_winnings_accum = 0
     total_hands_accum = 0
-    winnings_samples: list[float] = []
+    winnings_distribution = WinningsDistribution()
+    variance_reduction_factor_total = 0.0
 
     max_workers = min(number_of_runs, os.cpu_count() or 2)
+    # workers summarize chunks of runs, so the parent never holds every run's winnings
+    runs_per_chunk = params.get("runs_per_chunk") or max(1, min(1000, number_of_runs // 64))
+    if args.export and make_log_policy is not None:
+        # a chunk's rounds are held until it is written, so exported rounds are played a run per chunk
+        runs_per_chunk = 1
+    chunk_arguments = _chunk_arguments(
+        number_of_runs=number_of_runs,
+        runs_per_chunk=runs_per_chunk,
+        number_of_shoes=number_of_shoes,
+        penetration=penetration,
+        shoe_size=shoe_size,
+        shoe_sampling=shoe_sampling,
+        shoe_rng=shoe_rng,
+        export=args.export is not None
+    )
+    if args.coordinate:
+        results = _distributed_results(
+            chunk_arguments=chunk_arguments,
+            address=_parse_address(args.coordinate),
+            authkey=authkey,
+            local_workers=args.local_workers
+        )
+    else:
+        results = _local_results(chunk_arguments=chunk_arguments, max_workers=max_workers)
 
-    try:
-        executor_cls = concurrent.futures.ProcessPoolExecutor
-        executor_kwargs = {"max_workers": max_workers, "mp_context": mp.get_context("fork")}
-        with executor_cls(**executor_kwargs) as executor:
-            futures = [
-                executor.submit(_run_once, seed=run_idx, number_of_shoes=number_of_shoes, penetration=penetration, shoe_size=shoe_size)
-                for run_idx in range(number_of_runs)
-            ]
-            for future in concurrent.futures.as_completed(futures):
-                outcome, winnings, hands_played = future.result()
-                if outcome == 'bankrupt':
-                    bankrupt_count += 1
-                elif outcome == 'goal':
-                    goal_count += 1
-                else:
-                    ran_out_count += 1
-                total_winnings_accum += winnings
-                total_hands_accum += hands_played
-                winnings_samples.append(winnings)
-    except PermissionError:
-        # Some environments forbid process pools; fall back to threads.
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = [
-                executor.submit(_run_once, seed=run_idx, number_of_shoes=number_of_shoes, penetration=penetration, shoe_size=shoe_size)
-                for run_idx in range(number_of_runs)
-            ]
-            for future in concurrent.futures.as_completed(futures):
-                outcome, winnings, hands_played = future.result()
-                if outcome == 'bankrupt':
-                    bankrupt_count += 1
-                elif outcome == 'goal':
-                    goal_count += 1
-                else:
-                    ran_out_count += 1
-                total_winnings_accum += winnings
-                total_hands_accum += hands_played
-                winnings_samples.append(winnings)
+    # summaries are merged in chunk order, so the totals and percentiles are identical in every mode,
+    # and exported tables are written a chunk at a time as the chunks arrive
+    with ResultsWriter(path=args.export, format=args.export_format) if args.export else nullcontext() as writer:
+        for chunk_outcomes, chunk_winnings, chunk_hands, chunk_distribution, chunk_variance_reduction, *chunk_tables in results:
+            outcome_counts.update(chunk_outcomes)
+            total_winnings_accum += chunk_winnings
+            total_hands_accum += chunk_hands
+            winnings_distribution.merge(chunk_distribution)
+            variance_reduction_factor_total += chunk_variance_reduction
+            for tables in chunk_tables:
+                for table, columns in tables.items():
+                    writer.write(table=table, columns=columns)
 
+    bankrupt_count = outcome_counts[RunOutcome.BANKRUPT.value]
+    goal_count = outcome_counts[RunOutcome.GOAL.value]
+    ran_out_count = outcome_counts[RunOutcome.RAN_OUT.value]
     avg_total_winnings = total_winnings_accum / number_of_runs
     risk_of_ruin = bankrupt_count / number_of_runs
-    if winnings_samples:
-        p05, p20, p80 = np.percentile(winnings_samples, [5, 20, 80])
+    if winnings_distribution.count:
+        p05, p20, p80 = winnings_distribution.percentiles([5, 20, 80])
     else:
         p05 = 0.0
         p20 = p80 = 0.0
@@ -129,6 +352,33 @@ def main():
     print(f"80th percentile winnings: {_fmt_money(p80)}")
     print(f"Total hands played across runs: {total_hands_accum}")
     print(f"Risk of ruin: {risk_of_ruin:.2%}")
+    if shoe_sampling != ShoeSampling.RANDOM:
+        print(f"Shoe sampling: {shoe_sampling.value}")
+        print(f"Average variance reduction factor: {variance_reduction_factor_total / number_of_runs:.3f}")
+    if args.export:
+        print(f"Exported runs, count stats{' and rounds' if make_log_policy else ''} to {args.export}")
+
+    if COMPARISON_PLAYERS:
+        _print_comparison(
+            number_of_runs=number_of_runs,
+            number_of_shoes=number_of_shoes,
+            penetration=penetration,
+            shoe_size=shoe_size
+        )
+
+    importance_sampling_sessions = params.get("importance_sampling_sessions")
+    if importance_sampling_sessions:
+        result = _importance_sampling_estimate(
+            number_of_sessions=importance_sampling_sessions,
+            number_of_shoes=number_of_shoes,
+            penetration=penetration,
+            shoe_size=shoe_size,
+            seed=params.get("importance_sampling_seed", IMPORTANCE_SAMPLING_SEED)
+        )
+        print(
+            f"Risk of ruin (importance sampling): {result.risk_of_ruin:.4%} "
+            f"[{result.lower:.4%}, {result.upper:.4%}]"
+        )
 
     return 0
 
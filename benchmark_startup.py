@@ -0,0 +1,82 @@
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+# every measurement runs in a fresh interpreter, like a spawned worker or a CLI invocation
+CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+import {module}
+imported = time.perf_counter()
+{setup}
+ready = time.perf_counter()
+print(json.dumps({{
+    'import_ms': (imported - start) * 1000,
+    'setup_ms': (ready - imported) * 1000,
+    'max_rss_mb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    'numpy': 'numpy' in sys.modules
+}}))
+"""
+
+SCENARIOS = {
+    'interpreter': ('sys', ''),
+    'cli': ('blackjack.cli', ''),
+    'config': ('blackjack.config', ''),
+    'tables': (
+        'blackjack.playing_strategy',
+        'from blackjack.shoe import Shoe\n'
+        'blackjack.playing_strategy.PlayingStrategy(s17=True).hard(total=16, dealer_up_card="10")\n'
+        'Shoe(shoe_size=6).remaining_decks'
+    ),
+    'table': (
+        'blackjack.blackjack',
+        'blackjack.blackjack.Blackjack(min_bet=10, max_bet=500)'
+    ),
+    'worker': (
+        'blackjack.config',
+        'blackjack.config.run_chunk({"rules": {"min_bet": 10, "max_bet": 500}, '
+        '"player": {"name": "P", "bankroll": 1000, "min_bet": 10}, '
+        '"simulation": {"number_of_shoes": 1, "shoe_size": 6}}, 0, 1)'
+    )
+}
+
+
+def measure(module: str, setup: str, repeat: int) -> dict:
+    """Runs a scenario in repeat fresh interpreters and returns the median of every measurement."""
+    samples = [
+        json.loads(subprocess.run(
+            [sys.executable, '-c', CHILD.format(module=module, setup=setup)],
+            capture_output=True, text=True, check=True
+        ).stdout)
+        for _ in range(repeat)
+    ]
+    return {
+        'import_ms': statistics.median(sample['import_ms'] for sample in samples),
+        'setup_ms': statistics.median(sample['setup_ms'] for sample in samples),
+        'max_rss_mb': statistics.median(sample['max_rss_mb'] for sample in samples),
+        'numpy': samples[0]['numpy']
+    }
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description='Measure import time and memory of a fresh process.')
+    parser.add_argument('--repeat', type=int, default=10, help='fresh interpreters per scenario (default: 10)')
+    parser.add_argument('scenarios', nargs='*', help=f'scenarios to run (default: all of {", ".join(SCENARIOS)})')
+    args = parser.parse_args(argv)
+    unknown = set(args.scenarios) - set(SCENARIOS)
+    if unknown:
+        parser.error(f'unknown scenarios: {", ".join(sorted(unknown))}')
+
+    print(f"{'scenario':<12} {'import ms':>10} {'setup ms':>10} {'max RSS MB':>11} {'numpy':>6}")
+    for name in args.scenarios or SCENARIOS:
+        result = measure(*SCENARIOS[name], repeat=args.repeat)
+        print(
+            f"{name:<12} {result['import_ms']:>10.1f} {result['setup_ms']:>10.1f} "
+            f"{result['max_rss_mb']:>11.1f} {str(result['numpy']):>6}"
+        )
+
+
+if __name__ == '__main__':
+    main()
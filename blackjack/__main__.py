@@ -0,0 +1,4 @@
+import sys
+from blackjack.cli import main
+
+sys.exit(main())
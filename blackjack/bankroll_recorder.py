@@ -0,0 +1,148 @@
+from pathlib import Path
+import numpy as np
+from blackjack.enums import BankrollDownsampling
+from blackjack.player import Player
+
+
+class BankrollRecorder:
+    """
+    Records a player's bankroll over a simulation in a compact typed array,
+    i.e. for plotting drawdown fan charts without an NDJSON log file.
+
+    The trajectory holds the bankroll after every round, after every shoe,
+    or the lowest and highest bankroll of every block of rounds, depending
+    on the downsampling.
+
+    """
+    def __init__(
+        self,
+        player: Player,
+        downsampling: BankrollDownsampling = BankrollDownsampling.ROUND,
+        block_size: int = 100,
+        cents: bool = False,
+        initial_capacity: int = 1024
+    ):
+        """
+        Parameters
+        ----------
+        player
+            Player whose bankroll is recorded
+        downsampling
+            ROUND to record the bankroll after every round, SHOE after every
+            shoe, or BLOCK to record the minimum and maximum bankroll of every
+            block_size rounds
+        block_size
+            Number of rounds summarized by every row when downsampling by BLOCK
+        cents
+            True to store whole cents as int64, which is exact. False to store
+            dollars as float32, which uses half the memory
+
+        """
+        if block_size < 1:
+            raise ValueError('Block size must be at least 1 round.')
+
+        self._downsampling = downsampling
+        self._block_size = block_size
+        self._cents = cents
+        self._dtype = np.dtype(np.int64 if cents else np.float32)
+        self._initial_bankroll = player.bankroll
+        self._columns = 2 if downsampling == BankrollDownsampling.BLOCK else 1
+        self._values = np.empty((initial_capacity, self._columns), dtype=self._dtype)
+        self._size = 0
+        self._pending: float | int | None = None
+        self._block_min = self._block_max = 0
+        self._block_rounds = 0
+
+        if downsampling == BankrollDownsampling.SHOE:
+            player.add_round_listener(self._record_pending)
+            player.add_shoe_listener(self._record_shoe)
+        else:
+            player.add_round_listener(
+                self._record_block if downsampling == BankrollDownsampling.BLOCK else self._record_round
+            )
+
+    @property
+    def downsampling(self) -> BankrollDownsampling:
+        return self._downsampling
+
+    @property
+    def initial_bankroll(self) -> float | int:
+        return self._initial_bankroll
+
+    def _convert(self, bankroll: float | int) -> float | int:
+        return round(bankroll * 100) if self._cents else bankroll
+
+    def _append(self, *values: float | int) -> None:
+        if self._size == len(self._values):
+            # doubling keeps appends amortized O(1)
+            self._values = np.resize(self._values, (2 * len(self._values), self._columns))
+        self._values[self._size] = values
+        self._size += 1
+
+    def _record_round(self, bankroll: float | int) -> None:
+        self._append(self._convert(bankroll))
+
+    def _record_pending(self, bankroll: float | int) -> None:
+        self._pending = bankroll
+
+    def _record_shoe(self, bankroll: float | int) -> None:
+        if self._pending is not None:
+            self._append(self._convert(bankroll))
+            self._pending = None
+
+    def _record_block(self, bankroll: float | int) -> None:
+        if self._block_rounds:
+            self._block_min = min(self._block_min, bankroll)
+            self._block_max = max(self._block_max, bankroll)
+        else:
+            self._block_min = self._block_max = bankroll
+        self._block_rounds += 1
+        if self._block_rounds == self._block_size:
+            self._append(self._convert(self._block_min), self._convert(self._block_max))
+            self._block_rounds = 0
+
+    @property
+    def trajectory(self) -> np.ndarray:
+        """
+        Recorded bankrolls, in cents if recording cents. Rows of (minimum,
+        maximum) when downsampling by BLOCK. A partially played shoe or block
+        at the end of the simulation is included.
+
+        """
+        values = self._values[:self._size]
+        if self._downsampling == BankrollDownsampling.SHOE and self._pending is not None:
+            values = np.vstack([values, [[self._convert(self._pending)]]]).astype(self._dtype)
+        elif self._downsampling == BankrollDownsampling.BLOCK and self._block_rounds:
+            values = np.vstack([
+                values, [[self._convert(self._block_min), self._convert(self._block_max)]]
+            ]).astype(self._dtype)
+        return values if self._columns == 2 else values[:, 0]
+
+    @property
+    def drawdown(self) -> np.ndarray:
+        """Distance of every recorded bankroll, or block minimum, below the highest bankroll so far."""
+        trajectory = self.trajectory
+        highs = trajectory[:, 1] if self._columns == 2 else trajectory
+        lows = trajectory[:, 0] if self._columns == 2 else trajectory
+        initial = self._convert(self._initial_bankroll)
+        # highest bankroll before every row, since a block's maximum may come after its minimum
+        peaks = np.maximum.accumulate(np.concatenate([[initial], highs]))[:-1]
+        if self._columns == 1:
+            peaks = np.maximum(peaks, trajectory)
+        return np.maximum(peaks - lows, 0)
+
+    def save(self, path: str | Path) -> Path:
+        """Saves the trajectory to a .npy file, which np.load can memory-map."""
+        path = Path(path).with_suffix('.npy')
+        np.save(path, self.trajectory)
+        return path
+
+    def to_memmap(self, path: str | Path) -> np.memmap:
+        """Writes the trajectory to a memory-mapped .npy file and returns the mapping."""
+        trajectory = self.trajectory
+        memmap = np.lib.format.open_memmap(
+            Path(path).with_suffix('.npy'), mode='w+', dtype=trajectory.dtype, shape=trajectory.shape
+        )
+        memmap[:] = trajectory
+        memmap.flush()
+        return memmap
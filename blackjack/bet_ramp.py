@@ -0,0 +1,287 @@
+from bisect import bisect_right
+from functools import partial
+from math import floor
+from statistics import fmean
+from typing import Callable, NamedTuple
+from blackjack.blackjack import Blackjack
+from blackjack.card_counter import CardCounter
+from blackjack.comparison import play_configurations
+from blackjack.counting_system import CountingSystem
+from blackjack.enums import CardCountingSystem
+from blackjack.risk_of_ruin import RiskOfRuin
+from blackjack.rules import Rules
+
+
+class BetRampCandidate(NamedTuple):
+    kelly_fraction: float
+    bet_ramp: dict[float | int, float | int]
+    predicted_risk_of_ruin: float
+    average_winnings: float
+    risk_of_ruin: float
+
+
+def unit_count_statistics(
+    count_statistics: dict[float | int | None, tuple[float, float, float]],
+    unit_bet: float | int
+) -> dict[float | int, tuple[float, float, float]]:
+    """
+    Converts per-count statistics measured with a flat bet into
+    statistics per unit bet, dropping rounds without a count.
+
+    """
+    return {
+        count: (rounds, mean / unit_bet, variance / unit_bet ** 2)
+        for count, (rounds, mean, variance) in count_statistics.items()
+        if count is not None
+    }
+
+
+def measure_count_statistics(
+    make_blackjack: Callable[[], Blackjack],
+    card_counting_system: CardCountingSystem | CountingSystem | str,
+    number_of_shoes: int,
+    penetration: float,
+    shoe_size: int,
+    insurance: float | int | None = None,
+    seed: int | None = None
+) -> dict[float | int, tuple[float, float, float]]:
+    """
+    Measures the frequency, EV and variance per unit bet at every count by
+    simulating a card counter that flat bets the table minimum.
+
+    """
+    blackjack = make_blackjack()
+    min_bet = blackjack.rules.min_bet
+    card_counter = CardCounter(
+        name='Flat Bettor',
+        bankroll=blackjack.rules.max_bet * 100,
+        min_bet=min_bet,
+        card_counting_system=card_counting_system,
+        bet_ramp={0: min_bet},
+        insurance=insurance
+    )
+    blackjack.add_player(player=card_counter)
+    blackjack.simulate(
+        penetration=penetration,
+        number_of_shoes=number_of_shoes,
+        shoe_size=shoe_size,
+        seed=seed,
+        reset_bankroll=True,
+        progress_bar=False
+    )
+    return unit_count_statistics(count_statistics=card_counter.stats.count_statistics(), unit_bet=min_bet)
+
+
+def _bet(bet_ramp: dict[float | int, float | int], counts: list[float | int], count: float | int, min_bet: float | int) -> float | int:
+    # bets at a missing count are inferred from the previous count, like CardCounter
+    position = bisect_right(counts, count)
+    return bet_ramp[counts[position - 1]] if position else min_bet
+
+
+def bet_ramp_risk_of_ruin(
+    bet_ramp: dict[float | int, float | int],
+    count_statistics: dict[float | int, tuple[float, float, float]],
+    min_bet: float | int
+) -> RiskOfRuin:
+    """Builds the analytic risk of ruin calculator for a bet ramp from per-count statistics per unit bet."""
+    counts = sorted(bet_ramp)
+    weighted = {}
+    for count, (frequency, mean, variance) in count_statistics.items():
+        bet = _bet(bet_ramp=bet_ramp, counts=counts, count=count, min_bet=min_bet)
+        weighted[count] = (frequency, bet * mean, bet * bet * variance)
+    return RiskOfRuin.from_counts(count_statistics=weighted)
+
+
+def optimal_bet_ramp(
+    count_statistics: dict[float | int, tuple[float, float, float]],
+    rules: Rules,
+    bankroll: float | int,
+    kelly_fraction: float = 1.0,
+    max_spread: float | int | None = None,
+    max_risk_of_ruin: float | None = None,
+    chip: float | int | None = None,
+    min_rounds: float | int = 0,
+    linear_fit: bool = True
+) -> dict[float | int, float | int]:
+    """
+    Computes the Kelly optimal bet at every count.
+
+    The Kelly bet at a count is the bankroll times the EV divided by the
+    variance per unit bet. Counts with a negative EV are bet at the table
+    minimum, and bets never decrease as the count rises.
+
+    Parameters
+    ----------
+    count_statistics
+        Maps each count to a tuple of (frequency or rounds played, EV per
+        unit bet, variance per unit bet), i.e. from measure_count_statistics
+    rules
+        Rules at the table, which set the minimum and maximum bets
+    bankroll
+        Bankroll the ramp is sized for
+    kelly_fraction
+        Fraction of the Kelly bet wagered (1.0 is full Kelly)
+    max_spread
+        Maximum ratio of the largest bet to the table minimum
+    max_risk_of_ruin
+        Maximum risk of ruin over an unlimited number of rounds. The Kelly
+        fraction is reduced until the ramp satisfies it
+    chip
+        Chip unit bets are rounded down to
+    min_rounds
+        Counts observed in fewer rounds are left out of the ramp and bet
+        like the previous count
+    linear_fit
+        True to replace the EV at every count by a straight line fitted to
+        the EVs weighted by frequency, which removes most of the noise of
+        simulated statistics. False uses every EV as given
+
+    """
+    counts = sorted(
+        count for count, (rounds, _, variance) in count_statistics.items()
+        if rounds >= min_rounds and variance > 0
+    )
+    if not counts:
+        raise ValueError('At least one count with a positive variance is required to optimize a bet ramp.')
+    if not 0 < kelly_fraction <= 1:
+        raise ValueError('Kelly fraction must be greater than 0 and at most 1.')
+
+    evs = {count: count_statistics[count][1] for count in counts}
+    if linear_fit and len(counts) > 1:
+        weights = [count_statistics[count][0] for count in counts]
+        total_weight = sum(weights)
+        mean_count = sum(w * count for w, count in zip(weights, counts)) / total_weight
+        mean_ev = sum(w * evs[count] for w, count in zip(weights, counts)) / total_weight
+        slope = sum(w * (count - mean_count) * (evs[count] - mean_ev) for w, count in zip(weights, counts)) / sum(
+            w * (count - mean_count) ** 2 for w, count in zip(weights, counts)
+        )
+        evs = {count: mean_ev + slope * (count - mean_count) for count in counts}
+
+    min_bet = rules.min_bet
+    max_bet = rules.max_bet if max_spread is None else min(rules.max_bet, min_bet * max_spread)
+
+    def ramp(fraction: float) -> dict[float | int, float | int]:
+        bet_ramp = {}
+        previous = min_bet
+        for count in counts:
+            bet = min(max(fraction * bankroll * evs[count] / count_statistics[count][2], previous), max_bet)
+            previous = bet
+            if chip:
+                bet = max(floor(bet / chip) * chip, min_bet)
+            bet_ramp[count] = round(bet, 2)
+        return bet_ramp
+
+    if max_risk_of_ruin is None:
+        return ramp(fraction=kelly_fraction)
+
+    def risk_of_ruin(bet_ramp: dict[float | int, float | int]) -> float:
+        return bet_ramp_risk_of_ruin(
+            bet_ramp=bet_ramp,
+            count_statistics=count_statistics,
+            min_bet=min_bet
+        ).risk_of_ruin(bankroll=bankroll)
+
+    # the risk of ruin is not monotonic in the Kelly fraction (tiny fractions lose
+    # on average), so the largest fraction on a grid that satisfies it is used
+    for step in range(100, 0, -1):
+        bet_ramp = ramp(fraction=kelly_fraction * step / 100)
+        if risk_of_ruin(bet_ramp=bet_ramp) <= max_risk_of_ruin:
+            return bet_ramp
+    raise ValueError('No bet ramp satisfies the maximum risk of ruin.')
+
+
+def _make_card_counter(
+    name: str,
+    bet_ramp: dict[float | int, float | int],
+    bankroll: float | int,
+    min_bet: float | int,
+    card_counting_system: CardCountingSystem | CountingSystem | str,
+    insurance: float | int | None
+) -> CardCounter:
+    return CardCounter(
+        name=name,
+        bankroll=bankroll,
+        min_bet=min_bet,
+        card_counting_system=card_counting_system,
+        bet_ramp=dict(bet_ramp),
+        insurance=insurance
+    )
+
+
+def search_bet_ramps(
+    make_blackjack: Callable[[], Blackjack],
+    count_statistics: dict[float | int, tuple[float, float, float]],
+    card_counting_system: CardCountingSystem | CountingSystem | str,
+    bankroll: float | int,
+    number_of_runs: int,
+    number_of_shoes: int,
+    penetration: float,
+    shoe_size: int,
+    kelly_fractions: tuple[float, ...] = (0.25, 0.5, 0.75, 1.0),
+    max_spread: float | int | None = None,
+    max_risk_of_ruin: float | None = None,
+    chip: float | int | None = None,
+    min_rounds: float | int = 0,
+    linear_fit: bool = True,
+    insurance: float | int | None = None,
+    max_workers: int | None = None
+) -> list[BetRampCandidate]:
+    """
+    Builds the optimal bet ramp for every Kelly fraction and validates the
+    candidates by simulating them in parallel against common shoes (see
+    play_configurations). Bankroll, spread, chip and fitting arguments are passed to
+    optimal_bet_ramp. A single Kelly fraction simply validates its ramp.
+
+    """
+    if not kelly_fractions:
+        raise ValueError('At least one Kelly fraction is required.')
+    rules = make_blackjack().rules
+    bet_ramps = [
+        optimal_bet_ramp(
+            count_statistics=count_statistics,
+            rules=rules,
+            bankroll=bankroll,
+            kelly_fraction=kelly_fraction,
+            max_spread=max_spread,
+            max_risk_of_ruin=max_risk_of_ruin,
+            chip=chip,
+            min_rounds=min_rounds,
+            linear_fit=linear_fit
+        )
+        for kelly_fraction in kelly_fractions
+    ]
+    player_factories = [
+        partial(
+            _make_card_counter,
+            name=f'Kelly {kelly_fraction:g}',
+            bet_ramp=bet_ramp,
+            bankroll=bankroll,
+            min_bet=rules.min_bet,
+            card_counting_system=card_counting_system,
+            insurance=insurance
+        )
+        for kelly_fraction, bet_ramp in zip(kelly_fractions, bet_ramps)
+    ]
+    runs = play_configurations(
+        make_blackjack=make_blackjack,
+        player_factories=player_factories,
+        number_of_runs=number_of_runs,
+        number_of_shoes=number_of_shoes,
+        penetration=penetration,
+        shoe_size=shoe_size,
+        max_workers=max_workers
+    )
+    return [
+        BetRampCandidate(
+            kelly_fraction=kelly_fraction,
+            bet_ramp=bet_ramp,
+            predicted_risk_of_ruin=bet_ramp_risk_of_ruin(
+                bet_ramp=bet_ramp,
+                count_statistics=count_statistics,
+                min_bet=rules.min_bet
+            ).risk_of_ruin(bankroll=bankroll),
+            average_winnings=fmean(result.winnings for result in results),
+            risk_of_ruin=fmean(float(result.is_ruined) for result in results)
+        )
+        for kelly_fraction, bet_ramp, results in zip(kelly_fractions, bet_ramps, zip(*runs))
+    ]
@@ -2,19 +2,35 @@ from pathlib import Path
 import random
 import sys
 import time
-from typing import Generator
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Generator
+from blackjack.card_counter import CardCounter
+from blackjack.csm_shoe import CSMShoe
 from blackjack.dealer import Dealer
+from blackjack.enums import CardCountingSystem, ShoeSampling, StatsCategory
 from blackjack.gameplay import play_round
 from blackjack.player import Player
 from blackjack.playing_strategy import PlayingStrategy
 from blackjack.rules import Rules
 from blackjack.shoe import Shoe
+from blackjack.shoe_sampler import ShoeSampler
 from blackjack.table import Table
 
+if TYPE_CHECKING:
+    from blackjack.log_policy import LogPolicy
+    from blackjack.results_export import ResultsWriter, RoundLog
+    from blackjack.shoe_library import ShoeSource
 
-def _shoe_progress_bar(shoe_range: range, size: int = 60) -> Generator[int, None, None]:
+
+# most redraws of a progress bar, so that a bar over many cheap iterations (like the
+# rounds of simulate_csm) is not printed and flushed on every one of them
+PROGRESS_BAR_UPDATES = 1000
+
+
+def _shoe_progress_bar(shoe_range: range, size: int = 60, unit: str = 'Shoes') -> Generator[int, None, None]:
     total_shoes = len(shoe_range)
     start = time.time()
+    every = -(-total_shoes // PROGRESS_BAR_UPDATES)
 
     def _show(shoe_number: int) -> None:
         x = int(size * shoe_number / total_shoes)
@@ -23,10 +39,12 @@ def _shoe_progress_bar(shoe_range: range, size: int = 60) -> Generator[int, None
         minutes = int(minutes)
         seconds = int(seconds)
         time_str = f'{minutes if minutes > 10 else minutes:02}:{seconds if seconds > 10 else seconds:02}'
-        print(f"Shoes Simulated: [{'█' * x}{('.' * (size - x))}] {shoe_number}/{total_shoes} Estimated wait: {time_str}", end='\r', file=sys.stdout, flush=True)
+        print(f"{unit} Simulated: [{'█' * x}{('.' * (size - x))}] {shoe_number}/{total_shoes} Estimated wait: {time_str}", end='\r', file=sys.stdout, flush=True)
 
     for shoe_number in shoe_range:
-        _show(shoe_number=shoe_number + 1)
+        shown = shoe_number + 1
+        if shown % every == 0 or shown == total_shoes:
+            _show(shoe_number=shown)
         yield shoe_number
 
     print(flush=True, file=sys.stdout)
@@ -96,31 +114,101 @@ class Blackjack:
         self._table = Table(rules=self._rules)
         self._playing_strategy = PlayingStrategy(s17=s17)
         self._dealer = Dealer()
+        self._players: list[Player] = []
+        self._variance_reduction_factor: float | None = None
+
+    @property
+    def rules(self) -> Rules:
+        return self._rules
 
     def add_player(self, player: Player) -> None:
         """Add a player to the table."""
-        return self._table.add_player(player=player)
+        self._table.add_player(player=player)
+        self._players.append(player)
 
-    def _play_shoe(self, penetration: float, shoe_size: int, reset_bankroll: bool, _logfile: Path) -> None:
-        if penetration > 0.9:
-            raise ValueError('Penetration must be less than or equal to 0.9.')
+    @property
+    def variance_reduction_factor(self) -> float | None:
+        """
+        Estimated variance reduction of the per-shoe net winnings achieved by
+        the shoe sampling mode of the last simulation (1.0 for random sampling).
+
+        """
+        return self._variance_reduction_factor
+
+    def export_results(self, writer: 'ResultsWriter', run: int = 0) -> None:
+        """
+        Appends a row per player to the runs table of a ResultsWriter, and the
+        per-count results of every player to its count_stats table.
+
+        """
+        from blackjack.results_export import run_columns
+
+        writer.write(table='runs', columns=run_columns(
+            runs=[run] * len(self._players),
+            players=[player.name for player in self._players],
+            outcomes=[player.run_outcome.value for player in self._players],
+            winnings=[
+                player.stats.total(StatsCategory.NET_WINNINGS, StatsCategory.INSURANCE_NET_WINNINGS)
+                for player in self._players
+            ],
+            hands_played=[player.stats.hands_played for player in self._players],
+            variance_reduction_factors=[self._variance_reduction_factor] * len(self._players)
+        ))
+        for player in self._players:
+            writer.write_stats(stats=player.stats, run=run, player=player.name)
+
+    def _net_winnings(self) -> float:
+        return sum(sum(player.stats.round_winnings.values()) for player in self._players)
+
+    def _stratification_system(self) -> CardCountingSystem:
+        for player in self._players:
+            if isinstance(player, CardCounter):
+                return player.card_counting_system
+        return CardCountingSystem.HI_LO
+
+    def _play_round(
+        self,
+        shoe: Shoe,
+        reset_bankroll: bool,
+        _logfile: Path,
+        _trace: Callable[[dict[str, Any]], None] | None = None,
+        _log_policy: 'LogPolicy | None' = None,
+        _round_log: 'RoundLog | None' = None
+    ) -> None:
+        play_round(
+            table=self._table,
+            dealer=self._dealer,
+            rules=self._rules,
+            shoe=shoe,
+            playing_strategy=self._playing_strategy,
+            _logfile=_logfile,
+            _trace=_trace,
+            _log_policy=_log_policy,
+            _round_log=_round_log
+        )
 
-        shoe = Shoe(shoe_size=shoe_size, penetration=penetration)
-        shoe.shuffle()
+        if reset_bankroll:
+            for player in self._table.players_and_observers:
+                player.reset_bankroll()
 
+    def _end_shoe(self) -> None:
+        for player in self._table.players_and_observers:
+            player.end_shoe()
+
+    def _play_shoe(
+        self,
+        shoe: Shoe,
+        reset_bankroll: bool,
+        _logfile: Path,
+        _log_policy: 'LogPolicy | None',
+        _round_log: 'RoundLog | None' = None
+    ) -> None:
         while not shoe.cut_card_reached and self._table.players:
-            play_round(
-                table=self._table,
-                dealer=self._dealer,
-                rules=self._rules,
-                shoe=shoe,
-                playing_strategy=self._playing_strategy,
-                _logfile=_logfile
+            self._play_round(
+                shoe=shoe, reset_bankroll=reset_bankroll, _logfile=_logfile, _log_policy=_log_policy, _round_log=_round_log
             )
 
-            if reset_bankroll:
-                for player in self._table.players + self._table.observers:
-                    player.reset_bankroll()
+        self._end_shoe()
 
     def simulate(
         self,
@@ -129,15 +217,190 @@ class Blackjack:
         shoe_size: int, seed: int | None = None,
         reset_bankroll: bool = False,
         progress_bar: bool = True,
-        _logfile: Path = None
+        shoe_sampling: ShoeSampling = ShoeSampling.RANDOM,
+        shoe_library: 'ShoeSource | None' = None,
+        first_shoe: int = 0,
+        _logfile: Path = None,
+        _log_policy: 'LogPolicy | None' = None,
+        _round_log: 'RoundLog | None' = None
     ) -> None:
-        """Simulates a series of blackjack games across multiple shoes."""
-        if seed:
+        """
+        Simulates a series of blackjack games across multiple shoes.
+
+        Antithetic and stratified shoe sampling keep every estimate unbiased
+        while reducing its variance. The achieved reduction is available from
+        the variance_reduction_factor property afterwards.
+
+        With a shoe_library (a ShoeLibrary or PhiloxShoes, see
+        blackjack.shoe_library), the shoes are dealt from it starting at
+        first_shoe instead of being shuffled.
+
+        With a _logfile, every round is logged unless a LogPolicy
+        (see blackjack.log_policy) keeps only some of them. The same rounds
+        are appended to a _round_log column buffer (see
+        blackjack.results_export.RoundLog) for a ResultsWriter.
+
+        """
+        if penetration > 0.9:
+            raise ValueError('Penetration must be less than or equal to 0.9.')
+
+        if shoe_library is not None:
+            if shoe_sampling != ShoeSampling.RANDOM:
+                raise ValueError('Shoe sampling must be RANDOM when dealing from a shoe library.')
+            if shoe_library.shoe_size != shoe_size:
+                raise ValueError(f'The shoe library has shoes of {shoe_library.shoe_size} decks, not {shoe_size}.')
+
+        if seed is not None:
             random.seed(seed)
 
-        if progress_bar:
-            for _ in _shoe_progress_bar(shoe_range=range(number_of_shoes)):
-                self._play_shoe(penetration=penetration, shoe_size=shoe_size, reset_bankroll=reset_bankroll, _logfile=_logfile)
+        shoe_sampler = ShoeSampler(
+            shoe_size=shoe_size,
+            penetration=penetration,
+            sampling=shoe_sampling,
+            card_counting_system=self._stratification_system()
+        )
+        shoes = (
+            shoe_sampler.shoes(number_of_shoes=number_of_shoes) if shoe_library is None
+            else shoe_library.shoes(number_of_shoes=number_of_shoes, penetration=penetration, first_shoe=first_shoe)
+        )
+        shoe_numbers = _shoe_progress_bar(shoe_range=range(number_of_shoes)) if progress_bar else range(number_of_shoes)
+        track_outcomes = shoe_sampling != ShoeSampling.RANDOM
+        outcomes: list[float] = []
+        labels: list[int] = []
+
+        for _, (shoe, label) in zip(shoe_numbers, shoes):
+            if track_outcomes:
+                net_winnings = self._net_winnings()
+            self._play_shoe(
+                shoe=shoe, reset_bankroll=reset_bankroll, _logfile=_logfile, _log_policy=_log_policy, _round_log=_round_log
+            )
+            if track_outcomes:
+                outcomes.append(self._net_winnings() - net_winnings)
+                labels.append(label)
+
+        self._variance_reduction_factor = shoe_sampler.variance_reduction_factor(outcomes=outcomes, labels=labels)
+
+    def simulate_csm(
+        self,
+        number_of_rounds: int,
+        shoe_size: int,
+        seed: int | None = None,
+        reset_bankroll: bool = False,
+        progress_bar: bool = True,
+        _logfile: Path = None,
+        _log_policy: 'LogPolicy | None' = None,
+        _round_log: 'RoundLog | None' = None
+    ) -> None:
+        """
+        Simulates a series of blackjack rounds dealt from a continuous
+        shuffling machine, which takes the cards of every round back
+        and never reaches a cut card. Shoe listeners are notified once,
+        after the last round.
+
+        """
+        if seed is not None:
+            random.seed(seed)
+
+        shoe = CSMShoe(shoe_size=shoe_size)
+        round_numbers = (
+            _shoe_progress_bar(shoe_range=range(number_of_rounds), unit='Rounds')
+            if progress_bar else range(number_of_rounds)
+        )
+        for _ in round_numbers:
+            if not self._table.players:
+                break
+            self._play_round(
+                shoe=shoe, reset_bankroll=reset_bankroll, _logfile=_logfile, _log_policy=_log_policy, _round_log=_round_log
+            )
+
+        self._end_shoe()
+        self._variance_reduction_factor = None
+
+    def replay(
+        self,
+        shoe_number: int,
+        penetration: float,
+        shoe_size: int,
+        seed: int | None = None,
+        number_of_shoes: int | None = None,
+        shoe_sampling: ShoeSampling = ShoeSampling.RANDOM,
+        first_round: int = 0,
+        last_round: int | None = None,
+        cards: list[str] | None = None,
+        shoe_id: str | None = None,
+        _trace: Callable[[dict[str, Any]], None] | None = None
+    ) -> Shoe:
+        """
+        Re-plays one shoe of a seeded simulation without playing the shoes
+        before it, and returns the shoe.
+
+        Only the cards of a shoe depend on the random state, so the shuffles
+        of the earlier shoes are repeated and nothing else, which reproduces
+        the shoe dealt by simulate with the same seed and sampling. The
+        players start the shoe in their current state, so their bankrolls
+        should be set to those at the start of the shoe (e.g. from a round
+        log) for bankroll-dependent bets to match.
+
+        Parameters
+        ----------
+        shoe_number
+            Shoe to replay, counting from 0
+        penetration
+            The percentage of the shoe that is dealt before it is re-shuffled
+        shoe_size
+            Number of decks in the shoe
+        seed
+            Seed of the simulation
+        number_of_shoes
+            Number of shoes in the simulation, required for stratified
+            sampling, where every shoe depends on the allocation of all of them
+        shoe_sampling
+            Shoe sampling mode of the simulation
+        first_round
+            First round of the shoe (counting from 0) that is traced. Earlier
+            rounds are played untraced, since they decide which cards are left.
+        last_round
+            Last round of the shoe that is played, by default the last one
+        cards
+            Stored shoe to replay instead, every card in the order Shoe.load takes them
+        shoe_id
+            Id of the stored shoe, e.g. ShoeSource.shoe_id, so the replay logs
+            the id the simulation did
+        _trace
+            Called for every event of the traced rounds with a dict that
+            includes the shoe and round numbers, see play_round
+
+        """
+        if penetration > 0.9:
+            raise ValueError('Penetration must be less than or equal to 0.9.')
+
+        if cards is not None:
+            shoe = Shoe(shoe_size=shoe_size, penetration=penetration, shoe_id=shoe_id)
+            shoe.load(cards=list(cards))
         else:
-            for _ in range(number_of_shoes):
-                self._play_shoe(penetration=penetration, shoe_size=shoe_size, reset_bankroll=reset_bankroll, _logfile=_logfile)
+            if shoe_sampling == ShoeSampling.STRATIFIED and number_of_shoes is None:
+                raise ValueError('The number of shoes is required to replay stratified sampling.')
+            if number_of_shoes is not None and not 0 <= shoe_number < number_of_shoes:
+                raise ValueError(f'Shoe number must be between 0 and {number_of_shoes - 1}.')
+            if seed is not None:
+                random.seed(seed)
+            shoe_sampler = ShoeSampler(
+                shoe_size=shoe_size,
+                penetration=penetration,
+                sampling=shoe_sampling,
+                card_counting_system=self._stratification_system()
+            )
+            shoes = shoe_sampler.shoes(number_of_shoes=shoe_number + 1 if number_of_shoes is None else number_of_shoes)
+            shoe, _ = next(islice(shoes, shoe_number, None))
+
+        round_number = 0
+        while not shoe.cut_card_reached and self._table.players:
+            if last_round is not None and round_number > last_round:
+                break
+            trace = None
+            if _trace and round_number >= first_round:
+                def trace(event: dict[str, Any], round_number: int = round_number) -> None:
+                    _trace({'shoe': shoe_number, 'round': round_number, **event})
+            self._play_round(shoe=shoe, reset_bankroll=False, _logfile=None, _trace=trace)
+            round_number += 1
+        return shoe
@@ -1,3 +1,5 @@
+from bisect import bisect_right
+from functools import partial
 from math import ceil, floor
 from typing import Any
 
@@ -9,8 +11,12 @@ except ImportError:  # pragma: no cover - fallback for older Python
     except ImportError:  # last resort: no-op decorator
         def override(func):
             return func
+from blackjack.counting_system import CountingSystem, get_counting_system
 from blackjack.enums import CardCountingSystem
+from blackjack.hand import Hand
+from blackjack.index_plays import IndexPlays
 from blackjack.player import Player
+from blackjack.playing_strategy import PlayingStrategy
 
 
 class CardCounter(Player):
@@ -21,16 +27,18 @@ class CardCounter(Player):
     """
     def __init__(
         self,
-        card_counting_system: CardCountingSystem,
+        card_counting_system: CardCountingSystem | CountingSystem | str,
         bet_ramp: dict[float | int, float | int],
         insurance: float | int | None = None,
+        index_plays: IndexPlays | None = None,
         **kwargs: Any
     ):
         """
         Parameters
         ----------
         card_counting_system
-            Card counting system used by the player
+            Card counting system used by the player: a CardCountingSystem,
+            a CountingSystem or the name of a registered CountingSystem
         bet_ramp
             Dictionary where each key value is the running/true
             count and each value indicates the amount of money
@@ -39,11 +47,20 @@ class CardCounter(Player):
             from the previous running/true count
         insurance
             Minimum running or true count at which a player will
-            purchase insurance, if desired, and if available
+            purchase insurance, if desired, and if available.
+            Defaults to the insurance index of index_plays, if any
+        index_plays
+            Count-based deviations from basic strategy used by the
+            player, if desired. Indices are compared against the
+            count when the decision is made
 
         """
         super().__init__(**kwargs)
 
+        counting_system = get_counting_system(card_counting_system=card_counting_system)
+        if index_plays is not None and get_counting_system(index_plays.card_counting_system) is not counting_system:
+            raise ValueError(f"{self.name}'s index plays must use the {counting_system.name} system.")
+
         self.max_bet_ramp = max(bet_ramp.values())
         self.min_bet_ramp = min(bet_ramp.values())
 
@@ -54,7 +71,7 @@ class CardCounter(Player):
         self.max_count = max(bet_ramp)
 
         counts_to_check: list[float | int] = list(range(ceil(self.min_count), floor(self.max_count) + 1))
-        if card_counting_system == CardCountingSystem.HALVES:
+        if counting_system.is_fractional:
             counts_to_check.extend([count + 0.5 for count in range(floor(self.min_count), floor(self.max_count))])
 
         inferred_wager: float | int = 0
@@ -64,13 +81,20 @@ class CardCounter(Player):
             inferred_wager = bet_ramp[count]
 
         self._bet_ramp = bet_ramp
+        self._bet_ramp_counts = sorted(bet_ramp)
         self._card_counting_system = card_counting_system
-        self._insurance = insurance
+        self._counting_system = counting_system
+        self._insurance = insurance if insurance is not None or index_plays is None else index_plays.insurance
+        self._index_plays = index_plays
 
     @property
-    def card_counting_system(self) -> CardCountingSystem:
+    def card_counting_system(self) -> CardCountingSystem | CountingSystem | str:
         return self._card_counting_system
 
+    @property
+    def counting_system(self) -> CountingSystem:
+        return self._counting_system
+
     @property
     def bet_ramp(self) -> dict[float | int, float | int]:
         return self._bet_ramp
@@ -82,8 +106,44 @@ class CardCounter(Player):
             return self._min_bet
         if count >= self.max_count:
             return self.max_bet_ramp
-        return self._bet_ramp[count]
+        bet = self._bet_ramp.get(count)
+        if bet is None:
+            # counts between the steps of the ramp, i.e. in thirds, bet like the count below them
+            bet = self._bet_ramp[self._bet_ramp_counts[bisect_right(self._bet_ramp_counts, count) - 1]]
+        return bet
 
     @property
     def insurance(self) -> float | int | None:
         return self._insurance
+
+    @property
+    def index_plays(self) -> IndexPlays | None:
+        return self._index_plays
+
+    @override
+    def decision(
+        self,
+        playing_strategy: PlayingStrategy,
+        hand: Hand,
+        dealer_up_card: str,
+        max_hands: int,
+        **kwargs: Any
+    ) -> str:
+        shoe = kwargs.get('shoe')
+        if self._index_plays is None or (shoe is None and kwargs.get('count') is None):
+            return super().decision(
+                playing_strategy=playing_strategy,
+                hand=hand,
+                dealer_up_card=dealer_up_card,
+                max_hands=max_hands
+            )
+        # deviations are defined on the count at the time of the decision, not the count the bet
+        # used, and the shoe is only asked for it when the hand has an index play
+        count = kwargs['count'] if shoe is None else partial(shoe.betting_count, card_counting_system=self._counting_system)
+        return self._index_plays.decision(
+            playing_strategy=playing_strategy,
+            hand=hand,
+            dealer_up_card=dealer_up_card,
+            count=count,
+            split_allowed=self._is_split_allowed(hand=hand, max_hands=max_hands)
+        )
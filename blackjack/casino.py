@@ -0,0 +1,211 @@
+import heapq
+import random
+from blackjack.back_counter import BackCounter
+from blackjack.dealer import Dealer
+from blackjack.gameplay import play_round
+from blackjack.player import Player
+from blackjack.playing_strategy import PlayingStrategy
+from blackjack.rules import Rules
+from blackjack.shoe import Shoe
+from blackjack.table import Table
+
+
+class CasinoTable:
+    """
+    Represents one table on a casino floor with its own rules, dealer and
+    shoe, and the time it takes to deal a round.
+
+    """
+    def __init__(self, rules: Rules, shoe_size: int, penetration: float, seconds_per_hand: float):
+        self._rules = rules
+        self._table = Table(rules=rules)
+        self._dealer = Dealer()
+        self._playing_strategy = PlayingStrategy(s17=rules.s17)
+        self._shoe_size = shoe_size
+        self._penetration = penetration
+        self._seconds_per_hand = seconds_per_hand
+        self._shoe = self._new_shoe()
+        self._rounds_played = 0
+        self._shoes_played = 0
+
+    def _new_shoe(self) -> Shoe:
+        shoe = Shoe(shoe_size=self._shoe_size, penetration=self._penetration)
+        shoe.shuffle()
+        return shoe
+
+    @property
+    def rules(self) -> Rules:
+        return self._rules
+
+    @property
+    def table(self) -> Table:
+        return self._table
+
+    @property
+    def shoe(self) -> Shoe:
+        return self._shoe
+
+    @property
+    def rounds_played(self) -> int:
+        return self._rounds_played
+
+    @property
+    def shoes_played(self) -> int:
+        return self._shoes_played
+
+    @property
+    def round_duration(self) -> float:
+        """Seconds to deal the next round: a hand for every seated player and the dealer."""
+        return self._seconds_per_hand * (len(self._table.players) + 1)
+
+    def play_round(self) -> None:
+        play_round(
+            table=self._table,
+            dealer=self._dealer,
+            rules=self._rules,
+            shoe=self._shoe,
+            playing_strategy=self._playing_strategy
+        )
+        self._rounds_played += 1
+        if self._shoe.cut_card_reached:
+            for player in self._table.players_and_observers:
+                player.end_shoe()
+            self._shoe = self._new_shoe()
+            self._shoes_played += 1
+
+
+class Casino:
+    """
+    Represents a casino floor of several tables played at once, with back
+    counters that watch several tables and play at whichever has the best
+    count.
+
+    Tables deal rounds at their own pace. An event queue ordered by the
+    time every table deals its next round advances one table at a time, and
+    tables without seated players are never advanced, since nobody would
+    play their rounds.
+
+    """
+    def __init__(self):
+        self._tables: list[CasinoTable] = []
+        self._watchers: list[list[BackCounter]] = []
+        self._watched_tables: dict[BackCounter, list[int]] = {}
+        # table every back counter is watching from behind or seated at, None if it is free to hop
+        self._locations: dict[BackCounter, int | None] = {}
+        self._clock = 0.0
+
+    @property
+    def tables(self) -> list[CasinoTable]:
+        return self._tables
+
+    @property
+    def clock(self) -> float:
+        """Seconds simulated so far."""
+        return self._clock
+
+    def location(self, back_counter: BackCounter) -> int | None:
+        """Table a back counter is watching from behind or seated at, or None while it looks for a count."""
+        return self._locations[back_counter]
+
+    def add_table(
+        self,
+        rules: Rules,
+        shoe_size: int,
+        penetration: float = 0.75,
+        seconds_per_hand: float = 12.0
+    ) -> int:
+        """
+        Adds a table to the floor and returns its number.
+
+        Parameters
+        ----------
+        rules
+            Rules of the table
+        shoe_size
+            Number of decks in the table's shoe
+        penetration
+            The percentage of the shoe that is dealt before it is re-shuffled
+        seconds_per_hand
+            Seconds it takes to deal a round per hand at the table, including the dealer's
+
+        """
+        if penetration > 0.9:
+            raise ValueError('Penetration must be less than or equal to 0.9.')
+        self._tables.append(
+            CasinoTable(rules=rules, shoe_size=shoe_size, penetration=penetration, seconds_per_hand=seconds_per_hand)
+        )
+        self._watchers.append([])
+        return len(self._tables) - 1
+
+    def add_player(self, player: Player, table: int) -> None:
+        """Seats a player at a table for the whole simulation."""
+        if isinstance(player, BackCounter):
+            self.add_back_counter(back_counter=player, tables=[table])
+        else:
+            self._tables[table].table.add_player(player=player)
+
+    def add_back_counter(self, back_counter: BackCounter, tables: list[int] | None = None) -> None:
+        """Has a back counter watch several tables (every table by default) and hop between them."""
+        tables = list(range(len(self._tables))) if tables is None else tables
+        if not tables:
+            raise ValueError(f'{back_counter.name} must watch at least one table.')
+        if back_counter in self._watched_tables:
+            raise ValueError(f'{back_counter.name} is already on the casino floor.')
+        for table in tables:
+            # checks the bet ramp against the rules of every table the back counter may play at
+            self._tables[table].table.validate_player(player=back_counter)
+        self._watched_tables[back_counter] = tables
+        self._locations[back_counter] = None
+        for table in tables:
+            self._watchers[table].append(back_counter)
+
+    def _best_table(self, back_counter: BackCounter) -> int | None:
+        best_table, best_count = None, None
+        for table in self._watched_tables[back_counter]:
+            casino_table = self._tables[table]
+            if not casino_table.table.players:
+                continue
+            count = casino_table.shoe.betting_count(card_counting_system=back_counter.card_counting_system)
+            if best_count is None or count > best_count:
+                best_table, best_count = table, count
+        return best_table
+
+    def _arrive(self, table: int) -> None:
+        # free back counters step behind this table if it has the best count they watch,
+        # then play_round seats them when the count is at their entry point
+        casino_table = self._tables[table]
+        for back_counter in self._watchers[table]:
+            if self._locations[back_counter] is None and self._best_table(back_counter=back_counter) == table:
+                count = casino_table.shoe.betting_count(card_counting_system=back_counter.card_counting_system)
+                if back_counter.can_enter(count=count):
+                    casino_table.table.add_player(player=back_counter)
+                    self._locations[back_counter] = table
+
+    def _leave(self, table: int) -> None:
+        # back counters who wonged out are free to hop to another table
+        casino_table = self._tables[table]
+        for back_counter in casino_table.table.observers:
+            casino_table.table.remove_observer(back_counter=back_counter)
+            self._locations[back_counter] = None
+
+    def simulate(self, hours: float, seed: int | None = None) -> None:
+        """Simulates every table on the floor for a number of hours."""
+        if seed is not None:
+            random.seed(seed)
+
+        end = self._clock + hours * 3600
+        # ties go to the lower table number, so a seeded simulation is reproducible
+        events = [(self._clock, table) for table, casino_table in enumerate(self._tables) if casino_table.table.players]
+        heapq.heapify(events)
+        while events:
+            clock, table = heapq.heappop(events)
+            if clock >= end:
+                break
+            self._clock = clock
+            casino_table = self._tables[table]
+            self._arrive(table=table)
+            casino_table.play_round()
+            self._leave(table=table)
+            if casino_table.table.players:
+                heapq.heappush(events, (clock + casino_table.round_duration, table))
+        self._clock = end
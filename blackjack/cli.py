@@ -0,0 +1,215 @@
+import argparse
+import json
+import os
+import sys
+from collections import Counter
+from typing import Any, Iterator
+
+# only the standard library is imported at startup, so --help and validating a
+# configuration never pay for NumPy or the simulation classes
+
+
+def _fmt_money(amount: float) -> str:
+    return f'${amount:,.2f}' if amount >= 0 else f'-${abs(amount):,.2f}'
+
+
+def _load(path: str) -> dict[str, Any]:
+    from blackjack.config import check_config, load_config
+
+    config = load_config(path=path)
+    check_config(config=config)
+    return config
+
+
+def _chunk_results(config: dict[str, Any], workers: int) -> Iterator[tuple]:
+    from blackjack.config import chunk_runs, run_chunk
+
+    chunks = chunk_runs(config=config)
+    if workers == 1 or len(chunks) == 1:
+        # small runs skip starting a pool
+        for first_seed, number_of_runs in chunks:
+            yield run_chunk(config, first_seed, number_of_runs)
+        return
+
+    import concurrent.futures
+    import multiprocessing as mp
+
+    columns = [[config] * len(chunks), *zip(*chunks)]
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=workers, mp_context=mp.get_context('fork')) as executor:
+            yield from executor.map(run_chunk, *columns)
+    except PermissionError:
+        # Some environments forbid process pools; fall back to threads.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(run_chunk, *columns)
+
+
+def run(config: dict[str, Any], workers: int) -> dict[str, Any]:
+    """Plays every run of a configuration and returns the results, like the job service."""
+    from blackjack.config import simulation_params
+    from blackjack.enums import RunOutcome
+    from blackjack.winnings_distribution import WinningsDistribution
+
+    number_of_runs = simulation_params(config=config)['number_of_runs']
+    outcome_counts: Counter = Counter()
+    total_winnings = 0
+    total_hands = 0
+    winnings_distribution = WinningsDistribution()
+    for chunk_outcome_counts, chunk_winnings, chunk_hands, chunk_distribution, _ in _chunk_results(config, workers):
+        outcome_counts.update(chunk_outcome_counts)
+        total_winnings += chunk_winnings
+        total_hands += chunk_hands
+        winnings_distribution.merge(chunk_distribution)
+
+    p05, p20, p50, p80, p95 = winnings_distribution.percentiles([5, 20, 50, 80, 95]).tolist()
+    return {
+        'number_of_runs': number_of_runs,
+        'bankrupt_count': outcome_counts[RunOutcome.BANKRUPT.value],
+        'goal_count': outcome_counts[RunOutcome.GOAL.value],
+        'ran_out_count': outcome_counts[RunOutcome.RAN_OUT.value],
+        'average_winnings': total_winnings / number_of_runs,
+        'winnings_percentiles': {'5': p05, '20': p20, '50': p50, '80': p80, '95': p95},
+        'total_hands_played': total_hands,
+        'risk_of_ruin': outcome_counts[RunOutcome.BANKRUPT.value] / number_of_runs
+    }
+
+
+def _print_results(results: dict[str, Any]) -> None:
+    percentiles = results['winnings_percentiles']
+    print('Simulation results')
+    print(f'Runs: {results["number_of_runs"]}')
+    print(f'Bankrupt count: {results["bankrupt_count"]}')
+    print(f'Bankroll goal count: {results["goal_count"]}')
+    print(f'Ran out of shoes: {results["ran_out_count"]}')
+    print(f'Average total winnings: {_fmt_money(results["average_winnings"])}')
+    print(f'5th percentile winnings: {_fmt_money(percentiles["5"])}')
+    print(f'20th percentile winnings: {_fmt_money(percentiles["20"])}')
+    print(f'80th percentile winnings: {_fmt_money(percentiles["80"])}')
+    print(f'Total hands played across runs: {results["total_hands_played"]}')
+    print(f'Risk of ruin: {results["risk_of_ruin"]:.2%}')
+
+
+def _parse_rounds(rounds: str | None) -> tuple[int, int | None]:
+    if rounds is None:
+        return 0, None
+    first, _, last = rounds.partition(':')
+    try:
+        return int(first or 0), int(last) if last else None
+    except ValueError:
+        raise ValueError(f'Rounds must be FIRST:LAST, not {rounds}.') from None
+
+
+def _replay(args: argparse.Namespace, config: dict[str, Any]) -> None:
+    from blackjack.config import replay_shoe
+
+    first_round, last_round = _parse_rounds(args.rounds)
+    cards = None
+    if args.cards:
+        with open(args.cards) as f:
+            cards = json.load(f)
+    elif args.library:
+        from blackjack.shoe_library import ShoeLibrary
+
+        cards = ShoeLibrary(path=args.library).cards(shoe_number=args.shoe)
+    trace = replay_shoe(
+        config=config,
+        run=args.run,
+        shoe_number=args.shoe,
+        first_round=first_round,
+        last_round=last_round,
+        bankroll=args.bankroll,
+        cards=cards
+    )
+    for event in trace:
+        print(json.dumps(event))
+
+
+def _parse_args(argv: list[str] | None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog='blackjack', description='Run blackjack simulations described by TOML or JSON configuration files.'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    validate_parser = commands.add_parser('validate', help='Check a configuration without running it.')
+    validate_parser.add_argument('config', help='Path to a .toml or .json configuration.')
+
+    run_parser = commands.add_parser('run', help='Run the simulation described by a configuration.')
+    run_parser.add_argument('config', help='Path to a .toml or .json configuration.')
+    run_parser.add_argument(
+        '--workers', type=int, default=os.cpu_count() or 1, help='Worker processes. Defaults to the CPU count.'
+    )
+    run_parser.add_argument('--json', action='store_true', help='Print the results as JSON.')
+
+    replay_parser = commands.add_parser(
+        'replay', help='Re-play one shoe of a run and print a trace of every decision as JSON lines.'
+    )
+    replay_parser.add_argument('config', help='Path to a .toml or .json configuration.')
+    replay_parser.add_argument('--run', type=int, default=0, help='Run to replay, which is also its seed. Defaults to 0.')
+    replay_parser.add_argument('--shoe', type=int, required=True, help='Shoe of the run to replay, counting from 0.')
+    replay_parser.add_argument(
+        '--rounds', metavar='FIRST:LAST', help='Rounds of the shoe to trace, counting from 0. Defaults to every round.'
+    )
+    replay_parser.add_argument('--bankroll', type=float, help="The player's bankroll at the start of the shoe.")
+    stored_shoe = replay_parser.add_mutually_exclusive_group()
+    stored_shoe.add_argument(
+        '--cards', metavar='FILE', help='JSON list of the cards of a stored shoe to replay instead of the seeded one.'
+    )
+    stored_shoe.add_argument(
+        '--library', metavar='FILE', help='Shoe library to replay shoe --shoe of instead of the seeded one.'
+    )
+
+    library_parser = commands.add_parser(
+        'library', help='Shuffle a library of shoes into a memory-mapped .npy file for reproducible benchmarks.'
+    )
+    library_parser.add_argument('path', help='Path of the .npy file to create.')
+    library_parser.add_argument('--shoes', type=int, required=True, help='Number of shoes in the library.')
+    library_parser.add_argument('--shoe-size', type=int, default=6, help='Decks per shoe. Defaults to 6.')
+    library_parser.add_argument('--seed', type=int, help='Seed of the shuffles.')
+
+    serve_parser = commands.add_parser('serve', help='Start the simulation job service.')
+    serve_parser.add_argument('arguments', nargs=argparse.REMAINDER, help='Arguments of blackjack.job_service.')
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parse_args(argv)
+    if args.command == 'serve':
+        from blackjack.job_service import main as serve
+
+        return serve(args.arguments)
+    if args.command == 'library':
+        from blackjack.shoe_library import create_shoe_library
+
+        try:
+            library = create_shoe_library(
+                path=args.path, number_of_shoes=args.shoes, shoe_size=args.shoe_size, seed=args.seed
+            )
+        except (OSError, ValueError) as e:
+            print(f'{args.path}: {e}', file=sys.stderr)
+            return 1
+        print(f'Wrote {len(library)} shoes of {library.shoe_size} decks to {library.path}.')
+        return 0
+
+    try:
+        config = _load(args.config)
+    except (OSError, ValueError) as e:
+        print(f'{args.config}: {e}', file=sys.stderr)
+        return 1
+
+    if args.command == 'validate':
+        print(f'{args.config} is valid.')
+    elif args.command == 'replay':
+        try:
+            _replay(args=args, config=config)
+        except (OSError, ValueError) as e:
+            print(f'{args.config}: {e}', file=sys.stderr)
+            return 1
+    elif args.json:
+        print(json.dumps(run(config=config, workers=args.workers), indent=2))
+    else:
+        _print_results(run(config=config, workers=args.workers))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
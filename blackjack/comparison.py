@@ -0,0 +1,198 @@
+import concurrent.futures
+import multiprocessing as mp
+import os
+from math import sqrt
+from statistics import NormalDist, fmean, stdev
+from typing import Callable, NamedTuple
+from blackjack.blackjack import Blackjack
+from blackjack.player import Player
+
+
+class RunResult(NamedTuple):
+    name: str
+    winnings: float | int
+    rounds_played: int
+    is_ruined: bool
+
+
+class ComparisonResult(NamedTuple):
+    name: str
+    runs: int
+    average_winnings: float
+    risk_of_ruin: float
+    winnings_difference: float
+    winnings_difference_lower: float
+    winnings_difference_upper: float
+    risk_of_ruin_difference: float
+    risk_of_ruin_difference_lower: float
+    risk_of_ruin_difference_upper: float
+    unpaired_standard_error: float
+    paired_standard_error: float
+
+
+def _run_configurations(
+    make_blackjack: Callable[[], Blackjack],
+    player_factories: list[Callable[[], Player]],
+    seed: int,
+    number_of_shoes: int,
+    penetration: float,
+    shoe_size: int
+) -> list[RunResult]:
+    """
+    Play every player configuration against the shoes produced by the same seed.
+    Shoes are shuffled independently of the decisions made at the table, so each
+    configuration sees the identical sequence of shuffled shoes.
+
+    """
+    results = []
+    for make_player in player_factories:
+        blackjack = make_blackjack()
+        player = make_player()
+        initial_bankroll = player.bankroll
+        blackjack.add_player(player=player)
+        blackjack.simulate(
+            penetration=penetration,
+            number_of_shoes=number_of_shoes,
+            shoe_size=shoe_size,
+            seed=seed,
+            reset_bankroll=False,
+            progress_bar=False
+        )
+        results.append(RunResult(
+            name=player.name,
+            winnings=player.bankroll - initial_bankroll,
+            rounds_played=player.variance.count,
+            is_ruined=player.is_ruined
+        ))
+    return results
+
+
+def _paired_interval(differences: list[float], z: float) -> tuple[float, float, float, float]:
+    mean = fmean(differences)
+    standard_error = stdev(differences) / sqrt(len(differences)) if len(differences) > 1 else 0.0
+    return mean, mean - z * standard_error, mean + z * standard_error, standard_error
+
+
+def play_configurations(
+    make_blackjack: Callable[[], Blackjack],
+    player_factories: list[Callable[[], Player]],
+    number_of_runs: int,
+    number_of_shoes: int,
+    penetration: float,
+    shoe_size: int,
+    max_workers: int | None = None
+) -> list[list[RunResult]]:
+    """
+    Plays every player configuration against the shoes of every run in parallel
+    and returns the results of each run, in the order of player_factories.
+    Factories must be picklable when a process pool is available.
+
+    """
+    max_workers = max_workers or min(number_of_runs, os.cpu_count() or 2)
+    kwargs = {
+        'make_blackjack': make_blackjack,
+        'player_factories': player_factories,
+        'number_of_shoes': number_of_shoes,
+        'penetration': penetration,
+        'shoe_size': shoe_size
+    }
+
+    runs: list[list[RunResult]] = [[] for _ in range(number_of_runs)]
+    try:
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers, mp_context=mp.get_context('fork')) as executor:
+            futures = {executor.submit(_run_configurations, seed=run_idx, **kwargs): run_idx for run_idx in range(number_of_runs)}
+            for future in concurrent.futures.as_completed(futures):
+                runs[futures[future]] = future.result()
+    except PermissionError:
+        # Some environments forbid process pools; fall back to threads.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(_run_configurations, seed=run_idx, **kwargs): run_idx for run_idx in range(number_of_runs)}
+            for future in concurrent.futures.as_completed(futures):
+                runs[futures[future]] = future.result()
+    return runs
+
+
+def compare_players(
+    make_blackjack: Callable[[], Blackjack],
+    player_factories: list[Callable[[], Player]],
+    number_of_runs: int,
+    number_of_shoes: int,
+    penetration: float,
+    shoe_size: int,
+    confidence: float = 0.95,
+    max_workers: int | None = None
+) -> list[ComparisonResult]:
+    """
+    Compares two or more player configurations using common random numbers.
+
+    Every run is played once per configuration with the same seed, so all
+    configurations face the identical sequence of shuffled shoes. Differences
+    are reported against the first configuration and their confidence intervals
+    are computed from the paired per-run differences.
+
+    Parameters
+    ----------
+    make_blackjack
+        Factory for the table configuration
+    player_factories
+        Factories for the player configurations. The first one is the baseline.
+        Factories must be picklable (i.e. module level functions) when a
+        process pool is available
+    number_of_runs
+        Number of seeds each configuration is played against
+    number_of_shoes
+        Number of shoes per run
+    penetration
+        The percentage of the shoe that is dealt before the shoe is re-shuffled
+    shoe_size
+        Number of decks used during a blackjack game
+    confidence
+        Confidence level of the reported intervals
+    max_workers
+        Maximum number of worker processes
+
+    """
+    if len(player_factories) < 2:
+        raise ValueError('At least two player configurations are required for a comparison.')
+
+    runs = play_configurations(
+        make_blackjack=make_blackjack,
+        player_factories=player_factories,
+        number_of_runs=number_of_runs,
+        number_of_shoes=number_of_shoes,
+        penetration=penetration,
+        shoe_size=shoe_size,
+        max_workers=max_workers
+    )
+
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    baseline = [run[0] for run in runs]
+    results = []
+    for index in range(len(player_factories)):
+        configuration = [run[index] for run in runs]
+        winnings = [result.winnings for result in configuration]
+        ruined = [float(result.is_ruined) for result in configuration]
+        winnings_difference = [result.winnings - base.winnings for result, base in zip(configuration, baseline)]
+        ruin_difference = [r - float(base.is_ruined) for r, base in zip(ruined, baseline)]
+        mean_difference, lower, upper, paired_standard_error = _paired_interval(winnings_difference, z)
+        ruin_mean, ruin_lower, ruin_upper, _ = _paired_interval(ruin_difference, z)
+        baseline_winnings = [base.winnings for base in baseline]
+        unpaired_standard_error = (
+            sqrt((stdev(winnings) ** 2 + stdev(baseline_winnings) ** 2) / number_of_runs)
+            if number_of_runs > 1 else 0.0
+        )
+        results.append(ComparisonResult(
+            name=configuration[0].name,
+            runs=number_of_runs,
+            average_winnings=fmean(winnings),
+            risk_of_ruin=fmean(ruined),
+            winnings_difference=mean_difference,
+            winnings_difference_lower=lower,
+            winnings_difference_upper=upper,
+            risk_of_ruin_difference=ruin_mean,
+            risk_of_ruin_difference_lower=ruin_lower,
+            risk_of_ruin_difference_upper=ruin_upper,
+            unpaired_standard_error=unpaired_standard_error,
+            paired_standard_error=paired_standard_error
+        ))
+    return results
@@ -0,0 +1,152 @@
+from typing import Any
+
+try:
+    from typing import override  # Python >=3.11
+except ImportError:  # pragma: no cover - fallback for older Python
+    try:
+        from typing_extensions import override  # type: ignore
+    except ImportError:  # last resort: no-op decorator
+        def override(func):
+            return func
+from blackjack.composition_ev import CARD_INDEX, EV_CACHE, CompositionEV, LRUCache, composition_bucket
+from blackjack.hand import Hand
+from blackjack.player import Player
+from blackjack.playing_strategy import PlayingStrategy
+from blackjack.rules import Rules
+from blackjack.shoe import Shoe
+
+
+class CompositionDependentPlayer(Player):
+    """
+    Represents an individual player at a table that bets a flat
+    amount and makes every decision by computing its expected value
+    from the composition of the cards remaining in the shoe.
+
+    """
+    def __init__(
+        self,
+        rules: Rules,
+        resolution: int = 104,
+        full_removal: bool = False,
+        cache: LRUCache | None = None,
+        **kwargs: Any
+    ):
+        """
+        Parameters
+        ----------
+        rules
+            Rules at the table the player is seated at
+        resolution
+            Number of cards the composition of the shoe, before the
+            player's hand and the dealer's up card were dealt, is scaled
+            to before computing expected values. Lower resolutions are
+            less exact but share more cached expected values
+        full_removal
+            True to also remove the cards the player draws from the
+            cards the dealer draws from, which is exact but much slower
+        cache
+            Cache of expected values. Defaults to the cache shared by
+            every composition dependent player in the process
+
+        """
+        super().__init__(**kwargs)
+
+        if resolution < 13:
+            raise ValueError('Resolution must be at least 13 cards.')
+
+        self._rules = rules
+        self._rules_key = (rules.s17, rules.double_down, rules.double_after_split, rules.late_surrender)
+        self._resolution = resolution
+        self._full_removal = full_removal
+        self._cache = cache if cache is not None else EV_CACHE
+
+    @property
+    def resolution(self) -> int:
+        return self._resolution
+
+    @property
+    def cache(self) -> LRUCache:
+        return self._cache
+
+    @staticmethod
+    def remaining_composition(shoe: Shoe) -> tuple[int, ...]:
+        """Number of unseen cards for each card value, from Ace to ten-valued cards."""
+        composition = [4 * shoe.shoe_size] * 9 + [16 * shoe.shoe_size]
+        for card, count in shoe.seen_cards.items():
+            composition[CARD_INDEX[card]] -= count
+        return tuple(composition)
+
+    def expected_values(self, hand: Hand, dealer_up_card: str, max_hands: int, shoe: Shoe) -> dict[str, float]:
+        """
+        Returns the expected value, per unit bet, of every decision available
+        to a hand, i.e. 'S', 'H', 'D', 'P' and 'R'.
+
+        """
+        is_split = hand.is_split or hand.was_split
+        two_cards = hand.number_of_cards == 2
+        can_double = (
+            two_cards
+            and (self._rules.double_after_split if is_split else self._rules.double_down)
+            and self.has_sufficient_bankroll(amount=hand.total_bet)
+        )
+        can_split = self._is_split_allowed(hand=hand, max_hands=max_hands)
+        can_surrender = two_cards and not is_split and self._rules.late_surrender
+
+        # the bucket is taken before the hand and the dealer's up card are removed,
+        # so their removal is always exact
+        dealt = sorted(CARD_INDEX[card] for card in hand.cards + [dealer_up_card])
+        composition = list(self.remaining_composition(shoe=shoe))
+        for index in dealt:
+            composition[index] += 1
+        bucket = list(composition_bucket(composition=tuple(composition), resolution=self._resolution))
+        for index in dealt:
+            bucket[index] = max(bucket[index] - 1, 0)
+        hand_state = (
+            tuple(sorted(CARD_INDEX[card] for card in hand.cards)),
+            can_double,
+            can_split,
+            can_surrender
+        )
+        key = (tuple(bucket), hand_state, CARD_INDEX[dealer_up_card], self._rules_key, self._full_removal)
+
+        evs = self._cache.get(key)
+        if evs is None:
+            evs = CompositionEV(
+                composition=key[0],
+                dealer_up_card=dealer_up_card,
+                rules=self._rules,
+                full_removal=self._full_removal
+            ).evaluate(
+                cards=hand.cards,
+                can_double=can_double,
+                can_split=can_split,
+                can_surrender=can_surrender
+            )
+            self._cache.put(key, evs)
+        return evs
+
+    @override
+    def decision(
+        self,
+        playing_strategy: PlayingStrategy,
+        hand: Hand,
+        dealer_up_card: str,
+        max_hands: int,
+        **kwargs: Any
+    ) -> str:
+        shoe = kwargs.get('shoe')
+        if shoe is None or hand.number_of_cards < 2:
+            return super().decision(
+                playing_strategy=playing_strategy,
+                hand=hand,
+                dealer_up_card=dealer_up_card,
+                max_hands=max_hands
+            )
+
+        evs = self.expected_values(hand=hand, dealer_up_card=dealer_up_card, max_hands=max_hands, shoe=shoe)
+        best = max(evs, key=evs.__getitem__)
+        if best in {'S', 'H', 'P'}:
+            return best
+        # fall back to the better of hitting and standing if doubling or surrendering is refused
+        fallback = 'h' if evs.get('H', -1.0) > evs['S'] else 's'
+        return ('D' if best == 'D' else 'R') + fallback
@@ -0,0 +1,271 @@
+from collections import OrderedDict
+from typing import Any, Hashable
+from blackjack.rules import Rules
+
+
+# compositions are tuples of the number of cards remaining for each
+# card value, from Ace (index 0) to ten-valued cards (index 9)
+CARD_INDEX = {
+    'A': 0, '2': 1, '3': 2, '4': 3, '5': 4, '6': 5, '7': 6, '8': 7, '9': 8,
+    '10': 9, 'J': 9, 'Q': 9, 'K': 9, '10-J-Q-K': 9
+}
+
+# dealer outcomes are the probabilities of 17, 18, 19, 20, 21 and busting
+BUST = 5
+
+
+class LRUCache:
+    """
+    Represents a bounded least recently used cache.
+
+    """
+    def __init__(self, maxsize: int = 1_000_000):
+        """
+        Parameters
+        ----------
+        maxsize
+            Maximum number of entries kept in the cache
+
+        """
+        if maxsize < 1:
+            raise ValueError('Cache size must be at least 1.')
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return entry
+
+    def put(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+
+# shared by every composition dependent player in the process, across rounds and runs
+EV_CACHE = LRUCache()
+
+
+def composition_bucket(composition: tuple[int, ...], resolution: int) -> tuple[int, ...]:
+    """
+    Scales a composition to approximately `resolution` cards so that
+    similar compositions share cached expected values.
+
+    """
+    total = sum(composition)
+    if total <= resolution:
+        return composition
+    return tuple(round(cards * resolution / total) for cards in composition)
+
+
+def _remove(composition: tuple[int, ...], index: int) -> tuple[int, ...]:
+    return composition[:index] + (composition[index] - 1,) + composition[index + 1:]
+
+
+def _best_total(total: int, has_ace: bool) -> int:
+    return total + 10 if has_ace and total <= 11 else total
+
+
+class CompositionEV:
+    """
+    Computes the expected value of every player decision against a dealer
+    up card from the composition of the remaining cards, with the dealer
+    having checked for blackjack.
+
+    """
+    def __init__(
+        self,
+        composition: tuple[int, ...],
+        dealer_up_card: str,
+        rules: Rules,
+        full_removal: bool = False
+    ):
+        """
+        Parameters
+        ----------
+        composition
+            Number of cards remaining for each card value, from Ace to
+            ten-valued cards. Includes the dealer's hole card
+        dealer_up_card
+            Dealer's up card
+        rules
+            Rules at the table
+        full_removal
+            True to remove every card the player draws from the cards the
+            dealer draws from. False computes the dealer's probabilities once
+            from the composition, which is much faster and rarely changes
+            a decision
+
+        """
+        self._composition = composition
+        self._up_index = CARD_INDEX[dealer_up_card]
+        self._rules = rules
+        self._full_removal = full_removal
+        self._dealer_memo: dict[tuple, tuple[float, ...]] = {}
+        self._hit_memo: dict[tuple, float] = {}
+
+    def _dealer(self, composition: tuple[int, ...], total: int, has_ace: bool, hole_card: bool) -> tuple[float, ...]:
+        key = (composition, total, has_ace, hole_card)
+        outcomes = self._dealer_memo.get(key)
+        if outcomes is not None:
+            return outcomes
+
+        best = _best_total(total=total, has_ace=has_ace)
+        if best > 21:
+            outcomes = (0.0, 0.0, 0.0, 0.0, 0.0, 1.0)
+        elif best >= 17 and not hole_card and not (best == 17 and has_ace and total == 7 and not self._rules.s17):
+            outcomes = tuple(1.0 if i == best - 17 else 0.0 for i in range(6))
+        else:
+            # the hole card cannot complete a dealer blackjack
+            excluded = -1
+            if hole_card and self._up_index == 0:
+                excluded = 9
+            elif hole_card and self._up_index == 9:
+                excluded = 0
+            remaining = sum(composition) - (composition[excluded] if excluded >= 0 else 0)
+            totals = [0.0] * 6
+            for index, cards in enumerate(composition):
+                if not cards or index == excluded:
+                    continue
+                probability = cards / remaining
+                drawn = self._dealer(
+                    composition=_remove(composition, index),
+                    total=total + index + 1,
+                    has_ace=has_ace or index == 0,
+                    hole_card=False
+                )
+                for i in range(6):
+                    totals[i] += probability * drawn[i]
+            outcomes = tuple(totals)
+
+        self._dealer_memo[key] = outcomes
+        return outcomes
+
+    def stand(self, composition: tuple[int, ...], total: int, has_ace: bool) -> float:
+        best = _best_total(total=total, has_ace=has_ace)
+        if best > 21:
+            return -1.0
+        dealer = self._dealer(
+            composition=composition if self._full_removal else self._composition,
+            total=self._up_index + 1,
+            has_ace=self._up_index == 0,
+            hole_card=True
+        )
+        if best < 17:
+            return 2 * dealer[BUST] - 1
+        win = dealer[BUST] + sum(dealer[:best - 17])
+        lose = sum(dealer[best - 16:BUST])
+        return win - lose
+
+    def hit(self, composition: tuple[int, ...], total: int, has_ace: bool) -> float:
+        """Expected value of hitting once and then playing optimally."""
+        key = (composition, total, has_ace)
+        ev = self._hit_memo.get(key)
+        if ev is not None:
+            return ev
+
+        ev = 0.0
+        remaining = sum(composition)
+        for index, cards in enumerate(composition):
+            if not cards:
+                continue
+            probability = cards / remaining
+            new_total = total + index + 1
+            if new_total > 21:
+                ev -= probability
+                continue
+            new_composition = _remove(composition, index)
+            new_has_ace = has_ace or index == 0
+            stand = self.stand(composition=new_composition, total=new_total, has_ace=new_has_ace)
+            if _best_total(total=new_total, has_ace=new_has_ace) < 21:
+                stand = max(stand, self.hit(composition=new_composition, total=new_total, has_ace=new_has_ace))
+            ev += probability * stand
+
+        self._hit_memo[key] = ev
+        return ev
+
+    def double(self, composition: tuple[int, ...], total: int, has_ace: bool) -> float:
+        ev = 0.0
+        remaining = sum(composition)
+        for index, cards in enumerate(composition):
+            if cards:
+                ev += cards / remaining * self.stand(
+                    composition=_remove(composition, index),
+                    total=total + index + 1,
+                    has_ace=has_ace or index == 0
+                )
+        return 2 * ev
+
+    def split(self, card: str) -> float:
+        """
+        Expected value of splitting a pair, approximated by playing each
+        hand against the same composition without re-splitting.
+
+        """
+        index = CARD_INDEX[card]
+        composition = self._composition
+        remaining = sum(composition)
+        ev = 0.0
+        for drawn, cards in enumerate(composition):
+            if not cards:
+                continue
+            new_composition = _remove(composition, drawn)
+            total = index + drawn + 2
+            has_ace = index == 0 or drawn == 0
+            hand_ev = self.stand(composition=new_composition, total=total, has_ace=has_ace)
+            if index != 0:
+                hand_ev = max(hand_ev, self.hit(composition=new_composition, total=total, has_ace=has_ace))
+                if self._rules.double_after_split:
+                    hand_ev = max(hand_ev, self.double(composition=new_composition, total=total, has_ace=has_ace))
+            ev += cards / remaining * hand_ev
+        return 2 * ev
+
+    def evaluate(
+        self,
+        cards: list[str],
+        can_double: bool,
+        can_split: bool,
+        can_surrender: bool
+    ) -> dict[str, float]:
+        """Returns the expected value, per unit bet, of every decision available to a hand."""
+        total = sum(CARD_INDEX[card] + 1 for card in cards)
+        has_ace = 'A' in cards
+        composition = self._composition
+        evs = {'S': self.stand(composition=composition, total=total, has_ace=has_ace)}
+        if _best_total(total=total, has_ace=has_ace) < 21:
+            evs['H'] = self.hit(composition=composition, total=total, has_ace=has_ace)
+        if can_double:
+            evs['D'] = self.double(composition=composition, total=total, has_ace=has_ace)
+        if can_split:
+            evs['P'] = self.split(card=cards[0])
+        if can_surrender:
+            evs['R'] = -0.5
+        return evs
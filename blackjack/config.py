@@ -0,0 +1,315 @@
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import tomllib  # Python >=3.11
+except ImportError:  # pragma: no cover - fallback for older Python
+    try:
+        import tomli as tomllib  # type: ignore
+    except ImportError:  # TOML configurations are unavailable
+        tomllib = None
+
+# the simulation classes are imported when a table or player is built, so that
+# loading and validating a configuration stays fast
+
+PLAYER_TYPES = ('Player', 'CardCounter', 'BackCounter')
+
+NUMBER = (int, float)
+
+RULES_SCHEMA: dict[str, tuple[type, ...]] = {
+    'min_bet': NUMBER,
+    'max_bet': NUMBER,
+    's17': (bool,),
+    'blackjack_payout': NUMBER,
+    'max_hands': (int,),
+    'double_down': (bool,),
+    'double_after_split': (bool,),
+    'resplit_aces': (bool,),
+    'insurance': (bool,),
+    'late_surrender': (bool,),
+    'dealer_shows_hole_card': (bool,)
+}
+
+PLAYER_SCHEMA: dict[str, tuple[type, ...]] = {
+    'type': (str,),
+    'name': (str,),
+    'bankroll': NUMBER,
+    'min_bet': NUMBER,
+    'stop_multiple': NUMBER,
+    'bankroll_goal': NUMBER,
+    'stop_on_goal': (bool,)
+}
+
+CARD_COUNTER_SCHEMA: dict[str, tuple[type, ...]] = {
+    **PLAYER_SCHEMA,
+    'card_counting_system': (str,),
+    'bet_ramp': (dict,),
+    'insurance': NUMBER
+}
+
+PLAYER_SCHEMAS: dict[str, dict[str, tuple[type, ...]]] = {
+    'Player': PLAYER_SCHEMA,
+    'CardCounter': CARD_COUNTER_SCHEMA,
+    'BackCounter': {**CARD_COUNTER_SCHEMA, 'entry_point': NUMBER, 'exit_point': NUMBER}
+}
+
+REQUIRED_PLAYER_KEYS: dict[str, tuple[str, ...]] = {
+    'Player': ('name', 'bankroll', 'min_bet'),
+    'CardCounter': ('name', 'bankroll', 'min_bet', 'card_counting_system', 'bet_ramp'),
+    'BackCounter': ('name', 'bankroll', 'min_bet', 'card_counting_system', 'bet_ramp', 'entry_point', 'exit_point')
+}
+
+SIMULATION_SCHEMA: dict[str, tuple[type, ...]] = {
+    'number_of_runs': (int,),
+    'number_of_shoes': (int,),
+    'penetration': NUMBER,
+    'shoe_size': (int,),
+    'shoe_sampling': (str,),
+    'shoe_rng': (str,),
+    'runs_per_chunk': (int,)
+}
+
+# simulation parameters and their defaults, like SIMULATION_PARAMS in simulation_template.py
+SIMULATION_DEFAULTS: dict[str, Any] = {
+    'number_of_runs': 20,
+    'number_of_shoes': 2000,
+    'penetration': 0.75,
+    'shoe_size': 6,
+    'shoe_sampling': 'RANDOM',
+    'shoe_rng': 'MT19937',
+    'runs_per_chunk': None
+}
+
+SHOE_SAMPLINGS = ('RANDOM', 'ANTITHETIC', 'STRATIFIED')
+
+# MT19937 shuffles with the random module seeded by the run, PHILOX keys every shoe by its run and shoe numbers
+SHOE_RNGS = ('MT19937', 'PHILOX')
+
+
+def _number(key: str) -> float | int:
+    value = float(key)
+    return int(value) if value.is_integer() else value
+
+
+def load_config(path: str | Path) -> dict[str, Any]:
+    """
+    Reads a simulation configuration from a TOML file (any name with a .toml
+    suffix, e.g. simulation_config.toml.example) or a JSON file.
+
+    """
+    path = Path(path)
+    if '.toml' in path.suffixes:
+        if tomllib is None:
+            raise ValueError('Reading TOML configurations requires Python 3.11 or the tomli package.')
+        with open(path, 'rb') as f:
+            return tomllib.load(f)
+    with open(path) as f:
+        return json.load(f)
+
+
+def _check_section(
+    errors: list[str],
+    section: str,
+    values: Any,
+    schema: dict[str, tuple[type, ...]],
+    required: tuple[str, ...] = ()
+) -> None:
+    if not isinstance(values, dict):
+        errors.append(f'{section} must be a table of settings.')
+        return
+    for key in required:
+        if key not in values:
+            errors.append(f'{section}.{key} is required.')
+    for key, value in values.items():
+        if key not in schema:
+            errors.append(f'{section}.{key} is not a known setting.')
+        elif (isinstance(value, bool) and bool not in schema[key]) or not isinstance(value, schema[key]):
+            expected = 'a number' if schema[key] == NUMBER else f'a {schema[key][0].__name__}'
+            errors.append(f'{section}.{key} must be {expected}.')
+
+
+def validate_config(config: Any) -> None:
+    """
+    Checks the structure of a configuration without building anything and
+    raises a ValueError listing every problem found.
+
+    """
+    errors: list[str] = []
+    if not isinstance(config, dict):
+        raise ValueError('Invalid configuration: a configuration must be a table of settings.')
+    for section in config:
+        if section not in {'rules', 'player', 'simulation'}:
+            errors.append(f'{section} is not a known section.')
+
+    _check_section(errors, 'rules', config.get('rules'), RULES_SCHEMA, required=('min_bet', 'max_bet'))
+
+    player = config.get('player')
+    player_type = player.get('type', 'Player') if isinstance(player, dict) else 'Player'
+    if player_type not in PLAYER_TYPES:
+        errors.append(f'player.type must be one of {", ".join(PLAYER_TYPES)}, not {player_type}.')
+    else:
+        _check_section(
+            errors, 'player', player, PLAYER_SCHEMAS[player_type], required=REQUIRED_PLAYER_KEYS[player_type]
+        )
+        bet_ramp = player.get('bet_ramp') if isinstance(player, dict) else None
+        # a bet ramp that is not a table is already reported by _check_section
+        for count, bet in bet_ramp.items() if isinstance(bet_ramp, dict) else ():
+            try:
+                _number(str(count))
+            except ValueError:
+                errors.append(f'player.bet_ramp count {count} must be a number.')
+            if isinstance(bet, bool) or not isinstance(bet, NUMBER):
+                errors.append(f'player.bet_ramp bet at count {count} must be a number.')
+
+    simulation = config.get('simulation', {})
+    _check_section(errors, 'simulation', simulation, SIMULATION_SCHEMA)
+    if isinstance(simulation, dict):
+        if isinstance(simulation.get('penetration'), NUMBER) and not 0 < simulation['penetration'] <= 0.9:
+            errors.append('simulation.penetration must be greater than 0 and at most 0.9.')
+        if simulation.get('shoe_sampling', 'RANDOM') not in SHOE_SAMPLINGS:
+            errors.append(f'simulation.shoe_sampling must be one of {", ".join(SHOE_SAMPLINGS)}.')
+        if simulation.get('shoe_rng', 'MT19937') not in SHOE_RNGS:
+            errors.append(f'simulation.shoe_rng must be one of {", ".join(SHOE_RNGS)}.')
+        elif simulation.get('shoe_rng') == 'PHILOX' and simulation.get('shoe_sampling', 'RANDOM') != 'RANDOM':
+            errors.append('simulation.shoe_rng PHILOX requires simulation.shoe_sampling RANDOM.')
+        for key in ('number_of_runs', 'number_of_shoes', 'runs_per_chunk'):
+            if isinstance(simulation.get(key), int) and simulation[key] < 1:
+                errors.append(f'simulation.{key} must be at least 1.')
+        if isinstance(simulation.get('shoe_size'), int) and not 1 <= simulation['shoe_size'] <= 8:
+            errors.append('simulation.shoe_size must be between 1 and 8 decks.')
+
+    if errors:
+        raise ValueError('Invalid configuration: ' + ' '.join(errors))
+
+
+def check_config(config: Any) -> None:
+    """
+    Validates a configuration, then builds its table and seats its player, so
+    every problem the table rules would raise is reported before anything runs.
+
+    """
+    validate_config(config=config)
+    try:
+        make_blackjack(config=config).add_player(player=make_player(config=config))
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f'Invalid configuration: {e}') from None
+
+
+def make_blackjack(config: dict[str, Any]):
+    """Builds the table from the "rules" of a configuration, which are the arguments of Blackjack."""
+    from blackjack.blackjack import Blackjack
+
+    return Blackjack(**config['rules'])
+
+
+def make_player(config: dict[str, Any]):
+    """
+    Builds the player from the "player" of a configuration. "type" is one of
+    PLAYER_TYPES (default "Player") and every other key is an argument of
+    that class. Bet ramp counts may be strings, as in JSON and TOML.
+
+    """
+    definition = dict(config['player'])
+    player_type = definition.pop('type', 'Player')
+    if player_type == 'Player':
+        from blackjack.player import Player as player_class
+    elif player_type == 'CardCounter':
+        from blackjack.card_counter import CardCounter as player_class
+    elif player_type == 'BackCounter':
+        from blackjack.back_counter import BackCounter as player_class
+    else:
+        raise ValueError(f'Player type must be one of {", ".join(PLAYER_TYPES)}, not {player_type}.')
+    if 'bet_ramp' in definition:
+        definition['bet_ramp'] = {_number(str(count)): bet for count, bet in definition['bet_ramp'].items()}
+    return player_class(**definition)
+
+
+def simulation_params(config: dict[str, Any]) -> dict[str, Any]:
+    """Returns the "simulation" parameters of a configuration with defaults for any that are missing."""
+    return {**SIMULATION_DEFAULTS, **config.get('simulation', {})}
+
+
+def chunk_runs(config: dict[str, Any]) -> list[tuple[int, int]]:
+    """Splits the runs of a configuration into chunks of (first seed, number of runs)."""
+    params = simulation_params(config=config)
+    number_of_runs = params['number_of_runs']
+    runs_per_chunk = params['runs_per_chunk'] or max(1, min(1000, number_of_runs // 64))
+    return [
+        (first_seed, min(runs_per_chunk, number_of_runs - first_seed))
+        for first_seed in range(0, number_of_runs, runs_per_chunk)
+    ]
+
+
+def run_chunk(config: dict[str, Any], first_seed: int, number_of_runs: int) -> tuple:
+    """
+    Plays consecutive runs of a configuration starting at first_seed and returns
+    their summary (outcome_counts, total_winnings, total_hands, winnings_distribution,
+    variance_reduction_factor_total), see blackjack.runs.play_runs.
+
+    """
+    from functools import partial
+    from blackjack.enums import ShoeRNG, ShoeSampling
+    from blackjack.runs import play_runs
+
+    params = simulation_params(config=config)
+    return play_runs(
+        make_blackjack=partial(make_blackjack, config=config),
+        make_player=partial(make_player, config=config),
+        first_run=first_seed,
+        number_of_runs=number_of_runs,
+        number_of_shoes=params['number_of_shoes'],
+        penetration=params['penetration'],
+        shoe_size=params['shoe_size'],
+        shoe_sampling=ShoeSampling(params['shoe_sampling']),
+        shoe_rng=ShoeRNG(params['shoe_rng'])
+    )
+
+
+def replay_shoe(
+    config: dict[str, Any],
+    run: int,
+    shoe_number: int,
+    first_round: int = 0,
+    last_round: int | None = None,
+    bankroll: float | int | None = None,
+    cards: list[str] | None = None
+) -> list[dict[str, Any]]:
+    """
+    Re-plays one shoe of a run of a configuration (runs are seeded with
+    their number, or key their PHILOX shoes) and returns the trace of its
+    rounds, see Blackjack.replay.
+    bankroll replaces the player's starting bankroll, e.g. with the one
+    logged at the start of the shoe.
+
+    """
+    from blackjack.enums import ShoeRNG, ShoeSampling
+    from blackjack.runs import run_shoes
+
+    params = simulation_params(config=config)
+    blackjack = make_blackjack(config=config)
+    player = make_player(config=config)
+    shoe_library = run_shoes(shoe_rng=ShoeRNG(params['shoe_rng']), shoe_size=params['shoe_size'], run=run)
+    shoe_id = None
+    if cards is None and shoe_library is not None:
+        # the shoe is shuffled directly from its key, without the shoes before it
+        cards = shoe_library.cards(shoe_number=shoe_number)
+        shoe_id = shoe_library.shoe_id(shoe_number=shoe_number)
+    if bankroll is not None:
+        player.adjust_bankroll(amount=bankroll - player.bankroll)
+    blackjack.add_player(player=player)
+    trace: list[dict[str, Any]] = []
+    blackjack.replay(
+        shoe_number=shoe_number,
+        penetration=params['penetration'],
+        shoe_size=params['shoe_size'],
+        seed=run,
+        number_of_shoes=params['number_of_shoes'],
+        shoe_sampling=ShoeSampling(params['shoe_sampling']),
+        first_round=first_round,
+        last_round=last_round,
+        cards=cards,
+        shoe_id=shoe_id,
+        _trace=trace.append
+    )
+    return trace
@@ -0,0 +1,177 @@
+import csv
+from pathlib import Path
+from statistics import NormalDist
+import numpy as np
+from blackjack.enums import StatsCategory
+from blackjack.stats import Stats
+
+COLUMNS = (
+    'count',
+    'rounds',
+    'hands',
+    'amount_bet',
+    'net_winnings',
+    'ev_per_round',
+    'ev_per_unit',
+    'std_per_round',
+    'frequency',
+    'ci_low',
+    'ci_high'
+)
+
+_CATEGORIES = (
+    StatsCategory.TOTAL_ROUNDS_PLAYED,
+    StatsCategory.TOTAL_HANDS_PLAYED,
+    StatsCategory.AMOUNT_BET,
+    StatsCategory.NET_WINNINGS,
+    StatsCategory.INSURANCE_AMOUNT_BET,
+    StatsCategory.INSURANCE_NET_WINNINGS
+)
+
+
+def count_sums(
+    stats: Stats,
+    categories: tuple[StatsCategory, ...],
+    min_count: float | int | None = None,
+    max_count: float | int | None = None
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sums the per-count results of a Stats instance into an array with a row
+    per count, in one pass over the stats.
+
+    Parameters
+    ----------
+    stats
+        Stats of a player
+    categories
+        Categories summed into the first columns, in order. The last two
+        columns are the round winnings and squared round winnings.
+    min_count
+        Counts below min_count are combined into its row
+    max_count
+        Counts above max_count are combined into its row
+
+    Returns
+    -------
+    tuple
+        Sorted counts, with NaN for rounds played without a count, and the
+        array of sums with a row for every count
+
+    """
+    category_columns = {category: column for column, category in enumerate(categories)}
+    counts: list[float | int | None] = []
+    columns: list[int] = []
+    values: list[float] = []
+    for (count, category), value in stats.stats.items():
+        column = category_columns.get(category)
+        if column is not None:
+            counts.append(count)
+            columns.append(column)
+            values.append(value)
+    for column, sums in ((len(categories), stats.round_winnings), (len(categories) + 1, stats.squared_winnings)):
+        counts.extend(sums)
+        columns.extend([column] * len(sums))
+        values.extend(sums.values())
+
+    count_values = np.array([np.nan if count is None else count for count in counts], dtype=float)
+    if min_count is not None or max_count is not None:
+        count_values = np.clip(count_values, min_count, max_count)
+    bins, rows = np.unique(count_values, return_inverse=True)
+    sums = np.zeros((len(bins), len(categories) + 2))
+    np.add.at(sums, (rows.ravel(), np.array(columns, dtype=np.intp)), np.array(values, dtype=float))
+    return bins, sums
+
+
+class CountReport:
+    """
+    Represents a table of results per count: rounds and hands played,
+    amount bet and net winnings (insurance included), EV per round and per
+    unit bet, standard deviation per round, how often the count came up and
+    a confidence interval for the EV per round.
+
+    Rows are sorted by count. Rounds played without a count (i.e. by a
+    player who does not count cards) have a count of NaN and come last.
+
+    """
+    def __init__(self, table: np.ndarray):
+        """
+        Parameters
+        ----------
+        table
+            Structured array with a field for every name in COLUMNS
+
+        """
+        self._table = table
+
+    @classmethod
+    def from_stats(
+        cls,
+        stats: Stats,
+        confidence: float = 0.95,
+        min_count: float | int | None = None,
+        max_count: float | int | None = None
+    ) -> 'CountReport':
+        """
+        Builds the report from the per-count results recorded in a Stats instance.
+
+        Parameters
+        ----------
+        stats
+            Stats of a player
+        confidence
+            Confidence level of the interval for the EV per round
+        min_count
+            Counts below min_count are combined into its row, e.g. for the
+            long tails of HALVES or KO
+        max_count
+            Counts above max_count are combined into its row
+
+        """
+        bins, sums = count_sums(stats=stats, categories=_CATEGORIES, min_count=min_count, max_count=max_count)
+        played = sums[:, 0] > 0
+        bins, sums = bins[played], sums[played]
+        rounds, hands, bet, net, insurance_bet, insurance_net, _, squared_winnings = sums.T
+        # a round's winnings are the change in bankroll, so insurance is included throughout
+        amount_bet = bet + insurance_bet
+        net_winnings = net + insurance_net
+        ev_per_round = net_winnings / rounds
+        std_per_round = np.sqrt(np.maximum(squared_winnings / rounds - ev_per_round ** 2, 0))
+        margin = NormalDist().inv_cdf((1 + confidence) / 2) * std_per_round / np.sqrt(rounds)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ev_per_unit = np.where(amount_bet > 0, net_winnings / amount_bet, np.nan)
+
+        table = np.empty(len(bins), dtype=[(name, float) for name in COLUMNS])
+        table['count'] = bins
+        table['rounds'] = rounds
+        table['hands'] = hands
+        table['amount_bet'] = amount_bet
+        table['net_winnings'] = net_winnings
+        table['ev_per_round'] = ev_per_round
+        table['ev_per_unit'] = ev_per_unit
+        table['std_per_round'] = std_per_round
+        table['frequency'] = rounds / rounds.sum() if len(rounds) else rounds
+        table['ci_low'] = ev_per_round - margin
+        table['ci_high'] = ev_per_round + margin
+        return cls(table=table)
+
+    def __len__(self) -> int:
+        return len(self._table)
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        """Returns a column, i.e. report['ev_per_round']."""
+        return self._table[column]
+
+    def to_numpy(self) -> np.ndarray:
+        """Returns a copy of the report as a structured array with a field for every name in COLUMNS."""
+        return self._table.copy()
+
+    def to_csv(self, path: str | Path) -> Path:
+        """Writes the report to a CSV file with a header row. Rounds without a count have an empty count."""
+        path = Path(path)
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(COLUMNS)
+            for row in self._table.tolist():
+                count = '' if np.isnan(row[0]) else (int(row[0]) if row[0].is_integer() else row[0])
+                writer.writerow([count, int(row[1]), int(row[2]), *row[3:]])
+        return path
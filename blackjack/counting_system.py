@@ -0,0 +1,145 @@
+from typing import NamedTuple
+from blackjack.enums import CardCountingSystem
+from blackjack.source.card_counting_systems import COUNT_VALUES, INITIAL_COUNTS
+
+
+CARDS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+
+# number of cards of each value in a single deck, keyed like COUNT_VALUES
+CARDS_PER_DECK = {
+    '2': 4, '3': 4, '4': 4, '5': 4, '6': 4, '7': 4, '8': 4, '9': 4, '10-J-Q-K': 16, 'A': 4
+}
+
+
+def _count_key(card: str) -> str:
+    return '10-J-Q-K' if card in {'10', 'J', 'Q', 'K'} else card
+
+
+def _card_values(values: dict[str, float | int]) -> dict[str, float | int]:
+    """Expands values keyed like COUNT_VALUES to every card so a seen card needs a single lookup."""
+    return {card: values.get(_count_key(card), 0) for card in CARDS}
+
+
+class SideCount(NamedTuple):
+    """
+    A count kept alongside the main count, i.e. an ace side count is
+    SideCount(values={'A': 1}, betting_weight=1). Every card of the side
+    count remaining in excess of its expected number adds betting_weight
+    to the running count used for betting.
+
+    """
+    values: dict[str, float | int]
+    betting_weight: float | int = 0
+
+
+class CountingSystem:
+    """
+    Represents a card counting system: the value of every card, the
+    initial running count and any side counts.
+
+    """
+    def __init__(
+        self,
+        name: str,
+        values: dict[str, float | int],
+        initial_count: float | int = 0,
+        side_counts: dict[str, SideCount] | None = None
+    ):
+        """
+        Parameters
+        ----------
+        name
+            Unique name of the card counting system
+        values
+            Value of every card, keyed like COUNT_VALUES ('2' through '9',
+            '10-J-Q-K' and 'A'). Values may be fractional or multi-level
+        initial_count
+            Initial running count for every deck beyond the first, i.e. -4
+            for KO. Typically 0 for balanced card counting systems
+        side_counts
+            Side counts kept alongside the main count, keyed by name
+
+        """
+        missing = set(CARDS_PER_DECK) - set(values)
+        if missing:
+            raise ValueError(f'Card counting values for {name} are missing: {", ".join(sorted(missing))}.')
+
+        self._name = name
+        self._values = dict(values)
+        self._initial_count = initial_count
+        self._side_counts = dict(side_counts or {})
+        self._card_values = _card_values(values=values)
+        self._is_balanced = sum(self._values[key] * cards for key, cards in CARDS_PER_DECK.items()) == 0
+        self._side_count_card_values = {
+            side_name: _card_values(values=side_count.values) for side_name, side_count in self._side_counts.items()
+        }
+        # average value of a seen card, used to compute the expected side count
+        self._side_count_means = {
+            side_name: sum(side_count.values.get(key, 0) * cards for key, cards in CARDS_PER_DECK.items()) / 52
+            for side_name, side_count in self._side_counts.items()
+        }
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def values(self) -> dict[str, float | int]:
+        return self._values
+
+    @property
+    def card_values(self) -> dict[str, float | int]:
+        return self._card_values
+
+    @property
+    def initial_count(self) -> float | int:
+        return self._initial_count
+
+    @property
+    def side_counts(self) -> dict[str, SideCount]:
+        return self._side_counts
+
+    def side_count_card_values(self, side_count: str) -> dict[str, float | int]:
+        return self._side_count_card_values[side_count]
+
+    def side_count_mean(self, side_count: str) -> float:
+        return self._side_count_means[side_count]
+
+    @property
+    def is_balanced(self) -> bool:
+        return self._is_balanced
+
+    @property
+    def is_fractional(self) -> bool:
+        return not all(float(value).is_integer() for value in self._values.values())
+
+    def initial_running_count(self, shoe_size: int) -> float | int:
+        return self._initial_count * (shoe_size - 1)
+
+    def __repr__(self) -> str:
+        return f'CountingSystem({self._name!r})'
+
+
+COUNTING_SYSTEMS: dict[str, CountingSystem] = {
+    system.value: CountingSystem(name=system.value, values=values, initial_count=INITIAL_COUNTS.get(system, 0))
+    for system, values in COUNT_VALUES.items()
+}
+
+
+def register_counting_system(counting_system: CountingSystem) -> CountingSystem:
+    """Adds a card counting system to the registry so it can be referred to by name."""
+    if counting_system.name in COUNTING_SYSTEMS:
+        raise ValueError(f'A card counting system named {counting_system.name} is already registered.')
+    COUNTING_SYSTEMS[counting_system.name] = counting_system
+    return counting_system
+
+
+def get_counting_system(card_counting_system: CardCountingSystem | CountingSystem | str) -> CountingSystem:
+    """Returns the registered card counting system for a CardCountingSystem, a name or a CountingSystem."""
+    if isinstance(card_counting_system, CountingSystem):
+        return card_counting_system
+    name = card_counting_system.value if isinstance(card_counting_system, CardCountingSystem) else card_counting_system
+    try:
+        return COUNTING_SYSTEMS[name]
+    except KeyError:
+        raise ValueError(f'No card counting system named {name} is registered.') from None
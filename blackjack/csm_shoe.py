@@ -0,0 +1,61 @@
+import random
+from blackjack.shoe import Shoe
+
+
+class CSMShoe(Shoe):
+    """
+    Represents a continuous shuffling machine (CSM). Every card is drawn
+    uniformly from the cards in the machine, and the cards of a round go
+    back into the machine once the round is over, so the shoe never runs
+    out and there is no cut card.
+
+    Cards are drawn by swapping a random card with the last one and popping
+    it, and discards are appended, so drawing and reinserting a card are
+    both O(1) instead of reshuffling the machine every round.
+
+    """
+    def __init__(self, shoe_size: int):
+        """
+        Parameters
+        ----------
+        shoe_size
+            Number of decks loaded into the machine
+
+        """
+        super().__init__(shoe_size=shoe_size, penetration=0)
+        self._discards: list[str] = []
+
+    def deal_card(self, seen = True) -> str:
+        cards = self._cards
+        index = random.randrange(len(cards))
+        card = cards[index]
+        cards[index] = cards[-1]
+        cards.pop()
+        self._discards.append(card)
+        if seen:
+            self.add_to_seen_cards(card=card)
+        return card
+
+    def burn_card(self) -> None:
+        self.deal_card(seen=False)
+
+    def shuffle(self) -> None:
+        # cards are drawn at random, so the machine never needs to be shuffled
+        pass
+
+    @property
+    def cut_card_reached(self) -> bool:
+        return False
+
+    def end_round(self) -> None:
+        """
+        Puts the cards of the round back into the machine. Counts start
+        over, since every card seen is back among the cards left.
+
+        """
+        self._cards.extend(self._discards)
+        self._discards.clear()
+        self._seen_cards.clear()
+        self._number_of_seen_cards = 0
+        for key in self._counts:
+            self._counts[key] = 0
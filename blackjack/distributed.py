@@ -0,0 +1,268 @@
+import secrets
+import threading
+import time
+import traceback
+from collections import deque
+from itertools import count
+from multiprocessing.managers import BaseManager
+from typing import Any, Callable, Iterator
+
+
+class ChunkQueue:
+    """
+    Hands out chunks of work to workers that pull them, tracks which
+    worker holds every chunk and collects the results.
+
+    Workers that stop sending heartbeats lose their chunks, which are put
+    back at the front of the queue. Once the queue is empty, idle workers
+    steal the chunk that has been held the longest and run it again, so a
+    slow or stalled worker never holds up the end of a simulation. The
+    first result for a chunk wins, and duplicates are discarded. With a
+    fingerprint, only workers that register with the same fingerprint are
+    handed chunks.
+
+    """
+    def __init__(self, chunks: list[tuple], heartbeat_timeout: float, fingerprint: str | None = None):
+        self._chunks = chunks
+        self._fingerprint = fingerprint
+        self._heartbeat_timeout = heartbeat_timeout
+        self._pending = deque(range(len(chunks)))
+        self._leases: dict[int, tuple[int, float]] = {}
+        self._heartbeats: dict[int, float] = {}
+        self._results: dict[int, Any] = {}
+        self._errors: dict[int, str] = {}
+        self._completed = 0
+        self._worker_ids = count()
+        self._lock = threading.Lock()
+
+    def register_worker(self, fingerprint: str | None = None) -> int:
+        if self._fingerprint is not None and fingerprint != self._fingerprint:
+            raise ValueError(
+                f'Worker fingerprint {fingerprint} does not match the coordinator fingerprint {self._fingerprint}.'
+            )
+        with self._lock:
+            worker_id = next(self._worker_ids)
+            self._heartbeats[worker_id] = time.monotonic()
+            return worker_id
+
+    def heartbeat(self, worker_id: int) -> None:
+        with self._lock:
+            self._heartbeats[worker_id] = time.monotonic()
+
+    def _requeue_lost(self, now: float) -> None:
+        lost = {
+            worker_id for worker_id, last in self._heartbeats.items()
+            if now - last > self._heartbeat_timeout
+        }
+        for chunk_id, (worker_id, _) in sorted(self._leases.items(), reverse=True):
+            if worker_id in lost:
+                del self._leases[chunk_id]
+                self._pending.appendleft(chunk_id)
+        for worker_id in lost:
+            del self._heartbeats[worker_id]
+
+    def request_chunk(self, worker_id: int) -> tuple[int, tuple] | None:
+        """Returns the next (chunk_id, arguments) for a worker, or None once every chunk is complete."""
+        with self._lock:
+            now = time.monotonic()
+            self._heartbeats[worker_id] = now
+            self._requeue_lost(now=now)
+            while self._pending:
+                chunk_id = self._pending.popleft()
+                if chunk_id not in self._results:
+                    self._leases[chunk_id] = (worker_id, now)
+                    return chunk_id, self._chunks[chunk_id]
+            if self._completed == len(self._chunks):
+                return None
+            held = [(leased_at, chunk_id) for chunk_id, (holder, leased_at) in self._leases.items() if holder != worker_id]
+            if not held:
+                return None if not self._leases else (-1, ())
+            _, chunk_id = min(held)
+            self._leases[chunk_id] = (worker_id, now)
+            return chunk_id, self._chunks[chunk_id]
+
+    def complete(self, worker_id: int, chunk_id: int, result: Any) -> None:
+        with self._lock:
+            self._heartbeats[worker_id] = time.monotonic()
+            self._leases.pop(chunk_id, None)
+            if chunk_id not in self._results and chunk_id < len(self._chunks):
+                self._results[chunk_id] = result
+                self._completed += 1
+
+    def fail(self, worker_id: int, chunk_id: int, error: str) -> None:
+        """Records that a chunk raised an exception, which is raised again by the coordinator."""
+        with self._lock:
+            self._heartbeats[worker_id] = time.monotonic()
+            self._leases.pop(chunk_id, None)
+            self._errors[chunk_id] = error
+
+    def pop_result(self, chunk_id: int) -> tuple[bool, Any]:
+        """Returns (True, result) and forgets the result if the chunk is complete, (False, None) otherwise."""
+        with self._lock:
+            self._requeue_lost(now=time.monotonic())
+            if chunk_id in self._errors:
+                raise RuntimeError(f'Chunk {chunk_id} failed on a worker:\n{self._errors[chunk_id]}')
+            if chunk_id in self._results:
+                result = self._results[chunk_id]
+                # keep a marker so a late duplicate of the chunk is still discarded
+                self._results[chunk_id] = None
+                return True, result
+            return False, None
+
+    def completed(self) -> int:
+        with self._lock:
+            return self._completed
+
+
+class _ChunkQueueManager(BaseManager):
+    pass
+
+
+_chunk_queue: ChunkQueue | None = None
+
+
+def _set_chunk_queue(chunk_queue: ChunkQueue) -> None:
+    global _chunk_queue
+    _chunk_queue = chunk_queue
+
+
+def _get_chunk_queue() -> ChunkQueue:
+    return _chunk_queue
+
+
+_ChunkQueueManager.register('get_chunk_queue', callable=_get_chunk_queue)
+
+
+class Coordinator:
+    """
+    Serves chunks of work over TCP to workers on any machine that can reach
+    the address, i.e. workers started with run_worker.
+
+    """
+    def __init__(
+        self,
+        chunks: list[tuple],
+        address: tuple[str, int] = ('', 0),
+        authkey: bytes | None = None,
+        heartbeat_timeout: float = 30.0,
+        poll_interval: float = 0.05,
+        fingerprint: str | None = None
+    ):
+        """
+        Parameters
+        ----------
+        chunks
+            Arguments of every chunk of work, in the order results are returned
+        address
+            Host and port the coordinator listens on. Port 0 picks a free port
+        authkey
+            Key every worker must present to connect. The manager unpickles
+            whatever authenticated workers send, so the key must be secret.
+            Defaults to a random printable key, see the authkey property
+        heartbeat_timeout
+            Seconds without a heartbeat after which a worker's chunks are requeued
+        poll_interval
+            Seconds between checks for the next result
+        fingerprint
+            Fingerprint of the settings the chunks are run with, i.e. a hash
+            of the simulation template. Workers presenting another fingerprint
+            are rejected, since they would run the chunks with other settings
+
+        """
+        self._number_of_chunks = len(chunks)
+        self._poll_interval = poll_interval
+        self._authkey = secrets.token_hex(16).encode() if authkey is None else authkey
+        self._manager = _ChunkQueueManager(address=address, authkey=self._authkey)
+        # the queue lives in the manager's server process, which the workers connect to
+        self._manager.start(
+            initializer=_set_chunk_queue,
+            initargs=(ChunkQueue(chunks=chunks, heartbeat_timeout=heartbeat_timeout, fingerprint=fingerprint),)
+        )
+        self._chunk_queue = self._manager.get_chunk_queue()
+
+    @property
+    def address(self) -> tuple[str, int]:
+        return self._manager.address
+
+    @property
+    def authkey(self) -> bytes:
+        return self._authkey
+
+    def results(self) -> Iterator[Any]:
+        """Yields the result of every chunk in chunk order as soon as it is complete."""
+        for chunk_id in range(self._number_of_chunks):
+            while True:
+                done, result = self._chunk_queue.pop_result(chunk_id)
+                if done:
+                    yield result
+                    break
+                time.sleep(self._poll_interval)
+
+    def shutdown(self) -> None:
+        self._manager.shutdown()
+
+    def __enter__(self) -> 'Coordinator':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.shutdown()
+
+
+def run_worker(
+    address: tuple[str, int],
+    function: Callable[..., Any],
+    authkey: bytes,
+    heartbeat_interval: float = 5.0,
+    idle_interval: float = 0.1,
+    fingerprint: str | None = None
+) -> int:
+    """
+    Connects to a coordinator and calls function with the arguments of every
+    chunk it is handed until every chunk is complete. Heartbeats are sent
+    from a background thread while a chunk runs. Returns the number of
+    chunks the worker ran. Raises a ValueError if the coordinator has a
+    fingerprint other than fingerprint.
+
+    """
+    manager = _ChunkQueueManager(address=address, authkey=authkey)
+    manager.connect()
+    chunk_queue = manager.get_chunk_queue()
+    worker_id = chunk_queue.register_worker(fingerprint)
+
+    stopped = threading.Event()
+
+    def send_heartbeats() -> None:
+        # proxies open a connection per thread, so heartbeats never wait on a chunk
+        try:
+            heartbeat_queue = manager.get_chunk_queue()
+            while not stopped.wait(heartbeat_interval):
+                heartbeat_queue.heartbeat(worker_id)
+        except (ConnectionError, EOFError):
+            pass
+
+    heartbeat_thread = threading.Thread(target=send_heartbeats, daemon=True)
+    heartbeat_thread.start()
+
+    chunks_run = 0
+    try:
+        while True:
+            chunk = chunk_queue.request_chunk(worker_id)
+            if chunk is None:
+                return chunks_run
+            chunk_id, arguments = chunk
+            if chunk_id < 0:
+                # every remaining chunk is held by a worker that is still alive
+                time.sleep(idle_interval)
+                continue
+            try:
+                result = function(*arguments)
+            except Exception:
+                chunk_queue.fail(worker_id, chunk_id, traceback.format_exc())
+                raise
+            chunk_queue.complete(worker_id, chunk_id, result)
+            chunks_run += 1
+    except (ConnectionError, EOFError):
+        # the coordinator shut down after every chunk was complete
+        return chunks_run
+    finally:
+        stopped.set()
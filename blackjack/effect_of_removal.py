@@ -0,0 +1,255 @@
+from collections import Counter
+import random
+from typing import NamedTuple
+import numpy as np
+from blackjack.composition_ev import CARD_INDEX, CompositionEV
+from blackjack.counting_system import COUNTING_SYSTEMS
+from blackjack.dealer import Dealer
+from blackjack.enums import CardCountingSystem
+from blackjack.gameplay import play_round
+from blackjack.player import Player
+from blackjack.playing_strategy import PlayingStrategy
+from blackjack.rules import Rules
+from blackjack.shoe import Shoe
+from blackjack.source.index_plays import INDEX_PLAYS
+from blackjack.table import Table
+
+
+# vectors are indexed by card value, from Ace (index 0) to ten-valued cards (index 9)
+COUNT_KEYS = ('A', '2', '3', '4', '5', '6', '7', '8', '9', '10-J-Q-K')
+
+# number of cards of each value in a single deck, used to weight correlations over the 52 cards
+CARD_WEIGHTS = np.array([4] * 9 + [16], dtype=float)
+
+# effect of removal on insurance: every non-ten helps and every ten hurts, in the ratio 4 to -9
+INSURANCE_EFFECTS = np.array([1.0] * 9 + [-9 / 4])
+
+# actions of the index play tables mapped to CompositionEV decisions
+ACTIONS = {'S': 'S', 'H': 'H', 'Dh': 'D', 'Ds': 'D', 'P': 'P'}
+
+
+class CountingSystemEfficiency(NamedTuple):
+    name: str
+    betting_correlation: float
+    playing_efficiency: float
+    insurance_correlation: float
+
+
+def tag_vector(values: dict[str, float | int]) -> np.ndarray:
+    """Converts card counting values keyed like COUNT_VALUES into a vector indexed by card value."""
+    return np.array([values[key] for key in COUNT_KEYS], dtype=float)
+
+
+def full_composition(shoe_size: int) -> tuple[int, ...]:
+    return tuple(4 * shoe_size for _ in range(9)) + (16 * shoe_size,)
+
+
+def _without(composition: tuple[int, ...], *indices: int) -> tuple[int, ...]:
+    cards = list(composition)
+    for index in indices:
+        cards[index] -= 1
+    return tuple(cards)
+
+
+def round_expected_value(composition: tuple[int, ...], rules: Rules) -> float:
+    """
+    Expected value, per unit bet, of a round dealt from the composition
+    with every decision made by maximizing its expected value.
+
+    """
+    total = sum(composition)
+    expected_value = 0.0
+    for first in range(10):
+        for second in range(first, 10):
+            if first == second:
+                probability = composition[first] * (composition[first] - 1) / (total * (total - 1))
+            else:
+                probability = 2 * composition[first] * composition[second] / (total * (total - 1))
+            if probability == 0:
+                continue
+            after_player = _without(composition, first, second)
+            player_blackjack = (first, second) == (0, 9)
+
+            for up in range(10):
+                if after_player[up] == 0:
+                    continue
+                up_probability = after_player[up] / (total - 2)
+                remaining = _without(after_player, up)
+                if up == 0:
+                    dealer_blackjack = remaining[9] / (total - 3)
+                elif up == 9:
+                    dealer_blackjack = remaining[0] / (total - 3)
+                else:
+                    dealer_blackjack = 0.0
+
+                if player_blackjack:
+                    hand_ev = (1 - dealer_blackjack) * rules.blackjack_payout
+                else:
+                    cards = [COUNT_KEYS[first], COUNT_KEYS[second]]
+                    evs = CompositionEV(composition=remaining, dealer_up_card=COUNT_KEYS[up], rules=rules).evaluate(
+                        cards=cards,
+                        can_double=rules.double_down,
+                        can_split=first == second,
+                        can_surrender=rules.late_surrender
+                    )
+                    hand_ev = (1 - dealer_blackjack) * max(evs.values()) - dealer_blackjack
+                expected_value += probability * up_probability * hand_ev
+    return expected_value
+
+
+def effects_of_removal(rules: Rules, shoe_size: int = 1) -> np.ndarray:
+    """
+    Change in the expected value of a round when a single card of each value
+    is removed, computed exactly and scaled to the removal of one card from a
+    single deck. Every composition takes a few seconds to evaluate.
+
+    """
+    composition = full_composition(shoe_size=shoe_size)
+    base = round_expected_value(composition=composition, rules=rules)
+    return np.array([
+        round_expected_value(composition=_without(composition, index), rules=rules) - base
+        for index in range(10)
+    ]) * shoe_size
+
+
+def simulated_effects_of_removal(
+    rules: Rules,
+    number_of_shoes: int,
+    shoe_size: int,
+    penetration: float = 0.75,
+    seed: int | None = None
+) -> np.ndarray:
+    """
+    Effects of removal estimated from a batch of simulated rounds by regressing
+    each round's winnings, per unit bet, on the excess number of cards of each
+    value removed from the shoe, per deck remaining.
+
+    """
+    if seed is not None:
+        random.seed(seed)
+
+    player = Player(name='Effect of Removal', bankroll=rules.max_bet * 100, min_bet=rules.min_bet)
+    initial_bankroll = player.bankroll
+    table = Table(rules=rules)
+    table.add_player(player=player)
+    dealer = Dealer()
+    playing_strategy = PlayingStrategy(s17=rules.s17)
+
+    removed: list[np.ndarray] = []
+    winnings: list[float] = []
+    for _ in range(number_of_shoes):
+        shoe = Shoe(shoe_size=shoe_size, penetration=penetration)
+        shoe.shuffle()
+        while not shoe.cut_card_reached:
+            remaining = Counter(CARD_INDEX[card] for card in shoe.cards)
+            remaining_cards = np.array([remaining[index] for index in range(10)], dtype=float)
+            removed.append(CARD_WEIGHTS - remaining_cards * 52 / len(shoe.cards))
+            play_round(table=table, dealer=dealer, rules=rules, shoe=shoe, playing_strategy=playing_strategy)
+            winnings.append((player.bankroll - initial_bankroll) / rules.min_bet)
+            player.reset_bankroll()
+
+    design = np.column_stack([np.ones(len(removed)), np.array(removed)])
+    coefficients = np.linalg.lstsq(design, np.array(winnings), rcond=None)[0][1:]
+    # the excess removals add up to 0, so the effects are only identified up to a
+    # constant, which is chosen so that removing every card of a deck has no effect
+    return coefficients - CARD_WEIGHTS @ coefficients / CARD_WEIGHTS.sum()
+
+
+def _decision_cards(hand_type: str, hand: int | str) -> list[str]:
+    if hand_type == 'pair':
+        return [hand, hand]
+    if hand_type == 'soft':
+        return ['A', str(hand - 11)]
+    if hand >= 12:
+        return ['10', str(hand - 10)]
+    return [str(hand // 2 + 1), str(hand - hand // 2 - 1)]
+
+
+def decision_effects_of_removal(
+    rules: Rules,
+    decisions: list[tuple] | None = None,
+    shoe_size: int = 1
+) -> np.ndarray:
+    """
+    Effects of removal on the gain of each decision, i.e. the expected value of
+    the decision made at or above its index minus the one made below it, with
+    one row per decision. Decisions default to the Illustrious 18.
+
+    """
+    if decisions is None:
+        decisions = INDEX_PLAYS[(CardCountingSystem.HI_LO, rules.s17)]
+
+    effects = []
+    for hand_type, hand, dealer_up_card, _, at_or_above, below in decisions:
+        cards = _decision_cards(hand_type=hand_type, hand=hand)
+        composition = _without(
+            full_composition(shoe_size=shoe_size),
+            *(CARD_INDEX[card] for card in cards + [dealer_up_card])
+        )
+
+        def gain(composition: tuple[int, ...]) -> float:
+            evs = CompositionEV(composition=composition, dealer_up_card=dealer_up_card, rules=rules).evaluate(
+                cards=cards,
+                can_double=True,
+                can_split=hand_type == 'pair',
+                can_surrender=False
+            )
+            return evs[ACTIONS[at_or_above]] - evs[ACTIONS[below]]
+
+        base = gain(composition=composition)
+        effects.append([
+            (gain(composition=_without(composition, index)) - base) * shoe_size if composition[index] else 0.0
+            for index in range(10)
+        ])
+    return np.array(effects)
+
+
+def correlations(tags: np.ndarray, effects: np.ndarray) -> np.ndarray:
+    """
+    Correlations over the 52 cards of a deck between every tag vector (rows of
+    `tags`) and every effect of removal vector (rows of `effects`).
+
+    """
+    tags = np.atleast_2d(tags)
+    effects = np.atleast_2d(effects)
+    weights = CARD_WEIGHTS / CARD_WEIGHTS.sum()
+    centered_tags = tags - (tags @ weights)[:, None]
+    centered_effects = effects - (effects @ weights)[:, None]
+    covariance = (centered_tags * weights) @ centered_effects.T
+    tag_deviation = np.sqrt((centered_tags ** 2) @ weights)
+    effect_deviation = np.sqrt((centered_effects ** 2) @ weights)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.nan_to_num(covariance / np.outer(tag_deviation, effect_deviation))
+
+
+def evaluate_counting_systems(
+    effects: np.ndarray,
+    decision_effects: np.ndarray,
+    custom_values: dict[str, dict[str, float | int]] | None = None
+) -> list[CountingSystemEfficiency]:
+    """
+    Reports the betting correlation, playing efficiency and insurance correlation
+    of every registered card counting system and of any custom card counting
+    values, keyed by name.
+
+    Playing efficiency is the average absolute correlation with the effects of
+    removal of every decision in `decision_effects`.
+
+    """
+    values = {name: counting_system.values for name, counting_system in COUNTING_SYSTEMS.items()}
+    values.update(custom_values or {})
+    tags = np.array([tag_vector(system_values) for system_values in values.values()])
+
+    betting = correlations(tags=tags, effects=effects)[:, 0]
+    playing = np.abs(correlations(tags=tags, effects=decision_effects)).mean(axis=1)
+    insurance = correlations(tags=tags, effects=INSURANCE_EFFECTS)[:, 0]
+
+    return [
+        CountingSystemEfficiency(
+            name=name,
+            betting_correlation=float(betting[i]),
+            playing_efficiency=float(playing[i]),
+            insurance_correlation=float(insurance[i])
+        )
+        for i, name in enumerate(values)
+    ]
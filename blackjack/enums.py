@@ -33,3 +33,44 @@ class StatsCategory(Enum):
     NET_WINNINGS = 'NET WINNINGS'
     TOTAL_AMOUNT_BET = 'TOTAL AMOUNT BET'
     TOTAL_NET_WINNINGS = 'TOTAL NET WINNINGS'
+
+
+class RiskOfRuinMethod(Enum):
+    DIFFUSION = 'DIFFUSION'
+    RANDOM_WALK = 'RANDOM WALK'
+
+
+class ShoeSampling(Enum):
+    RANDOM = 'RANDOM'
+    ANTITHETIC = 'ANTITHETIC'
+    STRATIFIED = 'STRATIFIED'
+
+
+class RunOutcome(Enum):
+    BANKRUPT = 'bankrupt'
+    GOAL = 'goal'
+    RAN_OUT = 'ran_out'
+
+
+class ShoeRNG(Enum):
+    MT19937 = 'MT19937'
+    PHILOX = 'PHILOX'
+
+
+class BankrollDownsampling(Enum):
+    ROUND = 'ROUND'
+    SHOE = 'SHOE'
+    BLOCK = 'BLOCK'
+
+
+class JobStatus(Enum):
+    QUEUED = 'QUEUED'
+    RUNNING = 'RUNNING'
+    COMPLETED = 'COMPLETED'
+    FAILED = 'FAILED'
+
+
+class RoundAction(Enum):
+    SPLIT = 'SPLIT'
+    DOUBLE = 'DOUBLE'
+    INSURANCE = 'INSURANCE'
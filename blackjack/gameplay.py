@@ -1,10 +1,11 @@
 import json
 from pathlib import Path
 from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable
 from blackjack.back_counter import BackCounter
 from blackjack.card_counter import CardCounter
 from blackjack.dealer import Dealer
-from blackjack.enums import CardCountingSystem, HandStatus
+from blackjack.enums import HandStatus
 from blackjack.hand import Hand
 from blackjack.player import Player
 from blackjack.playing_strategy import PlayingStrategy
@@ -13,6 +14,10 @@ from blackjack.shoe import Shoe
 from blackjack.stats import StatsCategory
 from blackjack.table import Table
 
+if TYPE_CHECKING:
+    from blackjack.log_policy import LogPolicy
+    from blackjack.results_export import RoundLog
+
 
 def log_blackjack_round(
         blackjack_log_json: Path, 
@@ -43,6 +48,62 @@ def log_blackjack_round(
         for entry in logs:
             f.write(json.dumps(entry) + "\n")
 
+
+def buffer_blackjack_round(
+    round_log: 'RoundLog',
+    shoe: Shoe,
+    players: list[Player],
+    dealer: Dealer,
+    dealer_hand_is_blackjack: bool,
+    count_dict: dict,
+    insurance_count_dict: dict,
+    placed_bet_dict: dict,
+    begining_bankroll_dict: dict
+) -> None:
+    """Appends the rows log_blackjack_round would log to a RoundLog column buffer."""
+    for player in players:
+        round_log.append(
+            shoe_id=shoe.shoe_id,
+            player=player.name,
+            dealer_hand=dealer.hand.cards,
+            dealer_blackjack=dealer_hand_is_blackjack,
+            count=count_dict.get(player, None),
+            insurance_count=insurance_count_dict.get(player, None),
+            player_hands=[hand.cards for hand in player.hands],
+            bet=placed_bet_dict.get(player, None),
+            bankroll_start=begining_bankroll_dict[player],
+            bankroll_end=player.bankroll
+        )
+
+def _trace_decision(
+    _trace: Callable[[dict[str, Any]], None],
+    player: Player,
+    hand_number: int,
+    hand: Hand,
+    dealer_up_card: str,
+    decision: str,
+    count: float | int | None,
+    shoe: Shoe
+) -> None:
+    # the count at the time of the decision is what index plays use, the round's count is what the bet used
+    _trace({
+        "event": "decision",
+        "player": player.name,
+        "hand": hand_number,
+        "cards": list(hand.cards),
+        "total": hand.total,
+        "soft": hand.is_soft,
+        "dealer_up_card": dealer_up_card,
+        "decision": decision,
+        "count": count,
+        "current_count": (
+            shoe.betting_count(card_counting_system=player.card_counting_system)
+            if isinstance(player, CardCounter) else None
+        ),
+        "cards_remaining": len(shoe.cards)
+    })
+
+
 def get_count(table: Table, shoe: Shoe) -> dict[CardCounter, float | int]:
     """
     Gets the count for every player at the table before
@@ -50,14 +111,9 @@ def get_count(table: Table, shoe: Shoe) -> dict[CardCounter, float | int]:
 
     """
     count_dict = {}
-    for player in table.players + table.observers:
+    for player in table.players_and_observers:
         if isinstance(player, CardCounter):
-            card_counting_system = player.card_counting_system
-            count_dict[player] = (
-                shoe.running_count(card_counting_system=card_counting_system)
-                if card_counting_system == CardCountingSystem.KO
-                else shoe.true_count(card_counting_system=card_counting_system)
-            )
+            count_dict[player] = shoe.betting_count(card_counting_system=player.card_counting_system)
     return count_dict
 
 
@@ -70,12 +126,7 @@ def get_insurance_count(players: list[Player], shoe: Shoe) -> dict[CardCounter,
     insurance_count_dict = {}
     for player in players:
         if isinstance(player, CardCounter) and player.insurance is not None:
-            card_counting_system = player.card_counting_system
-            insurance_count_dict[player] = (
-                shoe.running_count(card_counting_system=card_counting_system)
-                if card_counting_system == CardCountingSystem.KO
-                else shoe.true_count(card_counting_system=card_counting_system)
-            )
+            insurance_count_dict[player] = shoe.betting_count(card_counting_system=player.card_counting_system)
     return insurance_count_dict
 
 
@@ -98,7 +149,9 @@ def player_initial_decision(
     dealer_hand_is_blackjack: bool,
     dealer_up_card: str,
     rules: Rules,
-    playing_strategy: PlayingStrategy
+    playing_strategy: PlayingStrategy,
+    shoe: Shoe | None = None,
+    _trace: Callable[[dict[str, Any]], None] | None = None
 ) -> str | None:
     """
     Determines a player's initial decision based on the first two cards dealt
@@ -126,7 +179,10 @@ def player_initial_decision(
         and player.has_sufficient_bankroll(amount=half_bet)
     ):
         # place insurance bet
+        first_hand.insurance_bet = half_bet
         player_stats[(insurance_count, StatsCategory.INSURANCE_AMOUNT_BET)] += half_bet
+        if _trace:
+            _trace({"event": "insurance", "player": player.name, "insurance_count": insurance_count, "amount": half_bet})
 
         if dealer_hand_is_blackjack:
             player_stats[(insurance_count, StatsCategory.INSURANCE_NET_WINNINGS)] += total_bet
@@ -178,8 +234,21 @@ def player_initial_decision(
         hand=first_hand,
         dealer_up_card=dealer_up_card,
         max_hands=rules.max_hands,
-        playing_strategy=playing_strategy
+        playing_strategy=playing_strategy,
+        count=count,
+        shoe=shoe
     )
+    if _trace:
+        _trace_decision(
+            _trace=_trace,
+            player=player,
+            hand_number=0,
+            hand=first_hand,
+            dealer_up_card=dealer_up_card,
+            decision=decision,
+            count=count,
+            shoe=shoe
+        )
 
     if rules.late_surrender and decision in {'Rh', 'Rp', 'Rs'}:
         player.adjust_bankroll(amount=half_bet)
@@ -210,7 +279,8 @@ def player_plays_hands(
     dealer_hand_is_blackjack: bool,
     dealer_up_card: str,
     rules: Rules,
-    playing_strategy: PlayingStrategy
+    playing_strategy: PlayingStrategy,
+    _trace: Callable[[dict[str, Any]], None] | None = None
 ) -> None:
     """Player plays out their hand(s)."""
     decision = player_initial_decision(
@@ -222,7 +292,9 @@ def player_plays_hands(
         dealer_hand_is_blackjack=dealer_hand_is_blackjack,
         dealer_up_card=dealer_up_card,
         rules=rules,
-        playing_strategy=playing_strategy
+        playing_strategy=playing_strategy,
+        shoe=shoe,
+        _trace=_trace
     )
 
     if decision is None:
@@ -297,8 +369,21 @@ def player_plays_hands(
                 hand=hand,
                 dealer_up_card=dealer_up_card,
                 max_hands=rules.max_hands,
-                playing_strategy=playing_strategy
+                playing_strategy=playing_strategy,
+                count=count,
+                shoe=shoe
             )
+            if _trace:
+                _trace_decision(
+                    _trace=_trace,
+                    player=player,
+                    hand_number=hand_number,
+                    hand=hand,
+                    dealer_up_card=dealer_up_card,
+                    decision=decision,
+                    count=count,
+                    shoe=shoe
+                )
         elif another_hand > 0:
             another_hand -= 1
             hand_number += 1
@@ -369,21 +454,34 @@ def play_round(
     rules: Rules,
     shoe: Shoe,
     playing_strategy: PlayingStrategy,
-    _logfile: Path = None
+    _logfile: Path = None,
+    _trace: Callable[[dict[str, Any]], None] | None = None,
+    _log_policy: 'LogPolicy | None' = None,
+    _round_log: 'RoundLog | None' = None
 ) -> None:
-    """Plays a round of blackjack between a dealer and players at a table."""
+    """
+    Plays a round of blackjack between a dealer and players at a table.
+    _trace, if given, is called with a dict for every bet, insurance bet,
+    playing decision and result, and for the dealer's hand. _log_policy, if
+    given, decides which rounds and players are written to _logfile and
+    appended to the _round_log column buffer.
+
+    """
     player_stats_dict = {}
     placed_bet_dict = {}
     count_dict = get_count(table=table, shoe=shoe)
 
-    players_and_observers = table.players + table.observers
+    players_and_observers = table.players_and_observers
     for player in players_and_observers:
         count = count_dict.get(player, None)
 
         if isinstance(player, BackCounter) and count is not None:
             if player.is_seated:
-                if player.can_exit(count=count):
+                placed_bet = player.placed_bet(count=count)
+                if player.can_exit(count=count) or not player.has_sufficient_bankroll(amount=placed_bet):
                     table.remove_back_counter(back_counter=player)
+                    if _trace:
+                        _trace({"event": "exit", "player": player.name, "count": count})
                     continue
             else:
                 if not player.can_enter(count=count):
@@ -391,13 +489,20 @@ def play_round(
 
                 table.add_back_counter(back_counter=player)
                 placed_bet = player.placed_bet(count=count)
+                if _trace:
+                    _trace({"event": "enter", "player": player.name, "count": count})
         else:
             placed_bet = player.placed_bet(count=count)
             if not player.has_sufficient_bankroll(amount=placed_bet):
                 player.bankrupt_player()
                 table.remove_player(player=player)
+                if _trace:
+                    _trace({"event": "bankrupt", "player": player.name, "count": count, "bankroll": player.bankroll})
                 continue
 
+        if _trace:
+            _trace({"event": "bet", "player": player.name, "count": count, "bet": placed_bet, "bankroll": player.bankroll})
+
         player_stats = player.stats.stats
         player_stats[(count, StatsCategory.TOTAL_ROUNDS_PLAYED)] += 1
         player_stats_dict[player] = player_stats
@@ -406,9 +511,8 @@ def play_round(
     players = table.players
     begining_bankroll_dict = {}
     if players:
-        if _logfile:
-            for player in players:
-                begining_bankroll_dict[player] = player.bankroll
+        for player in players:
+            begining_bankroll_dict[player] = player.bankroll
 
         initialize_hands(dealer=dealer, players=players, shoe=shoe)
         dealer_hand_is_blackjack = dealer.hand.is_blackjack
@@ -426,7 +530,8 @@ def play_round(
                 dealer_hand_is_blackjack=dealer_hand_is_blackjack,
                 dealer_up_card=dealer_up_card,
                 rules=rules,
-                playing_strategy=playing_strategy
+                playing_strategy=playing_strategy,
+                _trace=_trace
             )
 
         if dealer_turn(players=players):
@@ -446,27 +551,54 @@ def play_round(
         elif dealer_hand_is_blackjack or rules.dealer_shows_hole_card:
             shoe.add_to_seen_cards(card=dealer.hole_card)
 
+        if _trace:
+            _trace({"event": "dealer", "cards": list(dealer.hand.cards), "total": dealer.hand.total})
+            for player in players:
+                _trace({
+                    "event": "result",
+                    "player": player.name,
+                    "hands": [list(hand.cards) for hand in player.hands],
+                    "bankroll_start": begining_bankroll_dict[player],
+                    "bankroll_end": player.bankroll
+                })
+
         ## Update aggregate for Welford Algorithm
         players_to_remove = []
         for player in players:
             player.update_aggregate(player.bankroll)
+            player.stats.record_round(
+                count=count_dict.get(player, None),
+                winnings=player.bankroll - begining_bankroll_dict[player]
+            )
             if player.stop_on_goal and player.bankroll_goal_reached:
                 players_to_remove.append(player)
 
-        if _logfile:
-            log_blackjack_round(
-                blackjack_log_json=_logfile,
-                shoe=shoe,
-                players=players,
-                dealer=dealer,
-                dealer_hand_is_blackjack=dealer_hand_is_blackjack,
-                count_dict=count_dict,
-                insurance_count_dict=insurance_count_dict,
-                placed_bet_dict=placed_bet_dict,
-                begining_bankroll_dict=begining_bankroll_dict
-            )        
+        if (_logfile or _round_log is not None) and (_log_policy is None or _log_policy.log_round(shoe=shoe)):
+            # the policy filters players before any log record is built
+            logged_players = players if _log_policy is None else [
+                player for player in players
+                if _log_policy.log_player(player=player, count=count_dict.get(player, None), placed_bet=placed_bet_dict[player])
+            ]
+            if logged_players:
+                log_kwargs = {
+                    'shoe': shoe,
+                    'players': logged_players,
+                    'dealer': dealer,
+                    'dealer_hand_is_blackjack': dealer_hand_is_blackjack,
+                    'count_dict': count_dict,
+                    'insurance_count_dict': insurance_count_dict,
+                    'placed_bet_dict': placed_bet_dict,
+                    'begining_bankroll_dict': begining_bankroll_dict
+                }
+                if _logfile:
+                    log_blackjack_round(blackjack_log_json=_logfile, **log_kwargs)
+                if _round_log is not None:
+                    buffer_blackjack_round(round_log=_round_log, **log_kwargs)
 
         for player in players_to_remove:
             table.remove_player(player=player)
 
         clear_hands(dealer=dealer, players=players)
+
+    # discards go back into a continuous shuffling machine
+    shoe.end_round()
@@ -37,6 +37,7 @@ class Hand:
         self._is_split = False
         self._status = HandStatus.IN_PLAY
         self._total_bet: float | int = 0
+        self._insurance_bet: float | int = 0
         self._total_cache: int | None = None
         self._hard_total_cache: int | None = None
         self._is_soft_cache: bool | None = None
@@ -67,6 +68,14 @@ class Hand:
     def add_to_total_bet(self, amount: float | int) -> None:
         self._total_bet += amount
 
+    @property
+    def insurance_bet(self) -> float | int:
+        return self._insurance_bet
+
+    @insurance_bet.setter
+    def insurance_bet(self, amount: float | int) -> None:
+        self._insurance_bet = amount
+
     def add_card(self, card: str) -> None:
         self._cards.append(card)
         self._invalidate_cache()
@@ -0,0 +1,227 @@
+from math import inf, sqrt
+from statistics import NormalDist
+from typing import NamedTuple, Sequence
+import numpy as np
+from blackjack.player import Player
+
+
+class RoundOutcomes:
+    """
+    Collects the net result of every round a player plays so
+    that it can be replayed as a bootstrapped outcome distribution.
+
+    """
+    def __init__(self, player: Player, reset_bankroll: bool = False):
+        """
+        Parameters
+        ----------
+        player
+            Player whose rounds are recorded
+        reset_bankroll
+            True if the simulation resets the player's bankroll after
+            every round, False otherwise
+
+        """
+        self._bankroll = player.bankroll
+        self._reset_bankroll = reset_bankroll
+        self._outcomes: list[float | int] = []
+        player.add_round_listener(self._record)
+
+    def _record(self, bankroll: float | int) -> None:
+        self._outcomes.append(bankroll - self._bankroll)
+        if not self._reset_bankroll:
+            self._bankroll = bankroll
+
+    @property
+    def outcomes(self) -> np.ndarray:
+        return np.asarray(self._outcomes, dtype=float)
+
+
+class ImportanceSamplingResult(NamedTuple):
+    risk_of_ruin: float
+    standard_error: float
+    lower: float
+    upper: float
+    number_of_sessions: int
+    tilt: float
+
+
+class ImportanceSampler:
+    """
+    Estimates the risk of ruin by replaying a bootstrapped round outcome
+    distribution under an exponential tilt that makes ruin likely, and
+    weighting every ruined session by its likelihood ratio.
+
+    """
+    def __init__(self, round_outcomes: Sequence[float | int] | np.ndarray, tilt: float | None = None):
+        """
+        Parameters
+        ----------
+        round_outcomes
+            Net result of each observed round, in the same units as the bankroll
+        tilt
+            Exponential tilt applied to the outcome distribution. Defaults to
+            the Lundberg exponent, i.e. the negative root of E[exp(tilt * X)] = 1,
+            which is asymptotically optimal for rare ruin events. A tilt of 0
+            reduces to plain Monte Carlo
+
+        """
+        outcomes = np.asarray(round_outcomes, dtype=float)
+        if outcomes.size == 0:
+            raise ValueError('At least one round outcome is required.')
+
+        self._values, counts = np.unique(outcomes, return_counts=True)
+        self._probabilities = counts / counts.sum()
+        self._tilt = self._lundberg_exponent() if tilt is None else tilt
+        self._log_mgf = self._log_moment_generating_function(self._tilt)
+        tilted = np.log(self._probabilities) + self._tilt * self._values - self._log_mgf
+        self._tilted_probabilities = np.exp(tilted)
+        self._tilted_probabilities /= self._tilted_probabilities.sum()
+
+    @property
+    def ev_per_round(self) -> float:
+        return float(np.dot(self._probabilities, self._values))
+
+    @property
+    def tilt(self) -> float:
+        return self._tilt
+
+    def _log_moment_generating_function(self, tilt: float) -> float:
+        exponents = np.log(self._probabilities) + tilt * self._values
+        largest = exponents.max()
+        return float(largest + np.log(np.exp(exponents - largest).sum()))
+
+    def _lundberg_exponent(self) -> float:
+        if self.ev_per_round <= 0 or self._values.min() >= 0:
+            return 0.0
+
+        # the log moment generating function is convex, zero at the origin and
+        # decreasing there, so it has exactly one negative root
+        low = -1 / np.abs(self._values).max()
+        while self._log_moment_generating_function(low) < 0:
+            low *= 2
+        high = 0.0
+        for _ in range(200):
+            middle = (low + high) / 2
+            if self._log_moment_generating_function(middle) < 0:
+                high = middle
+            else:
+                low = middle
+        return float(low)
+
+    def _ruin_weights(
+        self,
+        rng: np.random.Generator,
+        number_of_sessions: int,
+        ruin_level: float | int,
+        goal_level: float | int,
+        rounds: int | None,
+        block_size: int
+    ) -> np.ndarray:
+        """Likelihood ratio of every ruined session, and 0 for every other session."""
+        weights = np.zeros(number_of_sessions)
+        position = np.zeros(number_of_sessions)
+        active = np.arange(number_of_sessions)
+        elapsed = 0
+
+        while active.size:
+            steps = block_size if rounds is None else min(block_size, rounds - elapsed)
+            if steps <= 0:
+                break
+
+            draws = rng.choice(self._values, size=(active.size, steps), p=self._tilted_probabilities)
+            paths = position[active, None] + np.cumsum(draws, axis=1)
+            ruined = paths <= ruin_level
+            reached_goal = paths >= goal_level
+            ruin_step = np.where(ruined.any(axis=1), ruined.argmax(axis=1), steps)
+            goal_step = np.where(reached_goal.any(axis=1), reached_goal.argmax(axis=1), steps)
+
+            ruined_now = ruin_step < goal_step
+            sessions = active[ruined_now]
+            ruin_position = paths[ruined_now, ruin_step[ruined_now]]
+            ruin_time = elapsed + ruin_step[ruined_now] + 1
+            # likelihood ratio of the path: prod p(x) / q(x) = M(tilt) ** t * exp(-tilt * S_t)
+            weights[sessions] = np.exp(ruin_time * self._log_mgf - self._tilt * ruin_position)
+
+            position[active] = paths[:, -1]
+            active = active[(ruin_step == steps) & (goal_step == steps)]
+            elapsed += steps
+        return weights
+
+    def estimate(
+        self,
+        bankroll: float | int,
+        rounds: int | None = None,
+        number_of_sessions: int = 10_000,
+        bankroll_goal: float | int | None = None,
+        confidence: float = 0.95,
+        seed: int | None = None,
+        block_size: int = 1_024,
+        batch_size: int = 10_000
+    ) -> ImportanceSamplingResult:
+        """
+        Estimates the probability that a session loses the entire bankroll.
+
+        Parameters
+        ----------
+        bankroll
+            Bankroll available at the start of each session
+        rounds
+            Maximum number of rounds in a session. If None, sessions last
+            until ruin or until the bankroll goal is reached, so without a
+            bankroll goal the tilted round outcomes must have a negative mean
+        number_of_sessions
+            Number of simulated sessions
+        bankroll_goal
+            Bankroll at which a session stops without ruin, if any
+        confidence
+            Confidence level of the reported interval
+        seed
+            Seed for the random number generator
+        block_size
+            Number of rounds drawn at once for every active session
+        batch_size
+            Maximum number of sessions simulated at once, so at most
+            batch_size * block_size rounds are held in memory
+
+        """
+        if batch_size < 1:
+            raise ValueError('Batch size must be at least 1.')
+        if bankroll <= 0:
+            return ImportanceSamplingResult(1.0, 0.0, 1.0, 1.0, number_of_sessions, self._tilt)
+        if rounds is None and bankroll_goal is None and self._tilt == 0:
+            if self._values.min() >= 0:
+                return ImportanceSamplingResult(0.0, 0.0, 0.0, 0.0, number_of_sessions, 0.0)
+            if self.ev_per_round > 0:
+                raise ValueError('Unlimited sessions with a positive EV require a negative tilt.')
+            # an untilted walk with a non-positive drift is ruined with certainty
+            return ImportanceSamplingResult(1.0, 0.0, 1.0, 1.0, number_of_sessions, 0.0)
+        if rounds is None and bankroll_goal is None and np.dot(self._tilted_probabilities, self._values) >= 0:
+            # sessions only end at ruin, which a tilted walk without a negative drift may never reach
+            raise ValueError('Unlimited sessions require a tilt that gives the round outcomes a negative mean.')
+
+        rng = np.random.default_rng(seed)
+        goal_level = bankroll_goal - bankroll if bankroll_goal is not None else inf
+        weights = np.concatenate([
+            self._ruin_weights(
+                rng=rng,
+                number_of_sessions=min(batch_size, number_of_sessions - first),
+                ruin_level=-bankroll,
+                goal_level=goal_level,
+                rounds=rounds,
+                block_size=block_size
+            )
+            for first in range(0, number_of_sessions, batch_size)
+        ])
+
+        risk_of_ruin = float(weights.mean())
+        standard_error = float(weights.std(ddof=1) / sqrt(number_of_sessions)) if number_of_sessions > 1 else 0.0
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        return ImportanceSamplingResult(
+            risk_of_ruin=risk_of_ruin,
+            standard_error=standard_error,
+            lower=max(risk_of_ruin - z * standard_error, 0.0),
+            upper=min(risk_of_ruin + z * standard_error, 1.0),
+            number_of_sessions=number_of_sessions,
+            tilt=self._tilt
+        )
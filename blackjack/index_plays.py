@@ -0,0 +1,191 @@
+from functools import lru_cache
+from typing import Callable
+from blackjack.enums import CardCountingSystem
+from blackjack.hand import Hand
+from blackjack.playing_strategy import PlayingStrategy
+from blackjack.source.index_plays import INDEX_PLAYS, INSURANCE_INDICES, SURRENDER_INDICES
+
+
+TEN_CARDS = ('10', 'J', 'Q', 'K')
+
+# a cell is either a decision or (index, cell at or above the index, cell below the index)
+Cell = str | tuple
+
+
+def _expand(card: str) -> tuple[str, ...]:
+    return TEN_CARDS if card == '10' else (card,)
+
+
+def _resolve(cell: Cell, count: float | int) -> str:
+    while type(cell) is tuple:
+        index, at_or_above, below = cell
+        cell = at_or_above if count >= index else below
+    return cell
+
+
+def _surrender(cell: Cell) -> Cell:
+    """
+    Surrender if allowed, otherwise play the cell. There is no code for
+    surrendering, otherwise doubling, so doubles fall back to what they do
+    when doubling is not allowed.
+
+    """
+    if type(cell) is tuple:
+        return cell[0], _surrender(cell[1]), _surrender(cell[2])
+    if cell.startswith('R'):
+        return cell
+    return 'R' + (cell[1] if cell.startswith('D') else cell[0].lower())
+
+
+def _no_surrender(cell: Cell) -> Cell:
+    if type(cell) is tuple:
+        return cell[0], _no_surrender(cell[1]), _no_surrender(cell[2])
+    return cell[1].upper() if cell.startswith('R') else cell
+
+
+@lru_cache(maxsize=None)
+def _compile(
+    card_counting_system: CardCountingSystem,
+    s17: bool,
+    plays: tuple[tuple, ...],
+    surrenders: tuple[tuple, ...]
+) -> tuple[dict[tuple, Cell], dict[tuple, Cell]]:
+    """
+    Compiles index plays into cells keyed by (hand type, hand, dealer up card). The
+    first dictionary applies to a player's first two cards, when surrender is possible,
+    and the second one applies to every other decision.
+
+    """
+    playing_strategy = PlayingStrategy(s17=s17)
+    basic_strategy = {'hard': playing_strategy.hard, 'soft': playing_strategy.soft}
+
+    def basic(hand_type: str, hand: int | str, dealer_up_card: str) -> str:
+        if hand_type == 'pair':
+            return playing_strategy.pair(card=hand, dealer_up_card=dealer_up_card)
+        return basic_strategy[hand_type](total=hand, dealer_up_card=dealer_up_card)
+
+    cells: dict[tuple, Cell] = {}
+    for hand_type, hand, dealer_up_card, index, at_or_above, below in plays:
+        for hand_key in (_expand(hand) if hand_type == 'pair' else (hand,)):
+            for up_card in _expand(dealer_up_card):
+                cells[(hand_type, hand_key, up_card)] = (index, at_or_above, below)
+
+    surrender_indices: dict[tuple, float | int] = {}
+    for hand_type, hand, dealer_up_card, index in surrenders:
+        for hand_key in (_expand(hand) if hand_type == 'pair' else (hand,)):
+            for up_card in _expand(dealer_up_card):
+                surrender_indices[(hand_type, hand_key, up_card)] = index
+
+    initial_cells: dict[tuple, Cell] = {}
+    for key in set(cells) | set(surrender_indices):
+        cell = cells.get(key, _no_surrender(basic(*key)))
+        if key in surrender_indices:
+            initial_cells[key] = (surrender_indices[key], _surrender(cell), _no_surrender(cell))
+        elif basic(*key).startswith('R'):
+            # basic strategy always surrenders this hand
+            initial_cells[key] = _surrender(cell)
+        else:
+            initial_cells[key] = cell
+
+    return initial_cells, cells
+
+
+class IndexPlays:
+    """
+    Represents the count-based deviations from basic strategy
+    (index plays) used by a card counter.
+
+    """
+    def __init__(
+        self,
+        s17: bool,
+        card_counting_system: CardCountingSystem = CardCountingSystem.HI_LO,
+        plays: list[tuple] | None = None,
+        surrenders: list[tuple] | None = None,
+        insurance: float | int | None = None
+    ):
+        """
+        Parameters
+        ----------
+        s17
+            True if dealer stands on a soft 17, False otherwise
+        card_counting_system
+            Card counting system the indices are expressed in
+        plays
+            List of (hand type, hand, dealer up card, index, decision at or
+            above the index, decision below the index). Defaults to the
+            Illustrious 18 for the card counting system
+        surrenders
+            List of (hand type, hand, dealer up card, index) at or above which
+            the hand is surrendered. Defaults to the Fab 4 for the card
+            counting system
+        insurance
+            Minimum count at which insurance is taken. Defaults to the
+            insurance index for the card counting system
+
+        Index plays are built in for Hi-Lo only. Other card counting systems
+        must pass plays, surrenders and insurance.
+
+        """
+        if plays is None or surrenders is None or insurance is None:
+            if (card_counting_system, s17) not in INDEX_PLAYS:
+                raise ValueError(
+                    f'No index plays are available for the {card_counting_system.value} system. '
+                    'Pass plays, surrenders and insurance for it.'
+                )
+            plays = INDEX_PLAYS[(card_counting_system, s17)] if plays is None else plays
+            surrenders = SURRENDER_INDICES[(card_counting_system, s17)] if surrenders is None else surrenders
+            insurance = INSURANCE_INDICES[card_counting_system] if insurance is None else insurance
+
+        self._card_counting_system = card_counting_system
+        self._initial_cells, self._cells = _compile(
+            card_counting_system=card_counting_system,
+            s17=s17,
+            plays=tuple(tuple(play) for play in plays),
+            surrenders=tuple(tuple(surrender) for surrender in surrenders)
+        )
+        self._insurance = insurance
+
+    @property
+    def card_counting_system(self) -> CardCountingSystem:
+        return self._card_counting_system
+
+    @property
+    def insurance(self) -> float | int:
+        return self._insurance
+
+    def decision(
+        self,
+        playing_strategy: PlayingStrategy,
+        hand: Hand,
+        dealer_up_card: str,
+        count: float | int | Callable[[], float | int],
+        split_allowed: bool
+    ) -> str:
+        """
+        Returns the decision for a hand at the given count. Hands without an
+        index play fall back to the playing strategy. count may be a callable
+        returning the count, which is only called for hands with an index play.
+
+        """
+        if split_allowed:
+            key = ('pair', hand.cards[0], dealer_up_card)
+        elif hand.is_soft:
+            key = ('soft', hand.total, dealer_up_card)
+        else:
+            key = ('hard', hand.total, dealer_up_card)
+
+        if hand.number_of_cards == 2 and not (hand.is_split or hand.was_split):
+            cell = self._initial_cells.get(key)
+        else:
+            cell = self._cells.get(key)
+
+        if cell is None:
+            if split_allowed:
+                return playing_strategy.pair(card=hand.cards[0], dealer_up_card=dealer_up_card)
+            if key[0] == 'soft':
+                return playing_strategy.soft(total=key[1], dealer_up_card=dealer_up_card)
+            return playing_strategy.hard(total=key[1], dealer_up_card=dealer_up_card)
+        if type(cell) is tuple and callable(count):
+            count = count()
+        return _resolve(cell, count)
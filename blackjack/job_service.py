@@ -0,0 +1,319 @@
+import argparse
+import asyncio
+import concurrent.futures
+import json
+import multiprocessing as mp
+import os
+import time
+from collections import Counter
+from itertools import count
+from pathlib import Path
+from typing import Any
+from blackjack.config import check_config, chunk_runs, run_chunk, simulation_params
+from blackjack.enums import JobStatus, RunOutcome
+from blackjack.winnings_distribution import WinningsDistribution
+
+
+HTTP_REASONS = {200: 'OK', 202: 'Accepted', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+
+class Job:
+    """A simulation job: a configuration and its results so far."""
+    def __init__(self, job_id: str, config: dict[str, Any]):
+        params = simulation_params(config=config)
+        self._id = job_id
+        self._config = config
+        self._status = JobStatus.QUEUED
+        self._error: str | None = None
+        self._number_of_runs = params['number_of_runs']
+        self._runs_completed = 0
+        self._outcome_counts: Counter = Counter()
+        self._total_winnings = 0
+        self._total_hands = 0
+        self._winnings_distribution = WinningsDistribution()
+        self._submitted_at = time.time()
+        self._finished_at: float | None = None
+        self._updated = asyncio.Event()
+
+    @property
+    def id(self) -> str:
+        return self._id
+
+    @property
+    def config(self) -> dict[str, Any]:
+        return self._config
+
+    @property
+    def status(self) -> JobStatus:
+        return self._status
+
+    @property
+    def is_finished(self) -> bool:
+        return self._status in {JobStatus.COMPLETED, JobStatus.FAILED}
+
+    def _notify(self) -> None:
+        # waiters hold the previous event, so a fresh one is armed for the next update
+        self._updated.set()
+        self._updated = asyncio.Event()
+
+    def start(self) -> None:
+        self._status = JobStatus.RUNNING
+        self._notify()
+
+    def add_chunk(self, summary: tuple, number_of_runs: int) -> None:
+        outcome_counts, total_winnings, total_hands, winnings_distribution, _ = summary
+        self._runs_completed += number_of_runs
+        self._outcome_counts.update(outcome_counts)
+        self._total_winnings += total_winnings
+        self._total_hands += total_hands
+        self._winnings_distribution.merge(winnings_distribution)
+        self._notify()
+
+    def finish(self, error: str | None = None) -> None:
+        self._status = JobStatus.FAILED if error else JobStatus.COMPLETED
+        self._error = error
+        self._finished_at = time.time()
+        self._notify()
+
+    @property
+    def updated(self) -> asyncio.Event:
+        """Event set at the next change of status or progress."""
+        return self._updated
+
+    def summary(self) -> dict[str, Any]:
+        """Status, progress and the results of every run completed so far."""
+        summary = {
+            'id': self._id,
+            'status': self._status.value,
+            'runs_completed': self._runs_completed,
+            'number_of_runs': self._number_of_runs,
+            'submitted_at': self._submitted_at,
+            'finished_at': self._finished_at
+        }
+        if self._error:
+            summary['error'] = self._error
+        if self._runs_completed:
+            p05, p20, p50, p80, p95 = self._winnings_distribution.percentiles([5, 20, 50, 80, 95]).tolist()
+            summary['results'] = {
+                'bankrupt_count': self._outcome_counts[RunOutcome.BANKRUPT.value],
+                'goal_count': self._outcome_counts[RunOutcome.GOAL.value],
+                'ran_out_count': self._outcome_counts[RunOutcome.RAN_OUT.value],
+                'average_winnings': self._total_winnings / self._runs_completed,
+                'winnings_percentiles': {'5': p05, '20': p20, '50': p50, '80': p80, '95': p95},
+                'total_hands_played': self._total_hands,
+                'risk_of_ruin': self._outcome_counts[RunOutcome.BANKRUPT.value] / self._runs_completed
+            }
+        return summary
+
+
+class JobService:
+    """
+    Queues simulation jobs submitted over a local HTTP API and runs them
+    in order on a process pool shared by every job.
+
+    Chunks of runs from the oldest job are submitted first, and the next
+    job starts filling the pool as soon as every chunk of the previous job
+    has been submitted. Every chunk is merged as soon as the chunks before
+    it are, so progress and partial results are available while a job runs,
+    and finished results are optionally written to disk.
+
+    Endpoints: POST /jobs (a configuration, see blackjack.config), GET /jobs,
+    GET /jobs/{id} and GET /jobs/{id}/events, which streams a line of JSON
+    after every completed chunk until the job finishes.
+
+    """
+    def __init__(self, max_workers: int | None = None, results_directory: str | Path | None = None):
+        """
+        Parameters
+        ----------
+        max_workers
+            Number of worker processes shared by every job. Defaults to the
+            number of CPUs
+        results_directory
+            Directory the results of every finished job are written to as
+            {id}.json, if desired
+
+        """
+        self._max_workers = max_workers or os.cpu_count() or 2
+        self._results_directory = Path(results_directory) if results_directory else None
+        self._jobs: dict[str, Job] = {}
+        self._job_ids = count(1)
+        self._queue: asyncio.Queue | None = None
+        self._slots: asyncio.Semaphore | None = None
+        self._executor: concurrent.futures.Executor | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._server: asyncio.AbstractServer | None = None
+
+    @property
+    def jobs(self) -> list[Job]:
+        return list(self._jobs.values())
+
+    def job(self, job_id: str) -> Job | None:
+        return self._jobs.get(job_id)
+
+    @property
+    def address(self) -> Any:
+        return self._server.sockets[0].getsockname()
+
+    async def start(self, host: str = '127.0.0.1', port: int = 0, path: str | None = None) -> None:
+        """Starts the scheduler and listens on a TCP port or, if path is given, a Unix socket."""
+        try:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._max_workers, mp_context=mp.get_context('fork')
+            )
+        except PermissionError:
+            # Some environments forbid process pools; fall back to threads.
+            self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=self._max_workers)
+        # forked workers are started before listening, so they never inherit a client's socket
+        await asyncio.get_running_loop().run_in_executor(self._executor, int)
+        self._queue = asyncio.Queue()
+        # keeps a chunk queued behind every running chunk without flooding the pool
+        self._slots = asyncio.Semaphore(2 * self._max_workers)
+        self._spawn(self._schedule())
+        if path:
+            self._server = await asyncio.start_unix_server(self._handle, path=path)
+        else:
+            self._server = await asyncio.start_server(self._handle, host=host, port=port)
+
+    async def close(self) -> None:
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._executor:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _spawn(self, coroutine) -> None:
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def submit(self, config: dict[str, Any]) -> Job:
+        """Validates a configuration and seats its player at its table, then queues it."""
+        check_config(config=config)
+        job = Job(job_id=str(next(self._job_ids)), config=config)
+        self._jobs[job.id] = job
+        self._queue.put_nowait(job)
+        return job
+
+    async def _schedule(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            job = await self._queue.get()
+            job.start()
+            # the collector merges every chunk while the rest of the job is still being submitted
+            chunks: asyncio.Queue = asyncio.Queue()
+            self._spawn(self._collect(job=job, chunks=chunks))
+            for first_seed, runs in chunk_runs(config=job.config):
+                await self._slots.acquire()
+                if job.is_finished:
+                    # a chunk failed, so the rest of the job is not submitted
+                    self._slots.release()
+                    break
+                future = loop.run_in_executor(self._executor, run_chunk, job.config, first_seed, runs)
+                future.add_done_callback(lambda _: self._slots.release())
+                chunks.put_nowait((future, runs))
+            chunks.put_nowait(None)
+
+    async def _collect(self, job: Job, chunks: asyncio.Queue) -> None:
+        try:
+            # chunks are merged in order, so results match bankroll_simulator for the same seeds
+            while (chunk := await chunks.get()) is not None:
+                future, runs = chunk
+                job.add_chunk(summary=await future, number_of_runs=runs)
+        except Exception as e:
+            job.finish(error=f'{type(e).__name__}: {e}')
+            while not chunks.empty():
+                chunk = chunks.get_nowait()
+                if chunk is not None:
+                    chunk[0].cancel()
+        else:
+            job.finish()
+        if self._results_directory:
+            self._results_directory.mkdir(parents=True, exist_ok=True)
+            with open(self._results_directory / f'{job.id}.json', 'w') as f:
+                json.dump({**job.summary(), 'config': job.config}, f, indent=2)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            method, target, _ = (await reader.readline()).decode().split(' ', 2)
+            content_length = 0
+            while (line := await reader.readline()) not in {b'\r\n', b'\n', b''}:
+                name, _, value = line.decode().partition(':')
+                if name.strip().lower() == 'content-length':
+                    content_length = int(value)
+            body = await reader.readexactly(content_length) if content_length else b''
+            await self._route(method=method, path=target.rstrip('/').split('?')[0], body=body, writer=writer)
+        except (ValueError, ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, body: bytes, writer: asyncio.StreamWriter) -> None:
+        parts = path.strip('/').split('/')
+        if parts == ['jobs']:
+            if method == 'GET':
+                return await _respond(writer, 200, [job.summary() for job in self._jobs.values()])
+            if method != 'POST':
+                return await _respond(writer, 405, {'error': 'Only GET and POST are allowed.'})
+            try:
+                job = self.submit(config=json.loads(body))
+            except ValueError as e:
+                return await _respond(writer, 400, {'error': str(e)})
+            return await _respond(writer, 202, job.summary())
+
+        job = self._jobs.get(parts[1]) if len(parts) in {2, 3} and parts[0] == 'jobs' else None
+        if job is None or (len(parts) == 3 and parts[2] != 'events'):
+            return await _respond(writer, 404, {'error': 'Not found.'})
+        if method != 'GET':
+            return await _respond(writer, 405, {'error': 'Only GET is allowed.'})
+        if len(parts) == 2:
+            return await _respond(writer, 200, job.summary())
+
+        writer.write(b'HTTP/1.1 200 OK\r\nContent-Type: application/x-ndjson\r\nConnection: close\r\n\r\n')
+        while True:
+            updated = job.updated
+            writer.write(json.dumps(job.summary()).encode() + b'\n')
+            await writer.drain()
+            if job.is_finished:
+                return
+            await updated.wait()
+
+
+async def _respond(writer: asyncio.StreamWriter, status: int, payload: Any) -> None:
+    body = json.dumps(payload).encode()
+    writer.write(
+        f'HTTP/1.1 {status} {HTTP_REASONS[status]}\r\nContent-Type: application/json\r\n'
+        f'Content-Length: {len(body)}\r\nConnection: close\r\n\r\n'.encode() + body
+    )
+    await writer.drain()
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    service = JobService(max_workers=args.workers, results_directory=args.results_directory)
+    await service.start(host=args.host, port=args.port, path=args.unix_socket)
+    print(f'Serving simulation jobs on {args.unix_socket or "http://%s:%s" % service.address[:2]}')
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await service.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description='Queue simulation jobs on a shared process pool.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--unix-socket', help='listen on a Unix socket instead of a TCP port')
+    parser.add_argument('--workers', type=int, help='worker processes shared by every job (default: CPU count)')
+    parser.add_argument('--results-directory', help='directory finished results are written to')
+    try:
+        asyncio.run(_serve(parser.parse_args(argv)))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    main()
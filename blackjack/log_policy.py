@@ -0,0 +1,81 @@
+from typing import Iterable
+from blackjack.enums import RoundAction
+from blackjack.player import Player
+from blackjack.shoe import Shoe
+
+
+class LogPolicy:
+    """
+    Represents which rounds and players a round log keeps, so the cost of
+    logging is proportional to what is inspected. Every condition given
+    must hold for a player's round to be logged.
+
+    play_round asks the policy before any log record is built, so rounds
+    that are not logged cost a counter and a few comparisons. Sampling
+    takes every nth round rather than drawing random numbers, so a logged
+    simulation deals exactly the same cards as an unlogged one.
+
+    """
+    def __init__(
+        self,
+        every: int = 1,
+        min_count: float | int | None = None,
+        players: Iterable[str] | None = None,
+        shoe_ids: Iterable[str] | None = None,
+        actions: Iterable[RoundAction] | None = None
+    ):
+        """
+        Parameters
+        ----------
+        every
+            Logs one round in every, starting with the first round
+        min_count
+            Logs only players whose absolute betting count (the true count for
+            balanced systems) is at least min_count, so players who do not
+            count cards are not logged
+        players
+            Names of the players to log
+        shoe_ids
+            Ids of the shoes to log
+        actions
+            Logs only players who made one of these actions in the round,
+            e.g. RoundAction.SPLIT
+
+        """
+        if every < 1:
+            raise ValueError('Every must be at least 1.')
+        if min_count is not None and min_count < 0:
+            raise ValueError('Minimum count must be greater than or equal to 0.')
+        self._every = every
+        self._min_count = min_count
+        self._players = None if players is None else frozenset(players)
+        self._shoe_ids = None if shoe_ids is None else frozenset(shoe_ids)
+        self._actions = frozenset(RoundAction(action) for action in actions or ())
+        self._rounds = 0
+
+    @property
+    def rounds(self) -> int:
+        """Rounds the policy has been asked about."""
+        return self._rounds
+
+    def log_round(self, shoe: Shoe) -> bool:
+        """Called once for every round played. True if any player of the round may be logged."""
+        self._rounds += 1
+        if (self._rounds - 1) % self._every:
+            return False
+        return self._shoe_ids is None or shoe.shoe_id in self._shoe_ids
+
+    def log_player(self, player: Player, count: float | int | None, placed_bet: float | int) -> bool:
+        """True if a player's round is logged, after the round is played."""
+        if self._players is not None and player.name not in self._players:
+            return False
+        if self._min_count is not None and (count is None or abs(count) < self._min_count):
+            return False
+        if self._actions:
+            hands = player.hands
+            return (
+                (RoundAction.SPLIT in self._actions and len(hands) > 1)
+                or (RoundAction.DOUBLE in self._actions and any(hand.total_bet > placed_bet for hand in hands))
+                or (RoundAction.INSURANCE in self._actions and hands[0].insurance_bet > 0)
+            )
+        return True
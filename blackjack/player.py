@@ -1,4 +1,5 @@
-from typing import Any
+from typing import Any, Callable
+from blackjack.enums import RunOutcome
 from blackjack.hand import Hand
 from blackjack.playing_strategy import PlayingStrategy
 from blackjack.stats import Stats, Variance
@@ -51,6 +52,8 @@ class Player:
         self._stats = Stats()
         self._variance = Variance(bankroll)
         self._is_ruined = False
+        self._round_listeners: list[Callable[[float | int], None]] = []
+        self._shoe_listeners: list[Callable[[float | int], None]] = []
 
     @property
     def name(self) -> str:
@@ -98,8 +101,31 @@ class Player:
     def is_ruined(self) -> bool:
         return self._is_ruined
 
+    @property
+    def run_outcome(self) -> RunOutcome:
+        """How the player's run ended: bankrupt, with the bankroll goal reached, or by running out of shoes."""
+        if self._is_ruined:
+            return RunOutcome.BANKRUPT
+        if self._bankroll_goal_reached:
+            return RunOutcome.GOAL
+        return RunOutcome.RAN_OUT
+
+    def add_round_listener(self, listener: Callable[[float | int], None]) -> None:
+        """Register a callable that receives the player's bankroll at the end of every round played."""
+        self._round_listeners.append(listener)
+
+    def add_shoe_listener(self, listener: Callable[[float | int], None]) -> None:
+        """Register a callable that receives the player's bankroll at the end of every shoe played."""
+        self._shoe_listeners.append(listener)
+
     def update_aggregate(self, bankroll: float | int) -> None:
         self._variance.update_aggregate(bankroll)
+        for listener in self._round_listeners:
+            listener(bankroll)
+
+    def end_shoe(self) -> None:
+        for listener in self._shoe_listeners:
+            listener(self._bankroll)
     
     def adjust_bankroll(self, amount: float | int) -> None:
         self._bankroll += amount
@@ -113,7 +139,14 @@ class Player:
         return hand.number_of_cards == 2 and (hand.cards[0] == hand.cards[1]) and \
             len(self._hands) < max_hands and self.has_sufficient_bankroll(amount=hand.total_bet)
 
-    def decision(self, playing_strategy: PlayingStrategy, hand: Hand, dealer_up_card: str, max_hands: int) -> str:
+    def decision(
+        self,
+        playing_strategy: PlayingStrategy,
+        hand: Hand,
+        dealer_up_card: str,
+        max_hands: int,
+        **kwargs: Any
+    ) -> str:
         if self._is_split_allowed(hand=hand, max_hands=max_hands):
             return playing_strategy.pair(card=hand.cards[0], dealer_up_card=dealer_up_card)
         if hand.is_soft:
@@ -1,5 +1,4 @@
-from blackjack.source.basic_strategy import H17_HARD_DICT, H17_SOFT_DICT, H17_PAIR_DICT
-from blackjack.source.basic_strategy import S17_HARD_DICT, S17_SOFT_DICT, S17_PAIR_DICT
+from blackjack.source.basic_strategy import strategy_tables
 
 
 class PlayingStrategy:
@@ -17,14 +16,7 @@ class PlayingStrategy:
             True if dealer stands on a soft 17, False otherwise
 
         """
-        if s17:
-            self._hard_dict = S17_HARD_DICT
-            self._soft_dict = S17_SOFT_DICT
-            self._pair_dict = S17_PAIR_DICT
-        else:
-            self._hard_dict = H17_HARD_DICT
-            self._soft_dict = H17_SOFT_DICT
-            self._pair_dict = H17_PAIR_DICT
+        self._hard_dict, self._soft_dict, self._pair_dict = strategy_tables(s17=s17)
 
     def hard(self, total: int, dealer_up_card: str) -> str:
         return self._hard_dict[total][dealer_up_card]
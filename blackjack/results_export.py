@@ -0,0 +1,284 @@
+import json
+from collections import defaultdict
+from itertools import islice
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+import numpy as np
+from blackjack.count_report import count_sums
+from blackjack.enums import StatsCategory
+from blackjack.stats import Stats
+
+FORMATS = ('parquet', 'npz')
+
+# the totals across insurance and regular bets are derived in Stats.summary, never recorded per count
+STATS_CATEGORIES = tuple(
+    category for category in StatsCategory
+    if category not in (StatsCategory.TOTAL_AMOUNT_BET, StatsCategory.TOTAL_NET_WINNINGS)
+)
+
+
+# columns of the rounds table and their dtypes, in the order of the JSON round log
+ROUNDS_COLUMNS: dict[str, type] = {
+    'run': np.int64,
+    'shoe_id': str,
+    'player': str,
+    'dealer_hand': str,
+    'dealer_blackjack': bool,
+    'count': float,
+    'insurance_count': float,
+    'player_hands': str,
+    'bet': float,
+    'bankroll_start': float,
+    'bankroll_end': float
+}
+
+
+def _has_pyarrow() -> bool:
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def default_format() -> str:
+    """Parquet when pyarrow is installed, npz otherwise."""
+    return 'parquet' if _has_pyarrow() else 'npz'
+
+
+class ResultsWriter:
+    """
+    Streams tables of simulation results to a directory of columnar files,
+    one chunk of rows at a time, so a run never holds more than a chunk.
+
+    With Parquet, every table is a single file <table>.parquet with a row
+    group per chunk. Without pyarrow, every chunk of a table is written to
+    its own part file <table>/part-00000.npz. Either way, read_table loads a
+    table back as NumPy columns.
+
+    """
+    def __init__(self, path: str | Path, format: str | None = None):
+        """
+        Parameters
+        ----------
+        path
+            Directory the tables are written to, created if it does not exist
+        format
+            'parquet' or 'npz', by default Parquet when pyarrow is installed
+
+        """
+        format = default_format() if format is None else format
+        if format not in FORMATS:
+            raise ValueError(f'Format must be one of {", ".join(FORMATS)}.')
+        if format == 'parquet' and not _has_pyarrow():
+            raise ImportError('Parquet export requires pyarrow.')
+        self._path = Path(path)
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._format = format
+        self._parquet_writers: dict[str, Any] = {}
+        self._parts: defaultdict[str, int] = defaultdict(int)
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def format(self) -> str:
+        return self._format
+
+    def write(self, table: str, columns: dict[str, np.ndarray]) -> None:
+        """Appends a chunk of rows, given as equally long columns, to a table."""
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError('Every column of a chunk must have the same length.')
+        if not lengths or lengths == {0}:
+            return
+
+        if self._format == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            chunk = pa.table(columns)
+            writer = self._parquet_writers.get(table)
+            if writer is None:
+                writer = self._parquet_writers[table] = pq.ParquetWriter(self._path / f'{table}.parquet', chunk.schema)
+            writer.write_table(chunk.cast(writer.schema))
+        else:
+            directory = self._path / table
+            directory.mkdir(exist_ok=True)
+            np.savez(directory / f'part-{self._parts[table]:05}.npz', **columns)
+        self._parts[table] += 1
+
+    def write_stats(self, stats: Stats, run: int = 0, player: str = '') -> None:
+        """Appends the per-count results of a player to the count_stats table."""
+        self.write(table='count_stats', columns=stats_columns(stats=stats, run=run, player=player))
+
+    def write_rounds(self, round_log: 'RoundLog') -> None:
+        """Appends the rows buffered by a RoundLog to the rounds table and clears the buffer."""
+        self.write(table='rounds', columns=round_log.columns())
+        round_log.clear()
+
+    def write_round_log(self, logfile: str | Path, run: int = 0, batch_size: int = 100_000) -> None:
+        """Appends a JSON round log written to a _logfile to the rounds table, batch_size log lines at a time."""
+        for columns in round_log_columns(logfile=logfile, run=run, batch_size=batch_size):
+            self.write(table='rounds', columns=columns)
+
+    def close(self) -> None:
+        for writer in self._parquet_writers.values():
+            writer.close()
+        self._parquet_writers.clear()
+
+    def __enter__(self) -> 'ResultsWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_table(path: str | Path, table: str) -> dict[str, np.ndarray]:
+    """Loads a table written by a ResultsWriter in either format as NumPy columns."""
+    path = Path(path)
+    parquet_path = path / f'{table}.parquet'
+    if parquet_path.exists():
+        import pyarrow.parquet as pq
+
+        data = pq.read_table(parquet_path)
+        return {name: data.column(name).to_numpy() for name in data.column_names}
+
+    parts = sorted((path / table).glob('part-*.npz'))
+    if not parts:
+        raise FileNotFoundError(f'There is no {table} table in {path}.')
+    chunks = []
+    for part in parts:
+        with np.load(part) as columns:
+            chunks.append({name: columns[name] for name in columns.files})
+    return concat_columns(chunks=chunks)
+
+
+def concat_columns(chunks: Sequence[dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+    """Combines chunks of rows with the same columns into one."""
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}
+
+
+def run_columns(
+    runs: Sequence[int],
+    players: Sequence[str],
+    outcomes: Sequence[str],
+    winnings: Sequence[float],
+    hands_played: Sequence[int],
+    variance_reduction_factors: Sequence[float | None]
+) -> dict[str, np.ndarray]:
+    """Columns of the runs table, with a row per player and run. A missing variance reduction factor is NaN."""
+    return {
+        'run': np.asarray(runs, dtype=np.int64),
+        'player': np.asarray(players, dtype=str),
+        'outcome': np.asarray(outcomes, dtype=str),
+        'winnings': np.asarray(winnings, dtype=float),
+        'hands_played': np.asarray(hands_played, dtype=np.int64),
+        'variance_reduction_factor': np.array(
+            [np.nan if factor is None else factor for factor in variance_reduction_factors], dtype=float
+        )
+    }
+
+
+def stats_columns(stats: Stats, run: int = 0, player: str = '') -> dict[str, np.ndarray]:
+    """
+    Columns of the count_stats table, with a row per count: the count (NaN
+    for rounds played without one), a column per StatsCategory, the round
+    winnings and the squared round winnings.
+
+    """
+    counts, sums = count_sums(stats=stats, categories=STATS_CATEGORIES)
+    names = [category.name.lower() for category in STATS_CATEGORIES] + ['round_winnings', 'squared_winnings']
+    return {
+        'run': np.full(len(counts), run, dtype=np.int64),
+        'player': np.full(len(counts), player, dtype=f'<U{max(len(player), 1)}'),
+        'count': counts,
+        **{name: sums[:, column] for column, name in enumerate(names)}
+    }
+
+
+class RoundLog:
+    """
+    Buffers the rows of the rounds table as columns while rounds are played,
+    so a simulation exports its rounds without writing and re-parsing a JSON
+    round log. Blackjack.simulate and simulate_csm append the rounds a
+    LogPolicy keeps when given one as _round_log, and
+    ResultsWriter.write_rounds writes the buffered rows and clears them.
+    Cards are separated by commas and a player's hands by '|', and a missing
+    count or bet is NaN.
+
+    """
+    def __init__(self, run: int = 0):
+        """
+        Parameters
+        ----------
+        run
+            Run the rounds appended next belong to
+
+        """
+        self._run = run
+        self._columns: dict[str, list[Any]] = {name: [] for name in ROUNDS_COLUMNS}
+
+    @property
+    def run(self) -> int:
+        return self._run
+
+    @run.setter
+    def run(self, run: int) -> None:
+        self._run = run
+
+    def __len__(self) -> int:
+        return len(self._columns['run'])
+
+    def append(
+        self,
+        shoe_id: str,
+        player: str,
+        dealer_hand: list[str],
+        dealer_blackjack: bool,
+        count: float | int | None,
+        insurance_count: float | int | None,
+        player_hands: list[list[str]],
+        bet: float | int | None,
+        bankroll_start: float | int,
+        bankroll_end: float | int
+    ) -> None:
+        """Appends a row for a player's round."""
+        columns = self._columns
+        columns['run'].append(self._run)
+        columns['shoe_id'].append(shoe_id)
+        columns['player'].append(player)
+        columns['dealer_hand'].append(','.join(dealer_hand))
+        columns['dealer_blackjack'].append(dealer_blackjack)
+        columns['count'].append(np.nan if count is None else count)
+        columns['insurance_count'].append(np.nan if insurance_count is None else insurance_count)
+        columns['player_hands'].append('|'.join(','.join(hand) for hand in player_hands))
+        columns['bet'].append(np.nan if bet is None else bet)
+        columns['bankroll_start'].append(bankroll_start)
+        columns['bankroll_end'].append(bankroll_end)
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Columns of the rounds table for the buffered rows."""
+        return {name: np.array(values, dtype=ROUNDS_COLUMNS[name]) for name, values in self._columns.items()}
+
+    def clear(self) -> None:
+        for values in self._columns.values():
+            values.clear()
+
+
+def round_log_columns(logfile: str | Path, run: int = 0, batch_size: int = 100_000) -> Iterator[dict[str, np.ndarray]]:
+    """
+    Columns of the rounds table for batches of batch_size lines of a JSON
+    round log written by play_round, see RoundLog.
+
+    """
+    round_log = RoundLog(run=run)
+    with open(logfile) as f:
+        while True:
+            for line in islice(f, batch_size):
+                round_log.append(**json.loads(line))
+            if not len(round_log):
+                return
+            yield round_log.columns()
+            round_log.clear()
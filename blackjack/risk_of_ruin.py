@@ -0,0 +1,204 @@
+from math import erfc, exp, inf, isfinite, log, sqrt
+from blackjack.enums import RiskOfRuinMethod
+from blackjack.stats import Stats, Variance
+
+
+def _normal_cdf(x: float) -> float:
+    return 0.5 * erfc(-x / sqrt(2))
+
+
+class RiskOfRuin:
+    """
+    Represents the analytic risk of ruin and related bankroll
+    metrics for a player whose per-round results have a known
+    mean and variance.
+
+    """
+    def __init__(self, ev_per_round: float, variance_per_round: float):
+        """
+        Parameters
+        ----------
+        ev_per_round
+            Expected net winnings per round (main bet plus insurance)
+        variance_per_round
+            Variance of the net winnings per round
+
+        """
+        if not variance_per_round > 0:
+            raise ValueError('Variance per round must be greater than 0.')
+
+        self._ev_per_round = ev_per_round
+        self._variance_per_round = variance_per_round
+
+    @classmethod
+    def from_counts(
+        cls,
+        count_statistics: dict[float | int | None, tuple[float, float, float]]
+    ) -> 'RiskOfRuin':
+        """
+        Combines per-count statistics into per-round statistics.
+
+        Parameters
+        ----------
+        count_statistics
+            Maps each count to a tuple of (frequency or rounds played,
+            mean net winnings per round, variance of net winnings per round).
+            Frequencies do not need to be normalized.
+
+        """
+        total_weight = sum(weight for weight, _, _ in count_statistics.values())
+        if total_weight <= 0:
+            raise ValueError('At least one round must be played to compute the risk of ruin.')
+
+        ev = sum(weight * mean for weight, mean, _ in count_statistics.values()) / total_weight
+        second_moment = sum(
+            weight * (variance + mean * mean) for weight, mean, variance in count_statistics.values()
+        ) / total_weight
+        return cls(ev_per_round=ev, variance_per_round=second_moment - ev * ev)
+
+    @classmethod
+    def from_stats(cls, stats: Stats) -> 'RiskOfRuin':
+        """Builds the calculator from the per-count results recorded in a Stats instance."""
+        return cls.from_counts(count_statistics=stats.count_statistics())
+
+    @classmethod
+    def from_variance(cls, variance: Variance) -> 'RiskOfRuin':
+        """Builds the calculator from the running per-round moments tracked by a Variance instance."""
+        if variance.count < 2:
+            raise ValueError('At least two rounds must be played to compute the risk of ruin.')
+        return cls(ev_per_round=variance.earnings_mean, variance_per_round=variance.earnings_variance)
+
+    @property
+    def ev_per_round(self) -> float:
+        return self._ev_per_round
+
+    @property
+    def variance_per_round(self) -> float:
+        return self._variance_per_round
+
+    @property
+    def standard_deviation(self) -> float:
+        return sqrt(self._variance_per_round)
+
+    @property
+    def n0(self) -> float:
+        """Number of rounds needed for the expected win to equal one standard deviation."""
+        if self._ev_per_round == 0:
+            return inf
+        return self._variance_per_round / (self._ev_per_round ** 2)
+
+    @property
+    def score(self) -> float:
+        """
+        Expected win per 100 rounds when betting a $10,000 bankroll
+        with full Kelly sizing (i.e. 1,000,000 * (EV / SD) ** 2).
+
+        """
+        if self._ev_per_round <= 0:
+            return 0.0
+        return 1_000_000 * self._ev_per_round ** 2 / self._variance_per_round
+
+    def risk_of_ruin(
+        self,
+        bankroll: float | int,
+        rounds: int | None = None,
+        method: RiskOfRuinMethod = RiskOfRuinMethod.DIFFUSION
+    ) -> float:
+        """
+        Probability of losing the entire bankroll.
+
+        Parameters
+        ----------
+        bankroll
+            Bankroll available to the player
+        rounds
+            Length of the trip in rounds. If None, the risk of ruin
+            over an unlimited number of rounds is returned
+        method
+            Approximation used. The random walk approximation is only
+            available for an unlimited number of rounds
+
+        """
+        if bankroll <= 0:
+            return 1.0
+
+        mu = self._ev_per_round
+        sigma = self.standard_deviation
+
+        if method == RiskOfRuinMethod.RANDOM_WALK:
+            if rounds is not None:
+                raise ValueError('The random walk approximation does not support a finite number of rounds.')
+            if mu <= 0:
+                return 1.0
+            if mu >= sigma:
+                return 0.0
+            return ((1 - mu / sigma) / (1 + mu / sigma)) ** (bankroll / sigma)
+
+        if rounds is None:
+            if mu <= 0:
+                return 1.0
+            return exp(-2 * mu * bankroll / self._variance_per_round)
+
+        if rounds <= 0:
+            return 0.0
+
+        spread = sigma * sqrt(rounds)
+        drift = mu * rounds
+        exponent = -2 * mu * bankroll / self._variance_per_round
+        reflected = _normal_cdf((-bankroll + drift) / spread)
+        # evaluated in log space since the exponent is large and positive for a negative drift
+        reflected_term = exp(min(exponent + log(reflected), 0.0)) if reflected > 0 else 0.0
+        return min(1.0, _normal_cdf((-bankroll - drift) / spread) + reflected_term)
+
+    def required_bankroll(
+        self,
+        target_risk_of_ruin: float,
+        rounds: int | None = None,
+        method: RiskOfRuinMethod = RiskOfRuinMethod.DIFFUSION
+    ) -> float:
+        """
+        Smallest bankroll whose risk of ruin does not exceed the target.
+
+        Parameters
+        ----------
+        target_risk_of_ruin
+            Acceptable probability of ruin, strictly between 0 and 1
+        rounds
+            Length of the trip in rounds. If None, an unlimited number
+            of rounds is assumed
+        method
+            Approximation used. The random walk approximation is only
+            available for an unlimited number of rounds
+
+        """
+        if not 0 < target_risk_of_ruin < 1:
+            raise ValueError('Target risk of ruin must be between 0 and 1.')
+
+        mu = self._ev_per_round
+        sigma = self.standard_deviation
+
+        if rounds is None:
+            if mu <= 0:
+                return inf
+            if method == RiskOfRuinMethod.RANDOM_WALK:
+                if mu >= sigma:
+                    return 0.0
+                return sigma * log(target_risk_of_ruin) / log((1 - mu / sigma) / (1 + mu / sigma))
+            return -self._variance_per_round * log(target_risk_of_ruin) / (2 * mu)
+
+        if method == RiskOfRuinMethod.RANDOM_WALK:
+            raise ValueError('The random walk approximation does not support a finite number of rounds.')
+
+        # the trip risk of ruin decreases monotonically with the bankroll, so bisect
+        low, high = 0.0, sigma * sqrt(max(rounds, 1))
+        while self.risk_of_ruin(bankroll=high, rounds=rounds) > target_risk_of_ruin:
+            low, high = high, high * 2
+            if not isfinite(high):
+                return inf
+        for _ in range(100):
+            middle = (low + high) / 2
+            if self.risk_of_ruin(bankroll=middle, rounds=rounds) > target_risk_of_ruin:
+                low = middle
+            else:
+                high = middle
+        return high
@@ -0,0 +1,144 @@
+from collections import Counter
+from typing import TYPE_CHECKING, Callable
+from blackjack.enums import ShoeRNG, ShoeSampling
+from blackjack.results_export import RoundLog, concat_columns, run_columns, stats_columns
+from blackjack.winnings_distribution import WinningsDistribution
+
+if TYPE_CHECKING:
+    from blackjack.blackjack import Blackjack
+    from blackjack.log_policy import LogPolicy
+    from blackjack.player import Player
+    from blackjack.shoe_library import ShoeSource
+
+
+def run_shoes(shoe_rng: ShoeRNG, shoe_size: int, run: int) -> 'ShoeSource | None':
+    """
+    Returns the shoes of a run: PHILOX shoes are keyed by the run and shoe
+    numbers, while MT19937 shoes (None) are shuffled by Blackjack.simulate
+    seeded with the run.
+
+    """
+    if shoe_rng != ShoeRNG.PHILOX:
+        return None
+    from blackjack.shoe_library import PhiloxShoes
+
+    return PhiloxShoes(shoe_size=shoe_size, run=run)
+
+
+def play_run(
+    make_blackjack: Callable[[], 'Blackjack'],
+    make_player: Callable[[], 'Player'],
+    run: int,
+    number_of_shoes: int,
+    penetration: float,
+    shoe_size: int,
+    shoe_sampling: ShoeSampling = ShoeSampling.RANDOM,
+    shoe_rng: ShoeRNG = ShoeRNG.MT19937,
+    round_log: RoundLog | None = None,
+    log_policy: 'LogPolicy | None' = None
+) -> tuple:
+    """
+    Plays one run of a player at a new table, seeded with the run number,
+    and returns (outcome, winnings, hands_played, variance_reduction_factor,
+    player) where outcome is the player's RunOutcome. With a round_log, the
+    rounds the log_policy keeps (every round by default) are appended to it.
+
+    """
+    blackjack = make_blackjack()
+    player = make_player()
+    initial_bankroll = player.bankroll
+    blackjack.add_player(player=player)
+    blackjack.simulate(
+        penetration=penetration,
+        number_of_shoes=number_of_shoes,
+        shoe_size=shoe_size,
+        seed=run,
+        progress_bar=False,
+        shoe_sampling=shoe_sampling,
+        shoe_library=run_shoes(shoe_rng=shoe_rng, shoe_size=shoe_size, run=run),
+        _log_policy=log_policy,
+        _round_log=round_log
+    )
+    winnings = player.bankroll - initial_bankroll
+    return player.run_outcome, winnings, player.stats.hands_played, blackjack.variance_reduction_factor, player
+
+
+def play_runs(
+    make_blackjack: Callable[[], 'Blackjack'],
+    make_player: Callable[[], 'Player'],
+    first_run: int,
+    number_of_runs: int,
+    number_of_shoes: int,
+    penetration: float,
+    shoe_size: int,
+    shoe_sampling: ShoeSampling = ShoeSampling.RANDOM,
+    shoe_rng: ShoeRNG = ShoeRNG.MT19937,
+    export: bool = False,
+    make_log_policy: Callable[[], 'LogPolicy'] | None = None
+) -> tuple:
+    """
+    Plays consecutive runs starting at first_run and returns their summary
+    (outcome_counts, total_winnings, total_hands, winnings_distribution,
+    variance_reduction_factor_total), so a worker returns a bounded amount
+    of data however many runs it plays. Outcomes are counted by their
+    RunOutcome value. With export, the runs and count_stats columns of the
+    runs follow as a dict of tables, for a ResultsWriter. Rounds are only
+    exported, as a rounds table, when make_log_policy is given: it returns
+    the LogPolicy of each run, which keeps the rounds of a run the same
+    however the runs are chunked.
+
+    """
+    outcome_counts: Counter = Counter()
+    total_winnings = 0
+    total_hands = 0
+    winnings_distribution = WinningsDistribution()
+    variance_reduction_factor_total = 0.0
+    runs = []
+    count_stats = []
+    rounds = []
+    round_log = RoundLog() if export and make_log_policy else None
+    for run in range(first_run, first_run + number_of_runs):
+        if round_log is not None:
+            round_log.run = run
+        outcome, winnings, hands_played, variance_reduction_factor, player = play_run(
+            make_blackjack=make_blackjack,
+            make_player=make_player,
+            run=run,
+            number_of_shoes=number_of_shoes,
+            penetration=penetration,
+            shoe_size=shoe_size,
+            shoe_sampling=shoe_sampling,
+            shoe_rng=shoe_rng,
+            round_log=round_log,
+            log_policy=make_log_policy() if round_log is not None else None
+        )
+        outcome_counts[outcome.value] += 1
+        total_winnings += winnings
+        total_hands += hands_played
+        winnings_distribution.add(winnings=winnings)
+        variance_reduction_factor_total += variance_reduction_factor or 0.0
+        if export:
+            runs.append((run, player.name, outcome.value, winnings, hands_played, variance_reduction_factor))
+            count_stats.append(stats_columns(stats=player.stats, run=run, player=player.name))
+        if round_log is not None:
+            # the rows of every run are packed into arrays, so the row buffer never holds more than a run
+            rounds.append(round_log.columns())
+            round_log.clear()
+    summary = outcome_counts, total_winnings, total_hands, winnings_distribution, variance_reduction_factor_total
+    if not export:
+        return summary
+    run_numbers, players, outcomes, winnings, hands_played, variance_reduction_factors = zip(*runs)
+    tables = {
+        'runs': run_columns(
+            runs=run_numbers,
+            players=players,
+            outcomes=outcomes,
+            winnings=winnings,
+            hands_played=hands_played,
+            variance_reduction_factors=variance_reduction_factors
+        ),
+        'count_stats': concat_columns(chunks=count_stats)
+    }
+    if rounds:
+        tables['rounds'] = concat_columns(chunks=rounds)
+    return *summary, tables
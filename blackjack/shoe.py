@@ -1,9 +1,10 @@
 from collections import Counter
 import random
 import string
+from typing import Hashable
+from blackjack.counting_system import CountingSystem, get_counting_system
 from blackjack.enums import CardCountingSystem
-from blackjack.source.card_counting_systems import COUNT_VALUES, INITIAL_COUNTS
-from blackjack.source.remaining_decks import REMAINING_CARDS_TO_DECKS
+from blackjack.source.remaining_decks import remaining_cards_to_decks
 
 
 class Shoe:
@@ -11,7 +12,7 @@ class Shoe:
     Represents a shoe of cards.
 
     """
-    def __init__(self, shoe_size: int, penetration: float = 0.75):
+    def __init__(self, shoe_size: int, penetration: float = 0.75, shoe_id: str | None = None):
         """
         Parameters
         ----------
@@ -20,6 +21,9 @@ class Shoe:
         penetration
             The percentage of the shoe that is dealt
             before the shoe is re-shuffled
+        shoe_id
+            Id of the shoe in round logs, by default 10 random
+            letters and digits drawn from the random module
 
         """
         if not 1 <= shoe_size <= 8 :
@@ -28,11 +32,25 @@ class Shoe:
         self._shoe_size = shoe_size
         self._cards = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A'] * 4 * self._shoe_size
         self._total_cards = len(self._cards)
+        # estimated decks left, indexed by the number of cards left
+        self._remaining_cards_to_decks = remaining_cards_to_decks(max_decks=shoe_size)
         self._cut_card_location = self._total_cards - int(penetration * self._total_cards)
         self._seen_cards: Counter[str] = Counter()
+        self._number_of_seen_cards = 0
+        # running counts (and side counts) are compiled the first time a card counting
+        # system is used and updated incrementally with every card seen afterwards. They
+        # are keyed by the CountingSystem itself, so systems that share a name never share a count
+        self._counts: dict[Hashable, float | int] = {}
+        self._count_values: list[tuple[Hashable, dict[str, float | int]]] = []
+
+        if shoe_id is None:
+            chars = string.ascii_letters + string.digits
+            shoe_id = "".join(random.choices(chars, k=10))
+        self._shoe_id = shoe_id
 
-        chars = string.ascii_letters + string.digits
-        self._shoe_id = "".join(random.choices(chars, k=10))
+    @property
+    def shoe_size(self) -> int:
+        return self._shoe_size
 
     @property
     def shoe_id(self) -> str:
@@ -55,9 +73,27 @@ class Shoe:
         random.shuffle(self._cards)
         self.burn_card()
 
+    def load(self, cards: list[str]) -> None:
+        """Replaces the cards with a pre-arranged order (dealt from the end) and burns a card."""
+        if len(cards) != self._total_cards:
+            raise ValueError(f'Expected {self._total_cards} cards to load into the shoe.')
+        self._cards = cards
+        self.burn_card()
+
+    def end_round(self) -> None:
+        """Called after every round. The cards of a hand-shuffled shoe stay discarded until the next shoe."""
+
+    @property
+    def cut_card_location(self) -> int:
+        return self._cut_card_location
+
     def add_to_seen_cards(self, card: str) -> None:
         key = '10-J-Q-K' if card in {'10', 'J', 'Q', 'K'} else card
         self._seen_cards[key] += 1
+        self._number_of_seen_cards += 1
+        counts = self._counts
+        for key, card_values in self._count_values:
+            counts[key] += card_values[card]
 
     @property
     def seen_cards(self) -> dict[str, int]:
@@ -65,17 +101,65 @@ class Shoe:
 
     @property
     def remaining_decks(self) -> float | int:
-        return REMAINING_CARDS_TO_DECKS[len(self._cards)]
+        return self._remaining_cards_to_decks[len(self._cards)]
 
     @property
     def cut_card_reached(self) -> bool:
         return len(self._cards) <= self._cut_card_location
 
-    def running_count(self, card_counting_system: CardCountingSystem) -> float | int:
-        running_count = sum(COUNT_VALUES[card_counting_system][card] * count for card, count in self._seen_cards.items())
-        if card_counting_system == CardCountingSystem.KO:
-            return running_count + INITIAL_COUNTS[card_counting_system] * (self._shoe_size - 1)
+    def _count(self, key: Hashable, card_values: dict[str, float | int]) -> float | int:
+        count = self._counts.get(key)
+        if count is None:
+            count = sum(card_values['10' if card == '10-J-Q-K' else card] * seen for card, seen in self._seen_cards.items())
+            self._counts[key] = count
+            self._count_values.append((key, card_values))
+        return count
+
+    def _running_count(self, counting_system: CountingSystem) -> float | int:
+        running_count = self._count(key=counting_system, card_values=counting_system.card_values)
+        return running_count + counting_system.initial_running_count(shoe_size=self._shoe_size)
+
+    def _adjusted_running_count(self, counting_system: CountingSystem) -> float | int:
+        running_count = self._running_count(counting_system=counting_system)
+        for name, side_count in counting_system.side_counts.items():
+            expected = counting_system.side_count_mean(side_count=name) * self._number_of_seen_cards
+            seen = self._count(key=(counting_system, name), card_values=counting_system.side_count_card_values(side_count=name))
+            running_count += side_count.betting_weight * (expected - seen)
         return running_count
 
-    def true_count(self, card_counting_system: CardCountingSystem) -> int:
+    def running_count(self, card_counting_system: CardCountingSystem | CountingSystem | str) -> float | int:
+        return self._running_count(counting_system=get_counting_system(card_counting_system=card_counting_system))
+
+    def true_count(self, card_counting_system: CardCountingSystem | CountingSystem | str) -> int:
         return int(round(self.running_count(card_counting_system=card_counting_system) / self.remaining_decks, 0))
+
+    def side_count(self, card_counting_system: CardCountingSystem | CountingSystem | str, side_count: str) -> float | int:
+        counting_system = get_counting_system(card_counting_system=card_counting_system)
+        return self._count(
+            key=(counting_system, side_count),
+            card_values=counting_system.side_count_card_values(side_count=side_count)
+        )
+
+    def adjusted_running_count(self, card_counting_system: CardCountingSystem | CountingSystem | str) -> float | int:
+        """Running count adjusted for the excess of every side count remaining in the shoe."""
+        return self._adjusted_running_count(counting_system=get_counting_system(card_counting_system=card_counting_system))
+
+    def betting_count(self, card_counting_system: CardCountingSystem | CountingSystem | str) -> float | int:
+        """
+        Count a player bets off: the adjusted running count for unbalanced
+        card counting systems, otherwise the adjusted true count. Side counts
+        make the adjusted running count fractional, so it is rounded to an
+        integer like the true count.
+
+        """
+        counting_system = get_counting_system(card_counting_system=card_counting_system)
+        # the system is resolved once per query, and systems without side counts skip them entirely
+        if counting_system.side_counts:
+            running_count = self._adjusted_running_count(counting_system=counting_system)
+            if not counting_system.is_balanced:
+                return int(round(running_count, 0))
+        else:
+            running_count = self._running_count(counting_system=counting_system)
+            if not counting_system.is_balanced:
+                return running_count
+        return int(round(running_count / self.remaining_decks, 0))
@@ -0,0 +1,206 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Generator
+import numpy as np
+from blackjack.shoe import Shoe
+
+RANKS = ('2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A')
+
+_RANK_CARDS = np.array(RANKS, dtype=object)
+
+
+class ShoeSource(ABC):
+    """
+    Represents numbered shoes that can be dealt in any order, which
+    Blackjack.simulate deals from instead of shuffling when given one as its
+    shoe_library. Subclasses define shoe_size, cards and shoe_id.
+
+    """
+    @property
+    @abstractmethod
+    def shoe_size(self) -> int:
+        """Number of decks in every shoe."""
+
+    @abstractmethod
+    def cards(self, shoe_number: int) -> list[str]:
+        """Cards of a shoe in the order Shoe.load takes them."""
+
+    @abstractmethod
+    def shoe_id(self, shoe_number: int) -> str:
+        """Id of a shoe in round logs, derived from its number so it is the same in every process and replay."""
+
+    def shoe(self, shoe_number: int, penetration: float = 0.75) -> Shoe:
+        """Returns a shoe loaded with the cards of a numbered shoe, ready to deal."""
+        shoe = Shoe(shoe_size=self.shoe_size, penetration=penetration, shoe_id=self.shoe_id(shoe_number=shoe_number))
+        shoe.load(cards=self.cards(shoe_number=shoe_number))
+        return shoe
+
+    def shoes(
+        self,
+        number_of_shoes: int,
+        penetration: float = 0.75,
+        first_shoe: int = 0
+    ) -> Generator[tuple[Shoe, int], None, None]:
+        """
+        Yields number_of_shoes shoes starting at first_shoe together with
+        their shoe numbers, like ShoeSampler.shoes. Workers can take
+        disjoint ranges of the same source.
+
+        """
+        for shoe_number in range(first_shoe, first_shoe + number_of_shoes):
+            yield self.shoe(shoe_number=shoe_number, penetration=penetration), shoe_number
+
+
+class ShoeLibrary(ShoeSource):
+    """
+    Represents a library of shuffled shoes stored in a .npy file with one
+    int8 row per shoe, where every card is its index in RANKS. The file is
+    memory-mapped, so opening it reads nothing, any shoe is read by its
+    index, and processes that open the same file share its pages.
+
+    Rows are in the order Shoe.load takes them, i.e. dealt from the end.
+
+    """
+    def __init__(self, path: str | Path):
+        """
+        Parameters
+        ----------
+        path
+            .npy file written by create_shoe_library
+
+        """
+        self._path = Path(path)
+        self._rows = np.load(self._path, mmap_mode='r')
+        if self._rows.ndim != 2 or self._rows.dtype != np.int8 or self._rows.shape[1] % 52:
+            raise ValueError(f'{self._path} is not a shoe library.')
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def shoe_size(self) -> int:
+        return self._rows.shape[1] // 52
+
+    @property
+    def rows(self) -> np.ndarray:
+        """Read-only memory-mapped array of every shoe."""
+        return self._rows
+
+    def __len__(self) -> int:
+        return self._rows.shape[0]
+
+    def __reduce__(self):
+        # workers re-open the file instead of receiving a copy of every shoe
+        return ShoeLibrary, (self._path,)
+
+    def cards(self, shoe_number: int) -> list[str]:
+        return _RANK_CARDS[self._rows[shoe_number]].tolist()
+
+    def shoe_id(self, shoe_number: int) -> str:
+        return f'{self._path.stem}-{shoe_number}'
+
+    def shoes(
+        self,
+        number_of_shoes: int,
+        penetration: float = 0.75,
+        first_shoe: int = 0
+    ) -> Generator[tuple[Shoe, int], None, None]:
+        if not 0 <= first_shoe <= first_shoe + number_of_shoes <= len(self):
+            raise ValueError(f'The library has {len(self)} shoes, not shoes {first_shoe} to {first_shoe + number_of_shoes - 1}.')
+        yield from super().shoes(number_of_shoes=number_of_shoes, penetration=penetration, first_shoe=first_shoe)
+
+
+class PhiloxShoes(ShoeSource):
+    """
+    Represents the shoes of a run shuffled by a counter-based generator
+    (NumPy's Philox) keyed by the run and shoe numbers. Any shoe of any run
+    is shuffled in O(1) without drawing the random numbers of the shoes
+    before it, so sharding, replaying and resuming a simulation only need
+    run and shoe numbers.
+
+    Shoes are reproducible for a given NumPy version. NumPy keeps the
+    Philox stream stable, and Generator.permutation has been stable in
+    practice.
+
+    """
+    def __init__(self, shoe_size: int, run: int = 0, seed: int = 0):
+        """
+        Parameters
+        ----------
+        shoe_size
+            Number of decks in every shoe
+        run
+            Run the shoes belong to, the first word of the Philox key
+        seed
+            Seed of the whole simulation, the highest word of the Philox counter
+
+        """
+        if not 1 <= shoe_size <= 8:
+            raise ValueError('Shoe size must be between 1 and 8 decks.')
+        if run < 0 or seed < 0:
+            raise ValueError('Run and seed must be greater than or equal to 0.')
+        self._shoe_size = shoe_size
+        self._run = run
+        self._seed = seed
+        self._deck = np.tile(np.arange(len(RANKS), dtype=np.int8), 4 * shoe_size)
+
+    @property
+    def shoe_size(self) -> int:
+        return self._shoe_size
+
+    @property
+    def run(self) -> int:
+        return self._run
+
+    def cards(self, shoe_number: int) -> list[str]:
+        if shoe_number < 0:
+            raise ValueError('Shoe number must be greater than or equal to 0.')
+        # the shoe number is the second word of the key, so every shoe has its own stream
+        bit_generator = np.random.Philox(key=[self._run, shoe_number], counter=[0, 0, 0, self._seed])
+        return _RANK_CARDS[np.random.Generator(bit_generator).permutation(self._deck)].tolist()
+
+    def shoe_id(self, shoe_number: int) -> str:
+        return f'{self._run}-{shoe_number}'
+
+
+def create_shoe_library(
+    path: str | Path,
+    number_of_shoes: int,
+    shoe_size: int,
+    seed: int | None = None,
+    shoes_per_chunk: int = 10000
+) -> ShoeLibrary:
+    """
+    Shuffles number_of_shoes shoes into a memory-mapped .npy file and
+    returns the library. Shoes are shuffled and written shoes_per_chunk at
+    a time, so libraries larger than memory can be created.
+
+    Parameters
+    ----------
+    path
+        .npy file to create
+    number_of_shoes
+        Number of shoes in the library
+    shoe_size
+        Number of decks in every shoe
+    seed
+        Seed of the shuffles, so a library can be re-created anywhere
+    shoes_per_chunk
+        Number of shoes shuffled at once
+
+    """
+    if not 1 <= shoe_size <= 8:
+        raise ValueError('Shoe size must be between 1 and 8 decks.')
+    if number_of_shoes < 1:
+        raise ValueError('Number of shoes must be at least 1.')
+
+    rng = np.random.default_rng(seed)
+    deck = np.tile(np.arange(len(RANKS), dtype=np.int8), 4 * shoe_size)
+    rows = np.lib.format.open_memmap(path, mode='w+', dtype=np.int8, shape=(number_of_shoes, len(deck)))
+    for start in range(0, number_of_shoes, shoes_per_chunk):
+        stop = min(start + shoes_per_chunk, number_of_shoes)
+        rows[start:stop] = rng.permuted(np.broadcast_to(deck, (stop - start, len(deck))), axis=1)
+    rows.flush()
+    del rows
+    return ShoeLibrary(path=path)
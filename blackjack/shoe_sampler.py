@@ -0,0 +1,232 @@
+from bisect import bisect_right
+from fractions import Fraction
+from functools import lru_cache
+from math import comb, floor, lcm
+import random
+from statistics import fmean, variance
+from typing import Generator
+from blackjack.counting_system import CARDS_PER_DECK, CountingSystem, get_counting_system
+from blackjack.enums import CardCountingSystem, ShoeSampling
+from blackjack.shoe import Shoe
+from blackjack.source.remaining_decks import remaining_decks
+
+
+# largest denominator of a fractional tag, which bounds the width of the running count distribution
+MAX_TAG_DENOMINATOR = 100
+
+
+def _tag_scale(tags: list[float | int]) -> int:
+    """Smallest integer that makes every tag an integer, i.e. 2 for Halves or 3 for tags in thirds."""
+    scale = 1
+    for tag in tags:
+        fraction = Fraction(tag).limit_denominator(MAX_TAG_DENOMINATOR)
+        if abs(fraction - tag) > 1e-9:
+            raise ValueError(
+                f'Card counting values must be fractions with a denominator of at most {MAX_TAG_DENOMINATOR} '
+                f'to stratify shoes, not {tag}.'
+            )
+        scale = lcm(scale, fraction.denominator)
+    return scale
+
+
+@lru_cache(maxsize=None)
+def _running_count_distribution(
+    shoe_size: int,
+    penetration: float,
+    card_counting_system: CardCountingSystem | CountingSystem | str
+) -> dict[float, float]:
+    """
+    Exact distribution of the running count of the cards dealt between the burn card
+    and the cut card, i.e. a multivariate hypergeometric draw grouped by tag value.
+
+    """
+    # imported here so that creating a table does not pay for NumPy unless shoes are stratified
+    import numpy as np
+
+    total_cards = 52 * shoe_size
+    dealt = max(total_cards - 1 - (total_cards - int(penetration * total_cards)), 0)
+    tags = get_counting_system(card_counting_system=card_counting_system).values
+
+    # scale fractional tags (i.e. Halves) to integers so counts can index an array
+    scale = _tag_scale(tags=list(tags.values()))
+    groups: dict[int, int] = {}
+    for key, tag in tags.items():
+        value = round(tag * scale)
+        groups[value] = groups.get(value, 0) + CARDS_PER_DECK[key] * shoe_size
+
+    lowest = sum(value * cards for value, cards in groups.items() if value < 0)
+    highest = sum(value * cards for value, cards in groups.items() if value > 0)
+    width = highest - lowest + 1
+    distribution = np.zeros((dealt + 1, width))
+    distribution[0, -lowest] = 1.0
+
+    for value, cards in groups.items():
+        updated = np.zeros_like(distribution)
+        for taken in range(min(cards, dealt) + 1):
+            shift = taken * value
+            weight = comb(cards, taken)
+            if shift >= 0:
+                updated[taken:, shift:] += weight * distribution[:dealt + 1 - taken, :width - shift]
+            else:
+                updated[taken:, :width + shift] += weight * distribution[:dealt + 1 - taken, -shift:]
+        distribution = updated
+
+    probabilities = distribution[dealt] / comb(total_cards, dealt)
+    return {
+        (index + lowest) / scale: float(probability)
+        for index, probability in enumerate(probabilities) if probability > 0
+    }
+
+
+class ShoeSampler:
+    """
+    Represents the source of shuffled shoes for a simulation, optionally
+    using antithetic pairs or stratification to reduce variance.
+
+    """
+    def __init__(
+        self,
+        shoe_size: int,
+        penetration: float,
+        sampling: ShoeSampling = ShoeSampling.RANDOM,
+        card_counting_system: CardCountingSystem | CountingSystem | str = CardCountingSystem.HI_LO,
+        strata_boundaries: tuple[float | int, ...] = (-4, -2, 0, 2, 4)
+    ):
+        """
+        Parameters
+        ----------
+        shoe_size
+            Number of decks used during a blackjack game
+        penetration
+            The percentage of the shoe that is dealt
+            before the shoe is re-shuffled
+        sampling
+            RANDOM shuffles every shoe independently. ANTITHETIC pairs every
+            shuffled shoe with the same cards in reverse order. STRATIFIED
+            allocates shoes to strata of the count at the cut card in
+            proportion to their exact probabilities
+        card_counting_system
+            Card counting system used to compute the count at the cut card
+            (true count, or running count for unbalanced systems). Side
+            counts are not used to stratify shoes
+        strata_boundaries
+            Sorted boundaries between strata of the count at the cut card
+
+        """
+        self._shoe_size = shoe_size
+        self._penetration = penetration
+        self._sampling = sampling
+        self._counting_system = get_counting_system(card_counting_system=card_counting_system)
+        self._strata_boundaries = tuple(strata_boundaries)
+
+        self._cards = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A'] * 4 * shoe_size
+        self._total_cards = 52 * shoe_size
+        self._cut_card_location = self._total_cards - int(penetration * self._total_cards)
+        self._card_values = self._counting_system.card_values
+        self._initial_count = self._counting_system.initial_running_count(shoe_size=shoe_size)
+        self._stratum_probabilities: list[float] | None = None
+
+    @property
+    def sampling(self) -> ShoeSampling:
+        return self._sampling
+
+    def _betting_count(self, running_count: float | int) -> float | int:
+        if not self._counting_system.is_balanced:
+            return running_count + self._initial_count
+        return int(round(running_count / remaining_decks(remaining_cards=self._cut_card_location), 0))
+
+    def _stratum(self, cards: list[str]) -> int:
+        # cards are dealt from the end after the last card is burned
+        running_count = sum(self._card_values[card] for card in cards[self._cut_card_location:-1])
+        return bisect_right(self._strata_boundaries, self._betting_count(running_count))
+
+    @property
+    def stratum_probabilities(self) -> list[float]:
+        if self._stratum_probabilities is None:
+            probabilities = [0.0] * (len(self._strata_boundaries) + 1)
+            distribution = _running_count_distribution(
+                shoe_size=self._shoe_size,
+                penetration=self._penetration,
+                card_counting_system=self._counting_system
+            )
+            for running_count, probability in distribution.items():
+                probabilities[bisect_right(self._strata_boundaries, self._betting_count(running_count))] += probability
+            self._stratum_probabilities = probabilities
+        return self._stratum_probabilities
+
+    def _new_shoe(self, cards: list[str]) -> Shoe:
+        shoe = Shoe(shoe_size=self._shoe_size, penetration=self._penetration)
+        shoe.load(cards=cards)
+        return shoe
+
+    def _allocate_strata(self, number_of_shoes: int) -> list[int]:
+        # floor of the proportional allocation plus a multinomial draw for the remainder,
+        # so the expected number of shoes in each stratum is exactly proportional
+        expected = [number_of_shoes * probability for probability in self.stratum_probabilities]
+        allocation = [stratum for stratum, shoes in enumerate(expected) for _ in range(floor(shoes))]
+        residuals = [shoes - floor(shoes) for shoes in expected]
+        remainder = number_of_shoes - len(allocation)
+        if remainder > 0:
+            allocation.extend(random.choices(range(len(expected)), weights=residuals, k=remainder))
+        random.shuffle(allocation)
+        return allocation
+
+    def shoes(self, number_of_shoes: int) -> Generator[tuple[Shoe, int], None, None]:
+        """
+        Yields shuffled shoes together with a label: the shoe number for
+        random sampling, the pair number for antithetic sampling, or the
+        stratum for stratified sampling.
+
+        """
+        if self._sampling == ShoeSampling.ANTITHETIC:
+            for shoe_number in range(number_of_shoes):
+                if shoe_number % 2 == 0:
+                    cards = self._cards.copy()
+                    random.shuffle(cards)
+                    yield self._new_shoe(cards=cards.copy()), shoe_number // 2
+                else:
+                    yield self._new_shoe(cards=cards[::-1]), shoe_number // 2
+
+        elif self._sampling == ShoeSampling.STRATIFIED:
+            for stratum in self._allocate_strata(number_of_shoes=number_of_shoes):
+                cards = self._cards.copy()
+                random.shuffle(cards)
+                while self._stratum(cards=cards) != stratum:
+                    random.shuffle(cards)
+                yield self._new_shoe(cards=cards), stratum
+
+        else:
+            for shoe_number in range(number_of_shoes):
+                shoe = Shoe(shoe_size=self._shoe_size, penetration=self._penetration)
+                shoe.shuffle()
+                yield shoe, shoe_number
+
+    def variance_reduction_factor(self, outcomes: list[float], labels: list[int]) -> float:
+        """
+        Ratio of the variance of the mean outcome under independent sampling
+        to its variance under the sampling mode used, estimated from the
+        per-shoe outcomes and the labels yielded with each shoe.
+
+        """
+        if self._sampling == ShoeSampling.RANDOM or len(outcomes) < 2:
+            return 1.0
+
+        total_variance = variance(outcomes)
+        if self._sampling == ShoeSampling.ANTITHETIC:
+            pairs: dict[int, list[float]] = {}
+            for outcome, label in zip(outcomes, labels):
+                pairs.setdefault(label, []).append(outcome)
+            pair_means = [fmean(pair) for pair in pairs.values() if len(pair) == 2]
+            if len(pair_means) < 2:
+                return 1.0
+            pair_variance = variance(pair_means)
+            return total_variance / (2 * pair_variance) if pair_variance > 0 else float('inf')
+
+        strata: dict[int, list[float]] = {}
+        for outcome, label in zip(outcomes, labels):
+            strata.setdefault(label, []).append(outcome)
+        within_variance = sum(
+            probability * (variance(strata[stratum]) if len(strata.get(stratum, [])) > 1 else total_variance)
+            for stratum, probability in enumerate(self.stratum_probabilities) if probability > 0
+        )
+        return total_variance / within_variance if within_variance > 0 else float('inf')
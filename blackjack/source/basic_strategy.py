@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 ## Basic Strategy (source: https://wizardofodds.com/games/blackjack/strategy/4-decks/)
 # H  : hit
 # S  : stand
@@ -144,9 +146,43 @@ def _array_to_string_dict(array: list[list[str]], rows: list[str]) -> dict[str,
     return d
 
 
-H17_HARD_DICT: dict[int, dict[str, str]] = _array_to_integer_dict(array=H17_HARD_ARRAY, rows=range(4, 22))
-H17_SOFT_DICT: dict[int, dict[str, str]] = _array_to_integer_dict(array=H17_SOFT_ARRAY, rows=range(12, 22))
-H17_PAIR_DICT: dict[str, dict[str, str]] = _array_to_string_dict(array=H17_PAIR_ARRAY, rows=CARDS)
-S17_HARD_DICT: dict[int, dict[str, str]] = _array_to_integer_dict(array=S17_HARD_ARRAY, rows=range(4, 22))
-S17_SOFT_DICT: dict[int, dict[str, str]] = _array_to_integer_dict(array=S17_SOFT_ARRAY, rows=range(12, 22))
-S17_PAIR_DICT: dict[str, dict[str, str]] = _array_to_string_dict(array=S17_PAIR_ARRAY, rows=CARDS)
+Table = dict[int, dict[str, str]]
+PairTable = dict[str, dict[str, str]]
+
+
+@lru_cache(maxsize=None)
+def strategy_tables(s17: bool) -> tuple[Table, Table, PairTable]:
+    """
+    Hard, soft and pair tables for a dealer who stands (s17) or hits on a
+    soft 17, built from the arrays above on first use and shared afterwards.
+
+    """
+    if s17:
+        return (
+            _array_to_integer_dict(array=S17_HARD_ARRAY, rows=range(4, 22)),
+            _array_to_integer_dict(array=S17_SOFT_ARRAY, rows=range(12, 22)),
+            _array_to_string_dict(array=S17_PAIR_ARRAY, rows=CARDS)
+        )
+    return (
+        _array_to_integer_dict(array=H17_HARD_ARRAY, rows=range(4, 22)),
+        _array_to_integer_dict(array=H17_SOFT_ARRAY, rows=range(12, 22)),
+        _array_to_string_dict(array=H17_PAIR_ARRAY, rows=CARDS)
+    )
+
+
+_TABLE_NAMES = {
+    'H17_HARD_DICT': (False, 0),
+    'H17_SOFT_DICT': (False, 1),
+    'H17_PAIR_DICT': (False, 2),
+    'S17_HARD_DICT': (True, 0),
+    'S17_SOFT_DICT': (True, 1),
+    'S17_PAIR_DICT': (True, 2)
+}
+
+
+def __getattr__(name: str):
+    # the tables of a rule set are only built when they are asked for
+    if name in _TABLE_NAMES:
+        s17, index = _TABLE_NAMES[name]
+        return strategy_tables(s17=s17)[index]
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,73 @@
+## Index Plays (source: Schlesinger, Blackjack Attack - Illustrious 18 and Fab 4, Hi-Lo true count)
+# each entry is (hand type, hand, dealer up card, index, decision at or above the index, decision below the index)
+# hand type is 'hard' (hand is the total), 'soft' (hand is the total) or 'pair' (hand is the paired card)
+# a '10' hand or dealer up card also applies to J, Q and K
+# decisions use the same codes as the basic strategy tables
+from blackjack.enums import CardCountingSystem
+
+
+# insurance is taken at a true count of +3 or higher (Illustrious 18 #1)
+HI_LO_INSURANCE_INDEX = 3
+
+
+HI_LO_S17_ILLUSTRIOUS_18 = [
+    ('hard', 16, '10', 0, 'S', 'H'),
+    ('hard', 15, '10', 4, 'S', 'H'),
+    ('pair', '10', '5', 5, 'P', 'S'),
+    ('pair', '10', '6', 4, 'P', 'S'),
+    ('hard', 10, '10', 4, 'Dh', 'H'),
+    ('hard', 12, '3', 2, 'S', 'H'),
+    ('hard', 12, '2', 3, 'S', 'H'),
+    ('hard', 11, 'A', 1, 'Dh', 'H'),
+    ('hard', 9, '2', 1, 'Dh', 'H'),
+    ('hard', 10, 'A', 4, 'Dh', 'H'),
+    ('hard', 9, '7', 3, 'Dh', 'H'),
+    ('hard', 16, '9', 5, 'S', 'H'),
+    ('hard', 13, '2', -1, 'S', 'H'),
+    ('hard', 12, '4', 0, 'S', 'H'),
+    ('hard', 12, '5', -2, 'S', 'H'),
+    ('hard', 12, '6', -1, 'S', 'H'),
+    ('hard', 13, '3', -2, 'S', 'H'),
+]
+
+
+# the dealer hitting soft 17 moves the 11 vs. A double and 10 vs. A double indices
+HI_LO_H17_ILLUSTRIOUS_18 = [
+    (hand_type, hand, dealer_up_card, {(11, 'A'): -1, (10, 'A'): 3}.get((hand, dealer_up_card), index), above, below)
+    for hand_type, hand, dealer_up_card, index, above, below in HI_LO_S17_ILLUSTRIOUS_18
+]
+
+
+# each entry is (hand type, hand, dealer up card, index at or above which the hand is surrendered)
+HI_LO_S17_FAB_4 = [
+    ('hard', 14, '10', 3),
+    ('hard', 15, '10', 0),
+    ('hard', 15, '9', 2),
+    ('hard', 15, 'A', 1),
+]
+
+
+HI_LO_H17_FAB_4 = [
+    ('hard', 14, '10', 3),
+    ('hard', 15, '10', 0),
+    ('hard', 15, '9', 2),
+    ('hard', 15, 'A', -1),
+]
+
+
+# keyed by (card counting system, s17)
+INDEX_PLAYS = {
+    (CardCountingSystem.HI_LO, True): HI_LO_S17_ILLUSTRIOUS_18,
+    (CardCountingSystem.HI_LO, False): HI_LO_H17_ILLUSTRIOUS_18,
+}
+
+
+SURRENDER_INDICES = {
+    (CardCountingSystem.HI_LO, True): HI_LO_S17_FAB_4,
+    (CardCountingSystem.HI_LO, False): HI_LO_H17_FAB_4,
+}
+
+
+INSURANCE_INDICES = {
+    CardCountingSystem.HI_LO: HI_LO_INSURANCE_INDEX,
+}
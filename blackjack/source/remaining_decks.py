@@ -1,424 +1,33 @@
+from functools import lru_cache
+
 # for decks 2-8, the number of decks was estimated to the nearest integer
 # fractional values greater than or equal to .5 (i.e. 338 / 52) were rounded up
 # fractional values less than .5 (i.e. 337 / 52) were rounded down
 # if less than 75% of the cards in the last deck remained (i.e. 38 / 52), 0.5 was used as an estimate
 # if less than 25% of the cards in the last deck remained (i.e. 13 / 52), 0.25 was used as an estimate
-REMAINING_CARDS_TO_DECKS = {
-    0: 0.25,
-    1: 0.25,
-    2: 0.25,
-    3: 0.25,
-    4: 0.25,
-    5: 0.25,
-    6: 0.25,
-    7: 0.25,
-    8: 0.25,
-    9: 0.25,
-    10: 0.25,
-    11: 0.25,
-    12: 0.25,
-    13: 0.25,
-    14: 0.5,
-    15: 0.5,
-    16: 0.5,
-    17: 0.5,
-    18: 0.5,
-    19: 0.5,
-    20: 0.5,
-    21: 0.5,
-    22: 0.5,
-    23: 0.5,
-    24: 0.5,
-    25: 0.5,
-    26: 0.5,
-    27: 0.5,
-    28: 0.5,
-    29: 0.5,
-    30: 0.5,
-    31: 0.5,
-    32: 0.5,
-    33: 0.5,
-    34: 0.5,
-    35: 0.5,
-    36: 0.5,
-    37: 0.5,
-    38: 0.5,
-    39: 1,
-    40: 1,
-    41: 1,
-    42: 1,
-    43: 1,
-    44: 1,
-    45: 1,
-    46: 1,
-    47: 1,
-    48: 1,
-    49: 1,
-    50: 1,
-    51: 1,
-    52: 1,
-    53: 1,
-    54: 1,
-    55: 1,
-    56: 1,
-    57: 1,
-    58: 1,
-    59: 1,
-    60: 1,
-    61: 1,
-    62: 1,
-    63: 1,
-    64: 1,
-    65: 1,
-    66: 1,
-    67: 1,
-    68: 1,
-    69: 1,
-    70: 1,
-    71: 1,
-    72: 1,
-    73: 1,
-    74: 1,
-    75: 1,
-    76: 1,
-    77: 1,
-    78: 2,
-    79: 2,
-    80: 2,
-    81: 2,
-    82: 2,
-    83: 2,
-    84: 2,
-    85: 2,
-    86: 2,
-    87: 2,
-    88: 2,
-    89: 2,
-    90: 2,
-    91: 2,
-    92: 2,
-    93: 2,
-    94: 2,
-    95: 2,
-    96: 2,
-    97: 2,
-    98: 2,
-    99: 2,
-    100: 2,
-    101: 2,
-    102: 2,
-    103: 2,
-    104: 2,
-    105: 2,
-    106: 2,
-    107: 2,
-    108: 2,
-    109: 2,
-    110: 2,
-    111: 2,
-    112: 2,
-    113: 2,
-    114: 2,
-    115: 2,
-    116: 2,
-    117: 2,
-    118: 2,
-    119: 2,
-    120: 2,
-    121: 2,
-    122: 2,
-    123: 2,
-    124: 2,
-    125: 2,
-    126: 2,
-    127: 2,
-    128: 2,
-    129: 2,
-    130: 3,
-    131: 3,
-    132: 3,
-    133: 3,
-    134: 3,
-    135: 3,
-    136: 3,
-    137: 3,
-    138: 3,
-    139: 3,
-    140: 3,
-    141: 3,
-    142: 3,
-    143: 3,
-    144: 3,
-    145: 3,
-    146: 3,
-    147: 3,
-    148: 3,
-    149: 3,
-    150: 3,
-    151: 3,
-    152: 3,
-    153: 3,
-    154: 3,
-    155: 3,
-    156: 3,
-    157: 3,
-    158: 3,
-    159: 3,
-    160: 3,
-    161: 3,
-    162: 3,
-    163: 3,
-    164: 3,
-    165: 3,
-    166: 3,
-    167: 3,
-    168: 3,
-    169: 3,
-    170: 3,
-    171: 3,
-    172: 3,
-    173: 3,
-    174: 3,
-    175: 3,
-    176: 3,
-    177: 3,
-    178: 3,
-    179: 3,
-    180: 3,
-    181: 3,
-    182: 4,
-    183: 4,
-    184: 4,
-    185: 4,
-    186: 4,
-    187: 4,
-    188: 4,
-    189: 4,
-    190: 4,
-    191: 4,
-    192: 4,
-    193: 4,
-    194: 4,
-    195: 4,
-    196: 4,
-    197: 4,
-    198: 4,
-    199: 4,
-    200: 4,
-    201: 4,
-    202: 4,
-    203: 4,
-    204: 4,
-    205: 4,
-    206: 4,
-    207: 4,
-    208: 4,
-    209: 4,
-    210: 4,
-    211: 4,
-    212: 4,
-    213: 4,
-    214: 4,
-    215: 4,
-    216: 4,
-    217: 4,
-    218: 4,
-    219: 4,
-    220: 4,
-    221: 4,
-    222: 4,
-    223: 4,
-    224: 4,
-    225: 4,
-    226: 4,
-    227: 4,
-    228: 4,
-    229: 4,
-    230: 4,
-    231: 4,
-    232: 4,
-    233: 4,
-    234: 5,
-    235: 5,
-    236: 5,
-    237: 5,
-    238: 5,
-    239: 5,
-    240: 5,
-    241: 5,
-    242: 5,
-    243: 5,
-    244: 5,
-    245: 5,
-    246: 5,
-    247: 5,
-    248: 5,
-    249: 5,
-    250: 5,
-    251: 5,
-    252: 5,
-    253: 5,
-    254: 5,
-    255: 5,
-    256: 5,
-    257: 5,
-    258: 5,
-    259: 5,
-    260: 5,
-    261: 5,
-    262: 5,
-    263: 5,
-    264: 5,
-    265: 5,
-    266: 5,
-    267: 5,
-    268: 5,
-    269: 5,
-    270: 5,
-    271: 5,
-    272: 5,
-    273: 5,
-    274: 5,
-    275: 5,
-    276: 5,
-    277: 5,
-    278: 5,
-    279: 5,
-    280: 5,
-    281: 5,
-    282: 5,
-    283: 5,
-    284: 5,
-    285: 5,
-    286: 6,
-    287: 6,
-    288: 6,
-    289: 6,
-    290: 6,
-    291: 6,
-    292: 6,
-    293: 6,
-    294: 6,
-    295: 6,
-    296: 6,
-    297: 6,
-    298: 6,
-    299: 6,
-    300: 6,
-    301: 6,
-    302: 6,
-    303: 6,
-    304: 6,
-    305: 6,
-    306: 6,
-    307: 6,
-    308: 6,
-    309: 6,
-    310: 6,
-    311: 6,
-    312: 6,
-    313: 6,
-    314: 6,
-    315: 6,
-    316: 6,
-    317: 6,
-    318: 6,
-    319: 6,
-    320: 6,
-    321: 6,
-    322: 6,
-    323: 6,
-    324: 6,
-    325: 6,
-    326: 6,
-    327: 6,
-    328: 6,
-    329: 6,
-    330: 6,
-    331: 6,
-    332: 6,
-    333: 6,
-    334: 6,
-    335: 6,
-    336: 6,
-    337: 6,
-    338: 7,
-    339: 7,
-    340: 7,
-    341: 7,
-    342: 7,
-    343: 7,
-    344: 7,
-    345: 7,
-    346: 7,
-    347: 7,
-    348: 7,
-    349: 7,
-    350: 7,
-    351: 7,
-    352: 7,
-    353: 7,
-    354: 7,
-    355: 7,
-    356: 7,
-    357: 7,
-    358: 7,
-    359: 7,
-    360: 7,
-    361: 7,
-    362: 7,
-    363: 7,
-    364: 7,
-    365: 7,
-    366: 7,
-    367: 7,
-    368: 7,
-    369: 7,
-    370: 7,
-    371: 7,
-    372: 7,
-    373: 7,
-    374: 7,
-    375: 7,
-    376: 7,
-    377: 7,
-    378: 7,
-    379: 7,
-    380: 7,
-    381: 7,
-    382: 7,
-    383: 7,
-    384: 7,
-    385: 7,
-    386: 7,
-    387: 7,
-    388: 7,
-    389: 7,
-    390: 8,
-    391: 8,
-    392: 8,
-    393: 8,
-    394: 8,
-    395: 8,
-    396: 8,
-    397: 8,
-    398: 8,
-    399: 8,
-    400: 8,
-    401: 8,
-    402: 8,
-    403: 8,
-    404: 8,
-    405: 8,
-    406: 8,
-    407: 8,
-    408: 8,
-    409: 8,
-    410: 8,
-    411: 8,
-    412: 8,
-    413: 8,
-    414: 8,
-    415: 8,
-    416: 8
-}
+
+CARDS_PER_DECK = 52
+MAX_DECKS = 8
+
+
+def remaining_decks(remaining_cards: int) -> float | int:
+    """Estimates the number of decks left from the number of cards left, using the rules above."""
+    if remaining_cards <= 13:
+        return 0.25
+    if remaining_cards <= 38:
+        return 0.5
+    # rounds half up with integers, i.e. 338 / 52 = 6.5 is 7 decks
+    return (2 * remaining_cards + CARDS_PER_DECK) // (2 * CARDS_PER_DECK)
+
+
+@lru_cache(maxsize=None)
+def remaining_cards_to_decks(max_decks: int = MAX_DECKS) -> tuple[float | int, ...]:
+    """Estimated decks left for every number of cards left in a shoe of up to max_decks, indexed by cards."""
+    return tuple(remaining_decks(remaining_cards=cards) for cards in range(CARDS_PER_DECK * max_decks + 1))
+
+
+def __getattr__(name: str):
+    # the full table is only generated when it is asked for
+    if name == 'REMAINING_CARDS_TO_DECKS':
+        return remaining_cards_to_decks()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -1,6 +1,10 @@
 from collections import defaultdict
+from typing import TYPE_CHECKING
 from blackjack.enums import StatsCategory
 
+if TYPE_CHECKING:
+    from blackjack.count_report import CountReport
+
 class Variance:
     """
     Track running mean and variance of earnings relative to an initial bankroll.
@@ -58,11 +62,56 @@ class Stats:
     """
     def __init__(self):
         self._stats = defaultdict(float)
+        self._round_winnings = defaultdict(float)
+        self._squared_winnings = defaultdict(float)
 
     @property
     def stats(self) -> defaultdict[tuple[float | int | None, StatsCategory], float]:
         return self._stats
 
+    @property
+    def round_winnings(self) -> defaultdict[float | int | None, float]:
+        return self._round_winnings
+
+    @property
+    def squared_winnings(self) -> defaultdict[float | int | None, float]:
+        return self._squared_winnings
+
+    def record_round(self, count: float | int | None, winnings: float | int) -> None:
+        """
+        Record the net result of a single round (main bet plus insurance)
+        at the given count so the per-count variance can be recovered.
+
+        """
+        self._round_winnings[count] += winnings
+        self._squared_winnings[count] += winnings * winnings
+
+    def count_statistics(self) -> dict[float | int | None, tuple[float, float, float]]:
+        """
+        Per-count round statistics.
+
+        Returns
+        -------
+        dict
+            Maps each count to a tuple of (rounds played, mean net winnings
+            per round, variance of net winnings per round)
+
+        """
+        result = {}
+        for (count, category), number_of_rounds in self._stats.items():
+            if category != StatsCategory.TOTAL_ROUNDS_PLAYED or number_of_rounds <= 0:
+                continue
+            mean = self._round_winnings[count] / number_of_rounds
+            variance = max(self._squared_winnings[count] / number_of_rounds - mean * mean, 0.0)
+            result[count] = (number_of_rounds, mean, variance)
+        return result
+
+    def count_report(self, confidence: float = 0.95) -> 'CountReport':
+        """Per-count EV, standard deviation and frequency as a CountReport, see blackjack.count_report."""
+        from blackjack.count_report import CountReport
+
+        return CountReport.from_stats(stats=self, confidence=confidence)
+
     def _compute_totals(self) -> defaultdict[str, float]:
         totals: defaultdict[str, float] = defaultdict(float)
         for stats_key, value in self._stats.items():
@@ -72,6 +121,38 @@ class Stats:
     def _get_total(self, totals: defaultdict[str, float], *categories: StatsCategory) -> float:
         return sum(totals.get(category.value, 0) for category in categories)
 
+    def total(self, *categories: StatsCategory) -> float:
+        """Total of one or more categories across every count."""
+        return sum(value for (_, category), value in self._stats.items() if category in categories)
+
+    @property
+    def rounds_played(self) -> int:
+        return int(self.total(StatsCategory.TOTAL_ROUNDS_PLAYED))
+
+    @property
+    def hands_played(self) -> int:
+        return int(self.total(StatsCategory.TOTAL_HANDS_PLAYED))
+
+    @property
+    def ev_per_hand(self) -> float:
+        """Net winnings per hand played, including insurance."""
+        hands_played = self.hands_played
+        if not hands_played:
+            return 0.0
+        return self.total(StatsCategory.NET_WINNINGS, StatsCategory.INSURANCE_NET_WINNINGS) / hands_played
+
+    @property
+    def win_rate(self) -> float:
+        """Share of hands played that the player won."""
+        hands_played = self.hands_played
+        return self.total(StatsCategory.PLAYER_HANDS_WON) / hands_played if hands_played else 0.0
+
+    @property
+    def average_bet(self) -> float:
+        """Amount bet per hand played, excluding insurance."""
+        hands_played = self.hands_played
+        return self.total(StatsCategory.AMOUNT_BET) / hands_played if hands_played else 0.0
+
     def summary(self, string: bool = True) -> dict[str, float | int] | str:
         totals = self._compute_totals()
         result = {}
@@ -18,18 +18,44 @@ class Table:
 
         """
         self._rules = rules
-        self._players: list[Player] = []
-        self._observers: list[Player] = []
+        # insertion-ordered dicts used as sets give O(1) seating and unseating
+        # while keeping players in the order they sat down
+        self._players: dict[Player, None] = {}
+        self._observers: dict[Player, None] = {}
+        # the lists returned by the views are rebuilt only after seating changes,
+        # and a list that was handed out is never modified afterwards
+        self._dirty = True
+        self._players_view: list[Player] = []
+        self._observers_view: list[Player] = []
+        self._players_and_observers_view: list[Player] = []
+
+    def _refresh(self) -> None:
+        self._players_view = list(self._players)
+        self._observers_view = list(self._observers)
+        self._players_and_observers_view = self._players_view + self._observers_view
+        self._dirty = False
 
     @property
-    def players(self):
-        return self._players
+    def players(self) -> list[Player]:
+        if self._dirty:
+            self._refresh()
+        return self._players_view
 
     @property
     def observers(self) -> list[Player]:
-        return self._observers
+        if self._dirty:
+            self._refresh()
+        return self._observers_view
+
+    @property
+    def players_and_observers(self) -> list[Player]:
+        """Players seated at the table followed by back counters watching it."""
+        if self._dirty:
+            self._refresh()
+        return self._players_and_observers_view
 
-    def _validate_player(self, player: Player) -> None:
+    def validate_player(self, player: Player) -> None:
+        """Raises an error if the player's bets or insurance are not allowed by the table rules."""
         if not isinstance(player, Player):
             raise TypeError('Expected a Player, CardCounter, or BackCounter object.')
         if isinstance(player, CardCounter):
@@ -42,23 +68,33 @@ class Table:
                 raise ValueError(f"{player.name}'s desired bet is not allowed according to the table rules.")
 
     def add_player(self, player: Player) -> None:
-        self._validate_player(player=player)
+        self.validate_player(player=player)
         if isinstance(player, BackCounter):
-            self._observers.append(player)
+            self._observers[player] = None
         else:
-            self._players.append(player)
+            self._players[player] = None
+        self._dirty = True
 
     def remove_player(self, player: Player) -> None:
         if player not in self._players:
             raise ValueError(f'{player.name} is not seated at the table or a back counter.')
-        self._players.remove(player)
+        del self._players[player]
+        self._dirty = True
+
+    def remove_observer(self, back_counter: BackCounter) -> None:
+        if back_counter not in self._observers:
+            raise ValueError(f'{back_counter.name} is not watching the table.')
+        del self._observers[back_counter]
+        self._dirty = True
 
     def add_back_counter(self, back_counter: BackCounter) -> None:
-        self._observers.remove(back_counter)
-        self._players.append(back_counter)
+        del self._observers[back_counter]
+        self._players[back_counter] = None
         back_counter.is_seated = True
+        self._dirty = True
 
     def remove_back_counter(self, back_counter: BackCounter) -> None:
-        self._players.remove(back_counter)
-        self._observers.append(back_counter)
+        del self._players[back_counter]
+        self._observers[back_counter] = None
         back_counter.is_seated = False
+        self._dirty = True
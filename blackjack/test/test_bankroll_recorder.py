@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+from blackjack.bankroll_recorder import BankrollRecorder
+from blackjack.blackjack import Blackjack
+from blackjack.enums import BankrollDownsampling
+from blackjack.player import Player
+
+
+def play_rounds(player, bankrolls, shoe_size=None):
+    """Plays a round for every bankroll, ending a shoe every shoe_size rounds."""
+    for i, bankroll in enumerate(bankrolls, start=1):
+        player.adjust_bankroll(amount=bankroll - player.bankroll)
+        player.update_aggregate(bankroll=player.bankroll)
+        if shoe_size and i % shoe_size == 0:
+            player.end_shoe()
+
+
+def test_record_round(player):
+    """Tests the BankrollRecorder class when recording every round."""
+    bankroll_recorder = BankrollRecorder(player=player, initial_capacity=2)
+    play_rounds(player=player, bankrolls=[990, 1005.5, 980, 1020, 1000])
+    assert bankroll_recorder.trajectory.dtype == np.float32
+    assert bankroll_recorder.trajectory.tolist() == [990, 1005.5, 980, 1020, 1000]
+    assert bankroll_recorder.drawdown.tolist() == [10, 0, 25.5, 0, 20]
+
+
+def test_record_shoe(player):
+    """Tests the BankrollRecorder class when recording every shoe in cents."""
+    bankroll_recorder = BankrollRecorder(player=player, downsampling=BankrollDownsampling.SHOE, cents=True)
+    play_rounds(player=player, bankrolls=[990, 1005.5, 980, 1020, 1000.25], shoe_size=2)
+    player.end_shoe()
+    assert bankroll_recorder.trajectory.dtype == np.int64
+    assert bankroll_recorder.trajectory.tolist() == [100550, 102000, 100025]
+
+
+def test_record_block(player):
+    """Tests the BankrollRecorder class when recording the minimum and maximum of every block."""
+    bankroll_recorder = BankrollRecorder(player=player, downsampling=BankrollDownsampling.BLOCK, block_size=2)
+    play_rounds(player=player, bankrolls=[990, 1005, 980, 1020, 1000])
+    assert bankroll_recorder.trajectory.tolist() == [[990, 1005], [980, 1020], [1000, 1000]]
+    assert bankroll_recorder.drawdown.tolist() == [10, 25, 20]
+
+
+def test_record_block_invalid(player):
+    """Tests the BankrollRecorder class with an invalid block size."""
+    with pytest.raises(ValueError) as e:
+        BankrollRecorder(player=player, downsampling=BankrollDownsampling.BLOCK, block_size=0)
+    assert str(e.value) == 'Block size must be at least 1 round.'
+
+
+def test_export(player, tmp_path):
+    """Tests the save and to_memmap methods within the BankrollRecorder class."""
+    bankroll_recorder = BankrollRecorder(player=player)
+    play_rounds(player=player, bankrolls=[990, 1005, 980])
+
+    path = bankroll_recorder.save(path=tmp_path / 'run_1')
+    assert path.name == 'run_1.npy'
+    assert np.load(path, mmap_mode='r').tolist() == [990, 1005, 980]
+
+    memmap = bankroll_recorder.to_memmap(path=tmp_path / 'run_2.npy')
+    assert memmap.tolist() == [990, 1005, 980]
+    assert np.load(tmp_path / 'run_2.npy').tolist() == [990, 1005, 980]
+
+
+def test_simulate():
+    """Tests the BankrollRecorder class during a simulation."""
+    blackjack = Blackjack(min_bet=10, max_bet=500)
+    player = Player(name='Player 1', bankroll=1000, min_bet=10)
+    blackjack.add_player(player=player)
+    rounds = BankrollRecorder(player=player)
+    shoes = BankrollRecorder(player=player, downsampling=BankrollDownsampling.SHOE)
+    blackjack.simulate(penetration=0.75, number_of_shoes=5, shoe_size=1, seed=1, progress_bar=False)
+
+    assert len(rounds.trajectory) == player.stats.summary(string=False)['TOTAL ROUNDS PLAYED']
+    assert len(shoes.trajectory) == 5
+    assert rounds.trajectory[-1] == shoes.trajectory[-1] == player.bankroll
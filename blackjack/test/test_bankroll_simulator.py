@@ -1,19 +1,75 @@
+import pytest
 import bankroll_simulator as sim
-from blackjack.blackjack import Blackjack
 
 
-def test_run_once_uses_dummy_simulation(monkeypatch):
-    """_run_once should return 'ran_out' with zero winnings when simulation does nothing."""
+def test_distributed_results_match_local_results():
+    """Chunks run by localhost workers merge into exactly the single-node results."""
+    chunk_arguments = sim._chunk_arguments(
+        number_of_runs=6,
+        runs_per_chunk=2,
+        number_of_shoes=1,
+        penetration=0.75,
+        shoe_size=2,
+        shoe_sampling=sim.ShoeSampling.RANDOM
+    )
+    local = list(sim._local_results(chunk_arguments=chunk_arguments, max_workers=2))
+    distributed = list(sim._distributed_results(
+        chunk_arguments=chunk_arguments,
+        address=("127.0.0.1", 0),
+        authkey=b"test",
+        local_workers=2
+    ))
 
-    def fake_simulate(self, **kwargs):
-        return None
+    assert len(local) == len(distributed) == 3
+    for local_chunk, distributed_chunk in zip(local, distributed):
+        assert local_chunk[:3] == distributed_chunk[:3]
+        assert local_chunk[3].percentiles([5, 50, 95]).tolist() == distributed_chunk[3].percentiles([5, 50, 95]).tolist()
 
-    monkeypatch.setattr(Blackjack, "simulate", fake_simulate)
 
-    outcome, winnings, hands_played = sim._run_once(
-        seed=1, number_of_shoes=1, penetration=0.5, shoe_size=1
+def test_run_chunk_export():
+    """_run_chunk with export should also return the chunk's runs and count stats columns."""
+    *summary, tables = sim._run_chunk(
+        first_seed=3, number_of_runs=2, number_of_shoes=1, penetration=0.75, shoe_size=2, export=True
     )
 
-    assert outcome == "ran_out"
-    assert winnings == 0
-    assert hands_played == 0
+    plain = sim._run_chunk(first_seed=3, number_of_runs=2, number_of_shoes=1, penetration=0.75, shoe_size=2)
+    assert len(plain) == 5
+    assert summary[:3] == list(plain[:3])
+    assert tables["runs"]["run"].tolist() == [3, 4]
+    assert tables["runs"]["hands_played"].sum() == summary[2]
+    assert tables["runs"]["winnings"].sum() == summary[1]
+    assert set(tables["count_stats"]["run"].tolist()) == {3, 4}
+    assert tables["count_stats"]["total_hands_played"].sum() == summary[2]
+
+
+def test_chunk_arguments_shoe_rng():
+    """PHILOX chunks play keyed shoes, so a chunk's runs give the same results in any chunking."""
+    kwargs = {"number_of_shoes": 1, "penetration": 0.75, "shoe_size": 2, "shoe_sampling": sim.ShoeSampling.RANDOM}
+    whole, = sim._chunk_arguments(number_of_runs=2, runs_per_chunk=2, shoe_rng=sim.ShoeRNG.PHILOX, **kwargs)
+    first, second = sim._chunk_arguments(number_of_runs=2, runs_per_chunk=1, shoe_rng=sim.ShoeRNG.PHILOX, **kwargs)
+    shuffled, = sim._chunk_arguments(number_of_runs=2, runs_per_chunk=2, **kwargs)
+
+    assert whole[-2] == sim.ShoeRNG.PHILOX
+    assert sim._run_chunk(*whole)[1] == sim._run_chunk(*first)[1] + sim._run_chunk(*second)[1]
+    assert sim._run_chunk(*whole)[1] != sim._run_chunk(*shuffled)[1]
+
+
+def test_template_fingerprint(monkeypatch):
+    """Workers are matched to the coordinator by a hash of the template and its simulation params."""
+    fingerprint = sim._template_fingerprint()
+    assert fingerprint == sim._template_fingerprint()
+    assert len(fingerprint) == 64
+    monkeypatch.setattr(sim, "SIMULATION_PARAMS", {**sim.SIMULATION_PARAMS, "number_of_shoes": 1})
+    assert sim._template_fingerprint() != fingerprint
+
+
+def test_parse_args_authkey(monkeypatch, capsys):
+    """Workers need a key, and there is no well-known default key."""
+    monkeypatch.delenv("BLACKJACK_AUTHKEY", raising=False)
+    assert sim._parse_args(["--coordinate", "127.0.0.1:0"]).authkey is None
+    with pytest.raises(SystemExit):
+        sim._parse_args(["--worker", "127.0.0.1:50000"])
+    assert "--worker requires --authkey or $BLACKJACK_AUTHKEY" in capsys.readouterr().err
+
+    monkeypatch.setenv("BLACKJACK_AUTHKEY", "secret")
+    assert sim._parse_args(["--worker", "127.0.0.1:50000"]).authkey == "secret"
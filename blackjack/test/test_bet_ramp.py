@@ -0,0 +1,163 @@
+import pytest
+from blackjack.bet_ramp import (
+    bet_ramp_risk_of_ruin, measure_count_statistics, optimal_bet_ramp, search_bet_ramps, unit_count_statistics
+)
+from blackjack.blackjack import Blackjack
+from blackjack.enums import CardCountingSystem
+from blackjack.rules import Rules
+
+
+# frequency, EV and variance per unit bet at every count, roughly those of six decks with HI-LO
+COUNT_STATISTICS = {
+    -2: (0.15, -0.015, 1.3),
+    -1: (0.2, -0.01, 1.3),
+    0: (0.3, -0.005, 1.3),
+    1: (0.15, 0.0, 1.3),
+    2: (0.1, 0.005, 1.3),
+    3: (0.06, 0.01, 1.3),
+    4: (0.04, 0.015, 1.3),
+}
+
+
+def make_blackjack():
+    return Blackjack(min_bet=10, max_bet=500)
+
+
+@pytest.fixture
+def table_rules():
+    return Rules(min_bet=10, max_bet=500)
+
+
+def test_unit_count_statistics():
+    """Tests the unit_count_statistics function."""
+    assert unit_count_statistics(
+        count_statistics={None: (5, 10, 100), 1: (10, 5, 200)},
+        unit_bet=10
+    ) == {1: (10, 0.5, 2)}
+
+
+def test_optimal_bet_ramp(table_rules):
+    """Tests the optimal_bet_ramp function with full Kelly bets."""
+    bet_ramp = optimal_bet_ramp(count_statistics=COUNT_STATISTICS, rules=table_rules, bankroll=10000)
+    assert list(bet_ramp) == sorted(COUNT_STATISTICS)
+    assert all(bet_ramp[count] == 10 for count in (-2, -1, 0, 1))
+    assert bet_ramp[2] == round(10000 * 0.005 / 1.3, 2)
+    assert bet_ramp[4] == round(10000 * 0.015 / 1.3, 2)
+
+
+def test_optimal_bet_ramp_noisy(table_rules):
+    """
+    Tests the optimal_bet_ramp function when the EVs are noisy, which
+    the linear fit smooths and the ramp never decreases regardless.
+
+    """
+    count_statistics = dict(COUNT_STATISTICS)
+    count_statistics[3] = (0.06, -0.02, 1.3)
+    fitted = optimal_bet_ramp(count_statistics=count_statistics, rules=table_rules, bankroll=10000)
+    assert fitted[2] < fitted[3] < fitted[4]
+
+    bet_ramp = optimal_bet_ramp(count_statistics=count_statistics, rules=table_rules, bankroll=10000, linear_fit=False)
+    assert bet_ramp[3] == bet_ramp[2] == round(10000 * 0.005 / 1.3, 2)
+    assert list(bet_ramp.values()) == sorted(bet_ramp.values())
+
+
+def test_optimal_bet_ramp_constraints(table_rules):
+    """Tests the optimal_bet_ramp function with a fractional Kelly, spread and chip constraints."""
+    bet_ramp = optimal_bet_ramp(
+        count_statistics=COUNT_STATISTICS,
+        rules=table_rules,
+        bankroll=10000,
+        kelly_fraction=0.5,
+        max_spread=5,
+        chip=5
+    )
+    assert bet_ramp == {-2: 10, -1: 10, 0: 10, 1: 10, 2: 15, 3: 35, 4: 50}
+
+
+def test_optimal_bet_ramp_risk_of_ruin(table_rules):
+    """Tests the optimal_bet_ramp function with a maximum risk of ruin."""
+    count_statistics = {count: (frequency, mean + 0.01, variance) for count, (frequency, mean, variance) in COUNT_STATISTICS.items()}
+    full_kelly = optimal_bet_ramp(count_statistics=count_statistics, rules=table_rules, bankroll=2000)
+    bet_ramp = optimal_bet_ramp(count_statistics=count_statistics, rules=table_rules, bankroll=2000, max_risk_of_ruin=0.18)
+    assert bet_ramp[4] < full_kelly[4]
+    assert bet_ramp_risk_of_ruin(
+        bet_ramp=bet_ramp, count_statistics=count_statistics, min_bet=10
+    ).risk_of_ruin(bankroll=2000) <= 0.18
+
+    with pytest.raises(ValueError) as e:
+        optimal_bet_ramp(count_statistics=count_statistics, rules=table_rules, bankroll=2000, max_risk_of_ruin=0.01)
+    assert str(e.value) == 'No bet ramp satisfies the maximum risk of ruin.'
+
+
+def test_optimal_bet_ramp_invalid(table_rules):
+    """Tests the optimal_bet_ramp function with invalid arguments."""
+    with pytest.raises(ValueError) as e:
+        optimal_bet_ramp(count_statistics=COUNT_STATISTICS, rules=table_rules, bankroll=10000, kelly_fraction=0)
+    assert str(e.value) == 'Kelly fraction must be greater than 0 and at most 1.'
+
+    with pytest.raises(ValueError) as e:
+        optimal_bet_ramp(count_statistics=COUNT_STATISTICS, rules=table_rules, bankroll=10000, min_rounds=1)
+    assert str(e.value) == 'At least one count with a positive variance is required to optimize a bet ramp.'
+
+
+def test_bet_ramp_risk_of_ruin():
+    """Tests the bet_ramp_risk_of_ruin function when counts are missing from the bet ramp."""
+    risk_of_ruin = bet_ramp_risk_of_ruin(bet_ramp={2: 20, 4: 40}, count_statistics=COUNT_STATISTICS, min_bet=10)
+    expected = sum(
+        frequency * mean * (10 if count < 2 else 20 if count < 4 else 40)
+        for count, (frequency, mean, _) in COUNT_STATISTICS.items()
+    )
+    assert risk_of_ruin.ev_per_round == pytest.approx(expected)
+
+
+def test_measure_and_search_bet_ramps():
+    """Tests the measure_count_statistics and search_bet_ramps functions."""
+    count_statistics = measure_count_statistics(
+        make_blackjack=make_blackjack,
+        card_counting_system=CardCountingSystem.HI_LO,
+        number_of_shoes=20,
+        penetration=0.75,
+        shoe_size=2,
+        seed=1
+    )
+    assert sum(rounds for rounds, _, _ in count_statistics.values()) > 0
+    assert all(variance >= 0 for _, _, variance in count_statistics.values())
+
+    candidates = search_bet_ramps(
+        make_blackjack=make_blackjack,
+        count_statistics=COUNT_STATISTICS,
+        card_counting_system=CardCountingSystem.HI_LO,
+        bankroll=10000,
+        number_of_runs=2,
+        number_of_shoes=2,
+        penetration=0.75,
+        shoe_size=2,
+        kelly_fractions=(0.5, 1.0),
+        chip=5,
+        max_workers=1
+    )
+    assert [candidate.kelly_fraction for candidate in candidates] == [0.5, 1.0]
+    assert candidates[0].bet_ramp[4] < candidates[1].bet_ramp[4]
+    assert all(0 <= candidate.risk_of_ruin <= 1 for candidate in candidates)
+
+
+def test_search_bet_ramps_single_fraction():
+    """Tests the search_bet_ramps function with a single Kelly fraction."""
+    kwargs = {
+        'make_blackjack': make_blackjack,
+        'count_statistics': COUNT_STATISTICS,
+        'card_counting_system': CardCountingSystem.HI_LO,
+        'bankroll': 10000,
+        'number_of_runs': 2,
+        'number_of_shoes': 2,
+        'penetration': 0.75,
+        'shoe_size': 2,
+        'max_workers': 1
+    }
+    (candidate,) = search_bet_ramps(kelly_fractions=(0.5,), **kwargs)
+    assert candidate.kelly_fraction == 0.5
+    assert 0 <= candidate.risk_of_ruin <= 1
+
+    with pytest.raises(ValueError) as e:
+        search_bet_ramps(kelly_fractions=(), **kwargs)
+    assert str(e.value) == 'At least one Kelly fraction is required.'
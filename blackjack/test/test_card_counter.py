@@ -101,3 +101,18 @@ def test_init_bet_ramp_count_does_not_exist_integer():
 def test_placed_bet(card_counter_balanced, test_count, expected):
     """Tests the placed_bet method within the CardCounter class."""
     assert card_counter_balanced.placed_bet(count=test_count) == expected
+
+
+def test_placed_bet_between_ramp_counts():
+    """Tests the placed_bet method within the CardCounter class for a count between the counts of the bet ramp."""
+    card_counter = CardCounter(
+        name='Player 2',
+        bankroll=1000,
+        min_bet=10,
+        card_counting_system=CardCountingSystem.HI_LO,
+        bet_ramp={1: 15, 2: 20, 3: 40},
+        insurance=None
+    )
+    assert card_counter.placed_bet(count=1 / 3) == 10
+    assert card_counter.placed_bet(count=2 / 3 + 1) == 15
+    assert card_counter.placed_bet(count=2.5) == 20
@@ -0,0 +1,67 @@
+import pytest
+from blackjack.back_counter import BackCounter
+from blackjack.casino import Casino
+from blackjack.enums import CardCountingSystem
+from blackjack.player import Player
+from blackjack.rules import Rules
+
+
+def make_back_counter(max_bet=100):
+    return BackCounter(
+        name='Back Counter 1',
+        bankroll=100000,
+        min_bet=10,
+        card_counting_system=CardCountingSystem.HI_LO,
+        bet_ramp={1: 10, 2: 50, 3: max_bet},
+        insurance=None,
+        entry_point=1,
+        exit_point=-1
+    )
+
+
+@pytest.fixture
+def casino():
+    casino = Casino()
+    for seconds_per_hand in (12, 6):
+        table = casino.add_table(rules=Rules(min_bet=10, max_bet=500), shoe_size=2, seconds_per_hand=seconds_per_hand)
+        casino.add_player(player=Player(name=f'Player {table}', bankroll=1000000, min_bet=10), table=table)
+    casino.add_table(rules=Rules(min_bet=10, max_bet=500), shoe_size=2)
+    return casino
+
+
+def test_simulate(casino):
+    """Tests the simulate method within the Casino class deals every table at its own pace."""
+    casino.simulate(hours=1, seed=1)
+    # one player and the dealer at 12 and 6 seconds per hand
+    assert [table.rounds_played for table in casino.tables] == [150, 300, 0]
+    assert casino.tables[0].shoes_played > 0
+    assert casino.clock == 3600
+
+
+def test_back_counter_hops_between_tables(casino):
+    """Tests that a back counter watching several tables plays at more than one and at one at a time."""
+    back_counter = make_back_counter()
+    casino.add_back_counter(back_counter=back_counter, tables=[0, 1])
+    tables_played = []
+
+    def record(bankroll):
+        seated_at = [
+            number for number, table in enumerate(casino.tables) if back_counter in table.table.players
+        ]
+        assert seated_at == [casino.location(back_counter=back_counter)]
+        tables_played.append(seated_at[0])
+
+    back_counter.add_round_listener(record)
+    casino.simulate(hours=4, seed=2)
+    assert set(tables_played) == {0, 1}
+    assert back_counter.stats.summary(string=False)['TOTAL ROUNDS PLAYED'] == len(tables_played)
+    # rounds at the slower table take longer once the back counter sits down
+    assert casino.tables[0].rounds_played < 4 * 150
+
+
+def test_add_back_counter_validates_every_table(casino):
+    """Tests the add_back_counter method within the Casino class checks the rules of every watched table."""
+    casino.add_table(rules=Rules(min_bet=10, max_bet=200), shoe_size=6)
+    with pytest.raises(ValueError) as e:
+        casino.add_back_counter(back_counter=make_back_counter(max_bet=300))
+    assert str(e.value) == "Back Counter 1's desired bet is not allowed according to the table rules."
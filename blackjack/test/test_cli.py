@@ -0,0 +1,91 @@
+import json
+import subprocess
+import sys
+from blackjack.cli import main, run
+
+
+CONFIG = {
+    'rules': {'min_bet': 10, 'max_bet': 500},
+    'player': {
+        'type': 'CardCounter',
+        'name': 'CC_1',
+        'bankroll': 2000,
+        'min_bet': 10,
+        'card_counting_system': 'HI-LO',
+        'bet_ramp': {'0': 10, '2': 40}
+    },
+    'simulation': {'number_of_runs': 4, 'number_of_shoes': 2, 'shoe_size': 2, 'runs_per_chunk': 2}
+}
+
+TOML = '''
+[rules]
+min_bet = 10
+max_bet = 500
+
+[player]
+type = "CardCounter"
+name = "CC_1"
+bankroll = 2000
+min_bet = 10
+card_counting_system = "HI-LO"
+bet_ramp = { "0" = 10, "2" = 40 }
+
+[simulation]
+number_of_runs = 4
+number_of_shoes = 2
+shoe_size = 2
+runs_per_chunk = 2
+'''
+
+
+def test_validate(tmp_path, capsys):
+    """Tests the validate command with a TOML configuration."""
+    path = tmp_path / 'config.toml'
+    path.write_text(TOML)
+    assert main(['validate', str(path)]) == 0
+    assert capsys.readouterr().out == f'{path} is valid.\n'
+
+
+def test_validate_invalid(tmp_path, capsys):
+    """Tests the validate command reports every problem of an invalid configuration."""
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps({'rules': {'min_bet': '10', 'max_bet': 500}, 'player': {'name': 'P'}}))
+    assert main(['validate', str(path)]) == 1
+    error = capsys.readouterr().err
+    assert 'rules.min_bet must be a number.' in error
+    assert 'player.bankroll is required.' in error
+    assert 'player.min_bet is required.' in error
+
+
+def test_run_matches_workers(tmp_path, capsys):
+    """Tests the run command gives the same results in process and on a pool."""
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(CONFIG))
+    assert main(['run', str(path), '--workers', '1', '--json']) == 0
+    results = json.loads(capsys.readouterr().out)
+    assert results == run(config=CONFIG, workers=2)
+    assert results['bankrupt_count'] + results['goal_count'] + results['ran_out_count'] == 4
+
+
+def test_lazy_imports():
+    """Tests that importing the command line does not import NumPy or the simulation classes."""
+    modules = subprocess.run(
+        [sys.executable, '-c', 'import sys, blackjack.cli; print(" ".join(sys.modules))'],
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert 'numpy' not in modules
+    assert 'blackjack.blackjack' not in modules
+
+
+def test_replay(tmp_path, capsys):
+    """Tests the replay command prints a trace of the requested rounds as JSON lines."""
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(CONFIG))
+    assert main(['replay', str(path), '--run', '1', '--shoe', '1', '--rounds', '1:2']) == 0
+    trace = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert {event['round'] for event in trace} == {1, 2}
+    assert {event['shoe'] for event in trace} == {1}
+    assert any(event['event'] == 'decision' for event in trace)
+
+    assert main(['replay', str(path), '--shoe', '0', '--rounds', 'a:b']) == 1
+    assert capsys.readouterr().err == f'{path}: Rounds must be FIRST:LAST, not a:b.\n'
@@ -0,0 +1,73 @@
+import pytest
+from blackjack.blackjack import Blackjack
+from blackjack.card_counter import CardCounter
+from blackjack.comparison import compare_players
+from blackjack.enums import CardCountingSystem
+from blackjack.player import Player
+
+
+def make_blackjack():
+    return Blackjack(min_bet=10, max_bet=500)
+
+
+def make_flat_bettor():
+    return Player(name='Flat', bankroll=10000, min_bet=10)
+
+
+def make_card_counter():
+    return CardCounter(
+        name='Counter',
+        bankroll=10000,
+        min_bet=10,
+        card_counting_system=CardCountingSystem.HI_LO,
+        bet_ramp={1: 10, 2: 20, 3: 40}
+    )
+
+
+def test_compare_players_identical_configurations():
+    """Identical configurations played on common shoes have no difference at all."""
+    results = compare_players(
+        make_blackjack=make_blackjack,
+        player_factories=[make_flat_bettor, make_flat_bettor],
+        number_of_runs=3,
+        number_of_shoes=2,
+        penetration=0.75,
+        shoe_size=2,
+        max_workers=1
+    )
+    assert results[0].average_winnings == results[1].average_winnings
+    assert results[1].winnings_difference == 0
+    assert results[1].paired_standard_error == 0
+    assert results[1].risk_of_ruin_difference == 0
+
+
+def test_compare_players_paired_difference():
+    """Paired differences against common shoes are less noisy than independent runs."""
+    results = compare_players(
+        make_blackjack=make_blackjack,
+        player_factories=[make_flat_bettor, make_card_counter],
+        number_of_runs=8,
+        number_of_shoes=3,
+        penetration=0.75,
+        shoe_size=2,
+        max_workers=2
+    )
+    assert [result.name for result in results] == ['Flat', 'Counter']
+    counter = results[1]
+    assert counter.winnings_difference == pytest.approx(counter.average_winnings - results[0].average_winnings)
+    assert counter.winnings_difference_lower <= counter.winnings_difference <= counter.winnings_difference_upper
+    assert counter.paired_standard_error < counter.unpaired_standard_error
+
+
+def test_compare_players_single_configuration():
+    """Tests compare_players with fewer than two configurations."""
+    with pytest.raises(ValueError) as e:
+        compare_players(
+            make_blackjack=make_blackjack,
+            player_factories=[make_flat_bettor],
+            number_of_runs=1,
+            number_of_shoes=1,
+            penetration=0.75,
+            shoe_size=1
+        )
+    assert str(e.value) == 'At least two player configurations are required for a comparison.'
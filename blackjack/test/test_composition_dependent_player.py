@@ -0,0 +1,107 @@
+import pytest
+from blackjack.composition_dependent_player import CompositionDependentPlayer
+from blackjack.composition_ev import LRUCache
+from blackjack.shoe import Shoe
+
+
+@pytest.fixture
+def composition_dependent_player(rules):
+    return CompositionDependentPlayer(
+        rules=rules,
+        cache=LRUCache(maxsize=100),
+        name='Player 4',
+        bankroll=1000,
+        min_bet=10
+    )
+
+
+def deal(shoe, player, cards, dealer_up_card):
+    hand = player.get_first_hand()
+    for card in cards:
+        shoe.add_to_seen_cards(card=card)
+        hand.add_card(card=card)
+    shoe.add_to_seen_cards(card=dealer_up_card)
+    hand.add_to_total_bet(amount=10)
+    return hand
+
+
+def test_init_resolution(rules):
+    """Tests the __init__ method within the CompositionDependentPlayer class when the resolution is too low."""
+    with pytest.raises(ValueError) as e:
+        CompositionDependentPlayer(rules=rules, resolution=12, name='Player 4', bankroll=1000, min_bet=10)
+    assert str(e.value) == 'Resolution must be at least 13 cards.'
+
+
+def test_remaining_composition():
+    """Tests the remaining_composition method within the CompositionDependentPlayer class."""
+    shoe = Shoe(shoe_size=2)
+    for card in ('A', 'K', '10', '5'):
+        shoe.add_to_seen_cards(card=card)
+    assert CompositionDependentPlayer.remaining_composition(shoe=shoe) == (7, 8, 8, 8, 7, 8, 8, 8, 8, 30)
+
+
+@pytest.mark.parametrize(
+    'cards, dealer_up_card, expected',
+    [
+        (['10', '6'], 'K', 'Rh'),
+        (['6', '5'], '6', 'Dh'),
+        (['A', 'A'], '7', 'P'),
+        (['10', '8'], '9', 'S'),
+        (['A', '7'], '3', 'Ds'),
+    ]
+)
+def test_decision(composition_dependent_player, playing_strategy_s17, cards, dealer_up_card, expected):
+    """Tests the decision method within the CompositionDependentPlayer class from a full shoe."""
+    shoe = Shoe(shoe_size=6)
+    hand = deal(shoe=shoe, player=composition_dependent_player, cards=cards, dealer_up_card=dealer_up_card)
+    assert composition_dependent_player.decision(
+        playing_strategy=playing_strategy_s17,
+        hand=hand,
+        dealer_up_card=dealer_up_card,
+        max_hands=4,
+        shoe=shoe
+    ) == expected
+
+
+def test_decision_composition(composition_dependent_player, playing_strategy_s17):
+    """
+    Tests the decision method within the CompositionDependentPlayer class
+    when the remaining cards are rich in tens, so 12 vs. 3 stands.
+
+    """
+    shoe = Shoe(shoe_size=1)
+    for card in ('2', '3', '4', '5', '6') * 3:
+        shoe.add_to_seen_cards(card=card)
+    hand = deal(shoe=shoe, player=composition_dependent_player, cards=['10', '2'], dealer_up_card='3')
+    assert composition_dependent_player.decision(
+        playing_strategy=playing_strategy_s17,
+        hand=hand,
+        dealer_up_card='3',
+        max_hands=4,
+        shoe=shoe
+    ) == 'S'
+
+
+def test_decision_uses_cache(composition_dependent_player, playing_strategy_s17):
+    """Tests the decision method within the CompositionDependentPlayer class reuses cached expected values."""
+    shoe = Shoe(shoe_size=6)
+    hand = deal(shoe=shoe, player=composition_dependent_player, cards=['10', '6'], dealer_up_card='K')
+    kwargs = {'playing_strategy': playing_strategy_s17, 'hand': hand, 'dealer_up_card': 'K', 'max_hands': 4, 'shoe': shoe}
+    composition_dependent_player.decision(**kwargs)
+    composition_dependent_player.decision(**kwargs)
+    cache = composition_dependent_player.cache
+    assert (len(cache), cache.hits, cache.misses) == (1, 1, 1)
+
+
+def test_decision_without_shoe(composition_dependent_player, playing_strategy_s17, hand_pair):
+    """
+    Tests the decision method within the CompositionDependentPlayer class
+    when the shoe is not available, so basic strategy is used.
+
+    """
+    assert composition_dependent_player.decision(
+        playing_strategy=playing_strategy_s17,
+        hand=hand_pair,
+        dealer_up_card='7',
+        max_hands=4
+    ) == playing_strategy_s17.pair(card='7', dealer_up_card='7')
@@ -0,0 +1,74 @@
+import pytest
+from blackjack.composition_ev import CompositionEV, LRUCache, composition_bucket
+from blackjack.rules import Rules
+
+
+def six_decks_without(*indices):
+    composition = [24] * 9 + [96]
+    for index in indices:
+        composition[index] -= 1
+    return tuple(composition)
+
+
+def test_lru_cache():
+    """Tests the get and put methods within the LRUCache class."""
+    cache = LRUCache(maxsize=2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_lru_cache_invalid_size():
+    """Tests the __init__ method within the LRUCache class when the size is less than 1."""
+    with pytest.raises(ValueError) as e:
+        LRUCache(maxsize=0)
+    assert str(e.value) == 'Cache size must be at least 1.'
+
+
+def test_composition_bucket():
+    """Tests the composition_bucket function."""
+    assert composition_bucket(composition=(4,) * 9 + (16,), resolution=52) == (4,) * 9 + (16,)
+    assert composition_bucket(composition=(24,) * 9 + (96,), resolution=52) == (4,) * 9 + (16,)
+
+
+def test_dealer_probabilities_sum_to_one(rules):
+    """Tests the dealer outcomes within the CompositionEV class add up to 1."""
+    for up_card, index in (('A', 0), ('6', 5), ('K', 9)):
+        ev = CompositionEV(composition=six_decks_without(index), dealer_up_card=up_card, rules=rules)
+        outcomes = ev._dealer(composition=six_decks_without(index), total=index + 1, has_ace=index == 0, hole_card=True)
+        assert sum(outcomes) == pytest.approx(1)
+
+
+def test_evaluate_sixteen_against_ten(rules):
+    """Tests the evaluate method within the CompositionEV class for 16 vs. 10 from a full six deck shoe."""
+    ev = CompositionEV(composition=six_decks_without(9, 9, 5), dealer_up_card='10', rules=rules)
+    evs = ev.evaluate(cards=['10', '6'], can_double=True, can_split=False, can_surrender=True)
+    assert evs['S'] == pytest.approx(-0.54, abs=0.01)
+    assert evs['H'] == pytest.approx(-0.54, abs=0.01)
+    assert evs['R'] == -0.5
+    assert set(evs) == {'S', 'H', 'D', 'R'}
+
+
+def test_evaluate_eleven_against_six(rules):
+    """Tests the evaluate method within the CompositionEV class when doubling is the best decision."""
+    evs = CompositionEV(composition=six_decks_without(5, 4, 5), dealer_up_card='6', rules=rules).evaluate(
+        cards=['6', '5'], can_double=True, can_split=False, can_surrender=False
+    )
+    assert max(evs, key=evs.__getitem__) == 'D'
+
+
+def test_evaluate_full_removal():
+    """Tests the evaluate method within the CompositionEV class with and without full removal."""
+    rules = Rules(min_bet=10, max_bet=500, s17=False)
+    composition = (4, 3, 3, 4, 4, 3, 4, 4, 4, 15)
+    exact = CompositionEV(composition=composition, dealer_up_card='7', rules=rules, full_removal=True)
+    approximate = CompositionEV(composition=composition, dealer_up_card='7', rules=rules)
+    exact_evs = exact.evaluate(cards=['2', '3'], can_double=True, can_split=False, can_surrender=False)
+    approximate_evs = approximate.evaluate(cards=['2', '3'], can_double=True, can_split=False, can_surrender=False)
+    assert exact_evs['S'] == approximate_evs['S']
+    assert exact_evs['H'] == pytest.approx(approximate_evs['H'], abs=0.02)
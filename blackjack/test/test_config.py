@@ -0,0 +1,174 @@
+import json
+from functools import partial
+from pathlib import Path
+import pytest
+from blackjack.card_counter import CardCounter
+from blackjack.config import (
+    chunk_runs, load_config, make_blackjack, make_player, replay_shoe, run_chunk, simulation_params, validate_config
+)
+from blackjack.runs import play_runs
+
+
+CONFIG = {
+    'rules': {'min_bet': 15, 'max_bet': 2000, 's17': False},
+    'player': {
+        'type': 'CardCounter',
+        'name': 'CC_1',
+        'bankroll': 20000,
+        'min_bet': 15,
+        'card_counting_system': 'HI-LO',
+        'bet_ramp': {'0': 15, '1.5': 30, '3': 75},
+        'insurance': 3
+    },
+    'simulation': {'number_of_runs': 4, 'shoe_size': 2}
+}
+
+
+def test_load_config(tmp_path):
+    """Tests the load_config function with a JSON file."""
+    path = tmp_path / 'config.json'
+    path.write_text(json.dumps(CONFIG))
+    assert load_config(path=path) == CONFIG
+
+
+def test_make_blackjack():
+    """Tests the make_blackjack function."""
+    blackjack = make_blackjack(config=CONFIG)
+    assert blackjack.rules.min_bet == 15
+    assert blackjack.rules.s17 is False
+
+
+def test_make_player():
+    """Tests the make_player function with bet ramp counts read from JSON."""
+    player = make_player(config=CONFIG)
+    assert isinstance(player, CardCounter)
+    assert (player.bet_ramp[0], player.bet_ramp[1.5], player.bet_ramp[3]) == (15, 30, 75)
+    assert CONFIG['player']['type'] == 'CardCounter'
+
+
+def test_make_player_invalid_type():
+    """Tests the make_player function with an unknown player type."""
+    with pytest.raises(ValueError) as e:
+        make_player(config={'player': {'type': 'Dealer'}})
+    assert str(e.value) == 'Player type must be one of Player, CardCounter, BackCounter, not Dealer.'
+
+
+def test_simulation_params():
+    """Tests the simulation_params function fills in defaults."""
+    params = simulation_params(config=CONFIG)
+    assert params['number_of_runs'] == 4
+    assert params['shoe_size'] == 2
+    assert params['penetration'] == 0.75
+    assert params['shoe_sampling'] == 'RANDOM'
+    assert params['shoe_rng'] == 'MT19937'
+
+
+def test_load_config_toml(tmp_path):
+    """Tests the load_config function with a TOML file."""
+    path = tmp_path / 'config.toml'
+    path.write_text(
+        '[rules]\nmin_bet = 15\nmax_bet = 2000\ns17 = false\n\n'
+        '[player]\ntype = "CardCounter"\nname = "CC_1"\nbankroll = 20000\nmin_bet = 15\n'
+        'card_counting_system = "HI-LO"\nbet_ramp = { "0" = 15, "1.5" = 30, "3" = 75 }\ninsurance = 3\n\n'
+        '[simulation]\nnumber_of_runs = 4\nshoe_size = 2\n'
+    )
+    assert load_config(path=path) == CONFIG
+
+
+def test_load_config_toml_example():
+    """Tests the load_config function reads TOML files with further suffixes, like the shipped example."""
+    config = load_config(path=Path(__file__).parents[2] / 'simulation_config.toml.example')
+    validate_config(config=config)
+
+
+def test_validate_config():
+    """Tests the validate_config function accepts a valid configuration and lists every problem of an invalid one."""
+    validate_config(config=CONFIG)
+    config = json.loads(json.dumps(CONFIG))
+    config['rules']['s17'] = 1
+    config['player']['bet_ramp']['high'] = 100
+    config['player']['bankrol'] = 100
+    config['simulation']['penetration'] = 0.95
+    config['tables'] = {}
+    with pytest.raises(ValueError) as e:
+        validate_config(config=config)
+    assert str(e.value) == (
+        'Invalid configuration: tables is not a known section. rules.s17 must be a bool. '
+        'player.bankrol is not a known setting. player.bet_ramp count high must be a number. '
+        'simulation.penetration must be greater than 0 and at most 0.9.'
+    )
+
+
+def test_validate_config_types():
+    """Tests the validate_config function reports settings of the wrong type or out of range without failing."""
+    config = json.loads(json.dumps(CONFIG))
+    config['player']['bet_ramp'] = [15, 30, 75]
+    config['simulation']['shoe_size'] = 9
+    with pytest.raises(ValueError) as e:
+        validate_config(config=config)
+    assert str(e.value) == (
+        'Invalid configuration: player.bet_ramp must be a dict. simulation.shoe_size must be between 1 and 8 decks.'
+    )
+    config = json.loads(json.dumps(CONFIG))
+    config['player'] = ['CardCounter']
+    config['simulation']['shoe_size'] = 0
+    with pytest.raises(ValueError) as e:
+        validate_config(config=config)
+    assert str(e.value) == (
+        'Invalid configuration: player must be a table of settings. simulation.shoe_size must be between 1 and 8 decks.'
+    )
+
+
+def test_chunk_runs():
+    """Tests the chunk_runs function splits runs into chunks of consecutive seeds."""
+    assert chunk_runs(config=CONFIG) == [(0, 1), (1, 1), (2, 1), (3, 1)]
+    config = {'simulation': {'number_of_runs': 5, 'runs_per_chunk': 2}}
+    assert chunk_runs(config=config) == [(0, 2), (2, 2), (4, 1)]
+
+
+def test_validate_config_shoe_rng():
+    """Tests the validate_config function with shoe RNGs."""
+    config = json.loads(json.dumps(CONFIG))
+    config['simulation']['shoe_rng'] = 'PHILOX'
+    validate_config(config=config)
+    config['simulation']['shoe_sampling'] = 'ANTITHETIC'
+    with pytest.raises(ValueError) as e:
+        validate_config(config=config)
+    assert str(e.value) == 'Invalid configuration: simulation.shoe_rng PHILOX requires simulation.shoe_sampling RANDOM.'
+    config['simulation']['shoe_rng'] = 'PCG64'
+    with pytest.raises(ValueError) as e:
+        validate_config(config=config)
+    assert str(e.value) == 'Invalid configuration: simulation.shoe_rng must be one of MT19937, PHILOX.'
+
+
+def test_philox_runs():
+    """Tests PHILOX runs depend only on their run number, and any of their shoes replays directly."""
+    config = json.loads(json.dumps(CONFIG))
+    config['simulation'].update({'number_of_shoes': 3, 'shoe_rng': 'PHILOX'})
+    outcome_counts, total_winnings, total_hands, *_ = run_chunk(config, 2, 1)
+    assert total_hands > 0
+    assert run_chunk(config, 2, 1)[1:3] == (total_winnings, total_hands)
+    assert run_chunk(config, 1, 2)[1] != total_winnings
+
+    trace = replay_shoe(config=config, run=2, shoe_number=1)
+    config['simulation']['number_of_shoes'] = 1
+    assert replay_shoe(config=config, run=2, shoe_number=1) == trace
+
+
+def test_run_chunk_plays_runs():
+    """Tests run_chunk plays the runs of blackjack.runs.play_runs with the configuration's table and player."""
+    config = json.loads(json.dumps(CONFIG))
+    config['simulation']['number_of_shoes'] = 2
+    summary = play_runs(
+        make_blackjack=partial(make_blackjack, config=config),
+        make_player=partial(make_player, config=config),
+        first_run=1,
+        number_of_runs=2,
+        number_of_shoes=2,
+        penetration=0.75,
+        shoe_size=2
+    )
+    chunk = run_chunk(config, 1, 2)
+    assert len(chunk) == 5
+    assert chunk[:3] == summary[:3]
+    assert chunk[3].percentiles([5, 50, 95]).tolist() == summary[3].percentiles([5, 50, 95]).tolist()
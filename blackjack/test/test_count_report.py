@@ -0,0 +1,86 @@
+import csv
+from math import isclose, isnan, sqrt
+import numpy as np
+from blackjack.count_report import COLUMNS, CountReport
+from blackjack.enums import StatsCategory
+from blackjack.stats import Stats
+
+
+def _play(stats, count, winnings, bet=10):
+    stats.stats[(count, StatsCategory.TOTAL_ROUNDS_PLAYED)] += 1
+    stats.stats[(count, StatsCategory.TOTAL_HANDS_PLAYED)] += 1
+    stats.stats[(count, StatsCategory.AMOUNT_BET)] += bet
+    stats.stats[(count, StatsCategory.NET_WINNINGS)] += winnings
+    stats.record_round(count=count, winnings=winnings)
+
+
+def test_from_stats(stats):
+    """Tests the from_stats method within the CountReport class."""
+    report = CountReport.from_stats(stats=stats)
+    # count 2 only has an insurance bet and no rounds, so it has no row
+    assert report['count'].tolist() == [1, 3]
+    assert report['rounds'].tolist() == [1, 1]
+    assert report['hands'].tolist() == [1, 1]
+    assert report['amount_bet'].tolist() == [25, 10]
+    assert report['net_winnings'].tolist() == [-25, -10]
+    assert report['ev_per_round'].tolist() == [-25, -10]
+    assert report['ev_per_unit'].tolist() == [-1, -1]
+    assert report['frequency'].tolist() == [0.5, 0.5]
+
+
+def test_from_stats_statistics():
+    """Tests the standard deviation and confidence interval of the from_stats method within the CountReport class."""
+    stats = Stats()
+    for winnings in (10, -10, 10, -10):
+        _play(stats=stats, count=2, winnings=winnings)
+    _play(stats=stats, count=None, winnings=-10)
+    report = CountReport.from_stats(stats=stats)
+
+    assert report['count'][0] == 2
+    assert isnan(report['count'][1])
+    assert report['ev_per_round'][0] == 0
+    assert report['std_per_round'][0] == 10
+    assert report['frequency'].tolist() == [0.8, 0.2]
+    assert isclose(report['ci_high'][0], 1.959964 * 10 / sqrt(4), rel_tol=1e-6)
+    assert report['ci_low'][0] == -report['ci_high'][0]
+    # a single round has no spread
+    assert report['ci_low'][1] == report['ci_high'][1] == -10
+
+
+def test_from_stats_clipped():
+    """Tests the from_stats method within the CountReport class with counts combined into edge rows."""
+    stats = Stats()
+    for count in (-6, -5, 0, 4, 9):
+        _play(stats=stats, count=count, winnings=count)
+    report = CountReport.from_stats(stats=stats, min_count=-5, max_count=5)
+    assert report['count'].tolist() == [-5, 0, 4, 5]
+    assert report['rounds'].tolist() == [2, 1, 1, 1]
+    assert report['net_winnings'].tolist() == [-11, 0, 4, 9]
+
+
+def test_count_report(stats):
+    """Tests the count_report method within the Stats class."""
+    assert np.array_equal(stats.count_report().to_numpy(), CountReport.from_stats(stats=stats).to_numpy())
+
+
+def test_to_numpy(stats):
+    """Tests the to_numpy method within the CountReport class."""
+    report = CountReport.from_stats(stats=stats)
+    table = report.to_numpy()
+    assert table.dtype.names == COLUMNS
+    table['rounds'] = 0
+    assert report['rounds'].tolist() == [1, 1]
+
+
+def test_to_csv(tmp_path):
+    """Tests the to_csv method within the CountReport class."""
+    stats = Stats()
+    _play(stats=stats, count=1, winnings=10)
+    _play(stats=stats, count=None, winnings=-10)
+    path = CountReport.from_stats(stats=stats).to_csv(path=tmp_path / 'report.csv')
+    with open(path, newline='') as f:
+        rows = list(csv.DictReader(f))
+    assert list(rows[0]) == list(COLUMNS)
+    assert [row['count'] for row in rows] == ['1', '']
+    assert [row['rounds'] for row in rows] == ['1', '1']
+    assert float(rows[1]['ev_per_round']) == -10
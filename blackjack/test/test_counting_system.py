@@ -0,0 +1,166 @@
+import random
+import pytest
+from blackjack.card_counter import CardCounter
+from blackjack.counting_system import (
+    COUNTING_SYSTEMS, CountingSystem, SideCount, get_counting_system, register_counting_system
+)
+from blackjack.enums import CardCountingSystem
+from blackjack.dealer import Dealer
+from blackjack.gameplay import get_count, play_round
+from blackjack.playing_strategy import PlayingStrategy
+from blackjack.shoe import Shoe
+from blackjack.source.card_counting_systems import COUNT_VALUES, HI_OPT_I_VALUES, INITIAL_COUNTS
+from blackjack.table import Table
+
+
+@pytest.fixture
+def hi_opt_i_ace_side_count():
+    counting_system = register_counting_system(CountingSystem(
+        name='HI-OPT I ASC',
+        values=HI_OPT_I_VALUES,
+        side_counts={'ACES': SideCount(values={'A': 1}, betting_weight=1)}
+    ))
+    yield counting_system
+    del COUNTING_SYSTEMS[counting_system.name]
+
+
+def test_get_counting_system():
+    """Tests the get_counting_system function."""
+    hi_lo = get_counting_system(card_counting_system=CardCountingSystem.HI_LO)
+    assert hi_lo.values == COUNT_VALUES[CardCountingSystem.HI_LO]
+    assert get_counting_system(card_counting_system='HI-LO') is hi_lo
+    assert get_counting_system(card_counting_system=hi_lo) is hi_lo
+    with pytest.raises(ValueError) as e:
+        get_counting_system(card_counting_system='RED 7')
+    assert str(e.value) == 'No card counting system named RED 7 is registered.'
+
+
+def test_register_counting_system_duplicate():
+    """Tests the register_counting_system function when the name is already registered."""
+    with pytest.raises(ValueError) as e:
+        register_counting_system(CountingSystem(name='HI-LO', values=HI_OPT_I_VALUES))
+    assert str(e.value) == 'A card counting system named HI-LO is already registered.'
+
+
+def test_init_missing_values():
+    """Tests the __init__ method within the CountingSystem class when card values are missing."""
+    with pytest.raises(ValueError) as e:
+        CountingSystem(name='PARTIAL', values={'2': 1, '3': 1})
+    assert str(e.value).startswith('Card counting values for PARTIAL are missing: ')
+
+
+def test_counting_system_properties():
+    """Tests the properties of the built-in card counting systems."""
+    assert get_counting_system(CardCountingSystem.HI_LO).is_balanced
+    assert not get_counting_system(CardCountingSystem.KO).is_balanced
+    assert get_counting_system(CardCountingSystem.HALVES).is_fractional
+    assert not get_counting_system(CardCountingSystem.ZEN_COUNT).is_fractional
+    assert get_counting_system(CardCountingSystem.KO).initial_running_count(shoe_size=6) == -20
+
+
+@pytest.mark.parametrize('test_card_counting_system', list(CardCountingSystem))
+def test_incremental_running_count(test_card_counting_system):
+    """Tests that the incremental running count matches the count of every seen card, even when first used mid-shoe."""
+    random.seed(7)
+    shoe = Shoe(shoe_size=2, penetration=0.75)
+    shoe.shuffle()
+    values = COUNT_VALUES[test_card_counting_system]
+    for number_of_cards in range(60):
+        if number_of_cards == 30:
+            shoe.running_count(card_counting_system=test_card_counting_system)
+        shoe.deal_card()
+    expected = sum(values[card] * seen for card, seen in shoe.seen_cards.items())
+    expected += INITIAL_COUNTS.get(test_card_counting_system, 0)
+    assert shoe.running_count(card_counting_system=test_card_counting_system) == pytest.approx(expected)
+
+
+def test_side_count(hi_opt_i_ace_side_count):
+    """Tests the side_count and adjusted_running_count methods within the Shoe class."""
+    shoe = Shoe(shoe_size=1)
+    for card in ('K', 'Q', '5', '7', '2', '9', '8', '3', '4', '6', 'J', '10', '2'):
+        shoe.add_to_seen_cards(card=card)
+    # 13 cards seen without an ace, so one more ace than expected remains
+    assert shoe.side_count(card_counting_system='HI-OPT I ASC', side_count='ACES') == 0
+    assert shoe.running_count(card_counting_system='HI-OPT I ASC') == 0
+    assert shoe.adjusted_running_count(card_counting_system='HI-OPT I ASC') == pytest.approx(1)
+    assert shoe.betting_count(card_counting_system='HI-OPT I ASC') == 1
+    shoe.add_to_seen_cards(card='A')
+    assert shoe.adjusted_running_count(card_counting_system=hi_opt_i_ace_side_count) == pytest.approx(14 / 13 - 1)
+
+
+def test_betting_count_resolves_counting_system_once(hi_opt_i_ace_side_count, monkeypatch):
+    """Tests the betting_count method within the Shoe class looks up the card counting system once per query."""
+    import blackjack.shoe
+
+    calls = []
+
+    def counting_get_counting_system(card_counting_system):
+        calls.append(card_counting_system)
+        return get_counting_system(card_counting_system=card_counting_system)
+
+    monkeypatch.setattr(blackjack.shoe, 'get_counting_system', counting_get_counting_system)
+    shoe = Shoe(shoe_size=1)
+    for card in ('K', 'Q', '5', '7', '2', '9', '8', '3', '4', '6', 'J', '10', '2'):
+        shoe.add_to_seen_cards(card=card)
+    assert shoe.betting_count(card_counting_system='HI-OPT I ASC') == 1
+    assert shoe.betting_count(card_counting_system=CardCountingSystem.HI_LO) == shoe.true_count(CardCountingSystem.HI_LO)
+    assert calls == ['HI-OPT I ASC', CardCountingSystem.HI_LO, CardCountingSystem.HI_LO]
+
+
+def test_card_counter_registered_counting_system(hi_opt_i_ace_side_count, rules):
+    """Tests a CardCounter betting off a registered card counting system with a side count."""
+    card_counter = CardCounter(
+        name='Player 5',
+        bankroll=1000,
+        min_bet=10,
+        card_counting_system='HI-OPT I ASC',
+        bet_ramp={1: 20, 2: 40}
+    )
+    assert card_counter.counting_system is hi_opt_i_ace_side_count
+    table = Table(rules=rules)
+    table.add_player(player=card_counter)
+    shoe = Shoe(shoe_size=1)
+    for card in ('K', 'Q', '5', '7', '2', '9', '8', '3', '4', '6', 'J', '10', '2'):
+        shoe.add_to_seen_cards(card=card)
+    count = get_count(table=table, shoe=shoe)[card_counter]
+    assert count == 1
+    assert card_counter.placed_bet(count=count) == 20
+
+
+def test_card_counter_side_count_unbalanced(rules):
+    """Tests a CardCounter betting off KO with an ace side count through play_round."""
+    ko_ace_side_count = CountingSystem(
+        name='KO ASC',
+        values=COUNT_VALUES[CardCountingSystem.KO],
+        initial_count=INITIAL_COUNTS[CardCountingSystem.KO],
+        side_counts={'ACES': SideCount(values={'A': 1}, betting_weight=0.5)}
+    )
+    card_counter = CardCounter(
+        name='Player 6',
+        bankroll=100000,
+        min_bet=10,
+        card_counting_system=ko_ace_side_count,
+        bet_ramp={-18: 10, -16: 20, -14: 40, -12: 80}
+    )
+    table = Table(rules=rules)
+    table.add_player(player=card_counter)
+    dealer = Dealer()
+    playing_strategy = PlayingStrategy(s17=rules.s17)
+    random.seed(3)
+    shoe = Shoe(shoe_size=6)
+    shoe.shuffle()
+    while not shoe.cut_card_reached:
+        play_round(table=table, dealer=dealer, rules=rules, shoe=shoe, playing_strategy=playing_strategy)
+    assert card_counter.stats.rounds_played > 30
+    assert all(type(count) is int for count, _ in card_counter.stats.stats)
+
+
+def test_counting_systems_sharing_a_name():
+    """Tests that an unregistered card counting system reusing a registered name keeps its own count."""
+    shadow = CountingSystem(name='HI-LO', values=HI_OPT_I_VALUES)
+    shoe = Shoe(shoe_size=1)
+    shoe.running_count(card_counting_system=CardCountingSystem.HI_LO)
+    for card in ('2', '7'):
+        shoe.add_to_seen_cards(card=card)
+    assert shoe.running_count(card_counting_system=CardCountingSystem.HI_LO) == 1
+    assert shoe.running_count(card_counting_system=shadow) == 0
@@ -0,0 +1,77 @@
+from collections import Counter
+import random
+from blackjack.blackjack import PROGRESS_BAR_UPDATES, Blackjack
+from blackjack.card_counter import CardCounter
+from blackjack.csm_shoe import CSMShoe
+from blackjack.enums import CardCountingSystem
+from blackjack.player import Player
+
+
+def test_deal_card():
+    """Tests the deal_card method within the CSMShoe class draws without replacement during a round."""
+    shoe = CSMShoe(shoe_size=1)
+    dealt = Counter(shoe.deal_card() for _ in range(52))
+    assert dealt == Counter(['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A'] * 4)
+    assert shoe.cards == []
+
+
+def test_end_round():
+    """Tests the end_round method within the CSMShoe class puts discards back and restarts counts."""
+    shoe = CSMShoe(shoe_size=2)
+    for _ in range(10):
+        shoe.deal_card()
+    shoe.deal_card(seen=False)
+    assert shoe.running_count(card_counting_system=CardCountingSystem.HI_LO) == sum(
+        {'2': 1, '3': 1, '4': 1, '5': 1, '6': 1, '10-J-Q-K': -1, 'A': -1}.get(card, 0) * seen
+        for card, seen in shoe.seen_cards.items()
+    )
+    assert len(shoe.cards) == 93
+    shoe.end_round()
+    assert len(shoe.cards) == 104
+    assert Counter(shoe.cards) == Counter(['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A'] * 8)
+    assert shoe.seen_cards == {}
+    assert shoe.running_count(card_counting_system=CardCountingSystem.HI_LO) == 0
+    assert not shoe.cut_card_reached
+
+
+def test_draws_are_uniform():
+    """Tests the first card of every round is drawn uniformly from the machine."""
+    random.seed(7)
+    shoe = CSMShoe(shoe_size=1)
+    first_cards = Counter()
+    for _ in range(13000):
+        first_cards[shoe.deal_card()] += 1
+        shoe.deal_card()
+        shoe.end_round()
+    assert all(900 <= first_cards[card] <= 1100 for card in ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A'])
+
+
+def test_simulate_csm():
+    """Tests the simulate_csm method within the Blackjack class plays a fixed number of rounds."""
+    blackjack = Blackjack(min_bet=10, max_bet=500)
+    player = Player(name='Player 1', bankroll=100000, min_bet=10)
+    card_counter = CardCounter(
+        name='Card Counter 1',
+        bankroll=100000,
+        min_bet=10,
+        card_counting_system=CardCountingSystem.HI_LO,
+        bet_ramp={1: 10, 2: 20}
+    )
+    shoe_ends = []
+    player.add_shoe_listener(shoe_ends.append)
+    blackjack.add_player(player=player)
+    blackjack.add_player(player=card_counter)
+    blackjack.simulate_csm(number_of_rounds=500, shoe_size=6, seed=3, progress_bar=False)
+    assert player.stats.summary(string=False)['TOTAL ROUNDS PLAYED'] == 500
+    assert card_counter.stats.summary(string=False)['TOTAL ROUNDS PLAYED'] == 500
+    assert len(shoe_ends) == 1
+
+
+def test_simulate_csm_progress_bar(capsys):
+    """Tests the progress bar of simulate_csm is redrawn at most PROGRESS_BAR_UPDATES times, ending at the last round."""
+    blackjack = Blackjack(min_bet=10, max_bet=500)
+    blackjack.add_player(player=Player(name='Player 1', bankroll=1000000, min_bet=10))
+    blackjack.simulate_csm(number_of_rounds=2500, shoe_size=6, seed=3)
+    output = capsys.readouterr().out
+    assert output.count('\r') <= PROGRESS_BAR_UPDATES
+    assert ' 2500/2500 ' in output.split('\r')[-2]
@@ -0,0 +1,125 @@
+import multiprocessing as mp
+import time
+import pytest
+from blackjack.distributed import ChunkQueue, Coordinator, run_worker
+
+
+def square(x):
+    return x * x
+
+
+def fail_on_three(x):
+    if x == 3:
+        raise ValueError('Three is not allowed.')
+    return x
+
+
+def start_workers(coordinator, function, number_of_workers):
+    processes = [
+        mp.get_context('fork').Process(
+            target=run_worker,
+            kwargs={
+                'address': coordinator.address,
+                'function': function,
+                'authkey': coordinator.authkey,
+                'heartbeat_interval': 0.05,
+                'idle_interval': 0.01
+            }
+        )
+        for _ in range(number_of_workers)
+    ]
+    for process in processes:
+        process.start()
+    return processes
+
+
+def test_chunk_queue_order():
+    """Tests the ChunkQueue class hands out chunks in order and discards duplicate results."""
+    chunk_queue = ChunkQueue(chunks=[(1,), (2,)], heartbeat_timeout=60)
+    worker_id = chunk_queue.register_worker()
+    assert chunk_queue.request_chunk(worker_id) == (0, (1,))
+    assert chunk_queue.request_chunk(worker_id) == (1, (2,))
+    chunk_queue.complete(worker_id, 1, 'second')
+    chunk_queue.complete(worker_id, 1, 'duplicate')
+    assert chunk_queue.pop_result(0) == (False, None)
+    assert chunk_queue.pop_result(1) == (True, 'second')
+    chunk_queue.complete(worker_id, 0, 'first')
+    assert chunk_queue.pop_result(0) == (True, 'first')
+    assert chunk_queue.completed() == 2
+    assert chunk_queue.request_chunk(worker_id) is None
+
+
+def test_chunk_queue_requeue_lost_worker():
+    """Tests the ChunkQueue class requeues the chunks of a worker without heartbeats."""
+    chunk_queue = ChunkQueue(chunks=[(1,), (2,), (3,)], heartbeat_timeout=0.05)
+    lost = chunk_queue.register_worker()
+    alive = chunk_queue.register_worker()
+    assert chunk_queue.request_chunk(lost) == (0, (1,))
+    time.sleep(0.1)
+    assert chunk_queue.request_chunk(alive) == (0, (1,))
+
+
+def test_chunk_queue_work_stealing():
+    """Tests the ChunkQueue class lets an idle worker steal the oldest chunk held by another worker."""
+    chunk_queue = ChunkQueue(chunks=[(1,), (2,)], heartbeat_timeout=60)
+    slow = chunk_queue.register_worker()
+    fast = chunk_queue.register_worker()
+    assert chunk_queue.request_chunk(slow) == (0, (1,))
+    assert chunk_queue.request_chunk(fast) == (1, (2,))
+    chunk_queue.complete(fast, 1, 4)
+    assert chunk_queue.request_chunk(fast) == (0, (1,))
+    chunk_queue.complete(fast, 0, 1)
+    chunk_queue.complete(slow, 0, 'late duplicate')
+    assert chunk_queue.pop_result(0) == (True, 1)
+
+
+def test_coordinator():
+    """
+    Tests the Coordinator class with several localhost worker processes
+    and a worker that takes a chunk and never sends a heartbeat.
+
+    """
+    with Coordinator(chunks=[(x,) for x in range(20)], address=('127.0.0.1', 0), heartbeat_timeout=0.5) as coordinator:
+        lost_queue = coordinator._manager.get_chunk_queue()
+        lost_worker = lost_queue.register_worker()
+        assert lost_queue.request_chunk(lost_worker) == (0, (0,))
+
+        processes = start_workers(coordinator=coordinator, function=square, number_of_workers=3)
+        assert list(coordinator.results()) == [square(x) for x in range(20)]
+    for process in processes:
+        process.join(timeout=10)
+        assert process.exitcode == 0
+
+
+def test_coordinator_failed_chunk():
+    """Tests the Coordinator class when a chunk raises an exception on a worker."""
+    with Coordinator(chunks=[(x,) for x in range(5)], address=('127.0.0.1', 0)) as coordinator:
+        processes = start_workers(coordinator=coordinator, function=fail_on_three, number_of_workers=1)
+        results = coordinator.results()
+        assert [next(results) for _ in range(3)] == [0, 1, 2]
+        with pytest.raises(RuntimeError) as e:
+            next(results)
+        assert 'Chunk 3 failed on a worker' in str(e.value)
+        assert 'Three is not allowed.' in str(e.value)
+    for process in processes:
+        process.join(timeout=10)
+
+
+def test_coordinator_authkey():
+    """Tests the Coordinator class generates a secret key and rejects workers with the wrong key."""
+    with Coordinator(chunks=[(1,)], address=('127.0.0.1', 0)) as coordinator:
+        assert len(coordinator.authkey) == 32 and coordinator.authkey.isalnum()
+        with pytest.raises(mp.AuthenticationError):
+            run_worker(address=coordinator.address, function=square, authkey=b'blackjack')
+
+
+def test_coordinator_fingerprint():
+    """Tests the Coordinator class serves workers with its fingerprint and rejects workers with another one."""
+    with Coordinator(chunks=[(x,) for x in range(3)], address=('127.0.0.1', 0), fingerprint='abc') as coordinator:
+        with pytest.raises(ValueError) as e:
+            run_worker(address=coordinator.address, function=square, authkey=coordinator.authkey, fingerprint='xyz')
+        assert str(e.value) == 'Worker fingerprint xyz does not match the coordinator fingerprint abc.'
+        with pytest.raises(ValueError):
+            run_worker(address=coordinator.address, function=square, authkey=coordinator.authkey)
+        assert run_worker(address=coordinator.address, function=square, authkey=coordinator.authkey, fingerprint='abc') == 3
+        assert list(coordinator.results()) == [0, 1, 4]
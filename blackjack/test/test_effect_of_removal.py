@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+from blackjack.effect_of_removal import (
+    CARD_WEIGHTS, INSURANCE_EFFECTS, correlations, decision_effects_of_removal,
+    evaluate_counting_systems, simulated_effects_of_removal, tag_vector
+)
+from blackjack.source.card_counting_systems import HI_LO_VALUES
+
+
+def test_tag_vector():
+    """Tests the tag_vector function."""
+    assert tag_vector(HI_LO_VALUES).tolist() == [-1, 1, 1, 1, 1, 1, 0, 0, 0, -1]
+
+
+def test_correlations():
+    """Tests the correlations function for several tag vectors at once."""
+    hi_lo = tag_vector(HI_LO_VALUES)
+    result = correlations(tags=np.array([hi_lo, -hi_lo, 2 * hi_lo]), effects=np.array([hi_lo, INSURANCE_EFFECTS]))
+    assert result.shape == (3, 2)
+    assert result[:, 0] == pytest.approx([1, -1, 1])
+    # the published Hi-Lo insurance correlation
+    assert result[0, 1] == pytest.approx(0.76, abs=0.005)
+
+
+def test_correlations_constant_tags():
+    """Tests the correlations function when a tag vector has no variance."""
+    assert correlations(tags=np.ones(10), effects=INSURANCE_EFFECTS)[0, 0] == 0
+
+
+def test_simulated_effects_of_removal(rules):
+    """Tests the simulated_effects_of_removal function."""
+    effects = simulated_effects_of_removal(rules=rules, number_of_shoes=30, shoe_size=1, seed=1)
+    assert effects.shape == (10,)
+    assert CARD_WEIGHTS @ effects == pytest.approx(0, abs=1e-9)
+    assert np.array_equal(effects, simulated_effects_of_removal(rules=rules, number_of_shoes=30, shoe_size=1, seed=1))
+
+
+def test_decision_effects_of_removal(rules):
+    """
+    Tests the decision_effects_of_removal function for 16 vs. 10, where removing
+    small cards favors standing and removing tens favors hitting.
+
+    """
+    effects = decision_effects_of_removal(rules=rules, decisions=[('hard', 16, '10', 0, 'S', 'H')])
+    assert effects.shape == (1, 10)
+    assert effects[0, 4] > 0
+    assert effects[0, 9] < 0
+    assert correlations(tags=tag_vector(HI_LO_VALUES), effects=effects)[0, 0] > 0.5
+
+
+def test_evaluate_counting_systems():
+    """Tests the evaluate_counting_systems function with custom card counting values."""
+    effects = tag_vector(HI_LO_VALUES)
+    results = evaluate_counting_systems(
+        effects=effects,
+        decision_effects=np.array([effects, -effects]),
+        custom_values={'CUSTOM': {**HI_LO_VALUES, '7': 0.5}}
+    )
+    assert [result.name for result in results][-2:] == ['KO', 'CUSTOM']
+    hi_lo = results[0]
+    assert hi_lo.name == 'HI-LO'
+    assert hi_lo.betting_correlation == pytest.approx(1)
+    assert hi_lo.playing_efficiency == pytest.approx(1)
+    assert hi_lo.insurance_correlation == pytest.approx(0.76, abs=0.005)
+    assert results[-1].betting_correlation < 1
@@ -128,6 +128,7 @@ def test_player_initial_decision_insurance_dealer_blackjack(card_counter_unbalan
     assert card_counter_unbalanced.stats.stats[(3, StatsCategory.NET_WINNINGS)] == -10
     assert card_counter_unbalanced.stats.stats[(4, StatsCategory.INSURANCE_AMOUNT_BET)] == 5
     assert card_counter_unbalanced.stats.stats[(4, StatsCategory.INSURANCE_NET_WINNINGS)] == 10
+    assert card_counter_unbalanced_hand.insurance_bet == 5
 
 
 def test_player_initial_decision_insurance_player_blackjack_dealer_blackjack(card_counter_unbalanced, dealer):
@@ -223,6 +224,20 @@ def test_play_round_removes_player_on_goal(table):
     assert player not in table.players
 
 
+def test_play_round_records_round_winnings(table, player, dealer, rules):
+    """Tests that play_round records each player's net result for the round."""
+    table.add_player(player=player)
+    playing_strategy = PlayingStrategy(s17=rules.s17)
+    shoe = Shoe(shoe_size=1)
+    shoe.shuffle()
+
+    play_round(table=table, dealer=dealer, rules=rules, shoe=shoe, playing_strategy=playing_strategy)
+
+    winnings = player.bankroll - 1000
+    assert player.stats.round_winnings[None] == winnings
+    assert player.stats.squared_winnings[None] == winnings ** 2
+
+
 def test_player_initial_decision_no_insurance_dealer_blackjack(player, dealer):
     """
     Tests the player_initial_decision function when the player does
@@ -1363,3 +1378,27 @@ def test_play_round_add_and_remove_back_counters(table, dealer, player, rules, b
     count_round_2 = shoe.true_count(card_counting_system=back_counter.card_counting_system)
     assert count_round_2 <= back_counter.exit_point
     assert back_counter.stats.stats[(count_round_2, StatsCategory.TOTAL_ROUNDS_PLAYED)] == 0
+
+
+def test_play_round_seated_back_counter_bets_own_ramp(table, dealer, player, rules, back_counter):
+    """
+    Tests the play_round function when a seated back counter stays in,
+    which bets from its own ramp rather than the bet of the player before it.
+
+    """
+    shoe = Shoe(shoe_size=1, penetration=0.75)
+    playing_strategy = PlayingStrategy(s17=rules.s17)
+    table.add_player(player=player)
+    table.add_player(player=back_counter)
+    for _ in range(0, 3):
+        shoe.add_to_seen_cards(card='2')
+    # every hand is a hard 17 of neutral cards, so the count stays above the exit point
+    shoe._cards = ['9', '8'] * 20
+    play_round(table=table, dealer=dealer, shoe=shoe, rules=rules, playing_strategy=playing_strategy)
+    assert back_counter in table.players
+    count = get_count(table=table, shoe=shoe)[back_counter]
+    assert count > back_counter.exit_point
+    play_round(table=table, dealer=dealer, shoe=shoe, rules=rules, playing_strategy=playing_strategy)
+    assert back_counter.stats.stats[(count, StatsCategory.TOTAL_ROUNDS_PLAYED)] == 1
+    assert back_counter.stats.stats[(count, StatsCategory.AMOUNT_BET)] == back_counter.placed_bet(count=count)
+    assert back_counter.placed_bet(count=count) != player.placed_bet(count=count)
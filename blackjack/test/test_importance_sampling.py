@@ -0,0 +1,97 @@
+from math import isclose, log
+import pytest
+from blackjack.importance_sampling import ImportanceSampler, RoundOutcomes
+
+
+def test_round_outcomes(player):
+    """Tests that RoundOutcomes records the net result of every round."""
+    round_outcomes = RoundOutcomes(player=player)
+    for bankroll in [1010, 990, 1005]:
+        player.update_aggregate(bankroll=bankroll)
+    assert list(round_outcomes.outcomes) == [10, -20, 15]
+
+
+def test_round_outcomes_reset_bankroll(player):
+    """Tests that RoundOutcomes measures every round from the initial bankroll when it is reset."""
+    round_outcomes = RoundOutcomes(player=player, reset_bankroll=True)
+    for bankroll in [1010, 990]:
+        player.update_aggregate(bankroll=bankroll)
+    assert list(round_outcomes.outcomes) == [10, -10]
+
+
+def test_init_no_outcomes():
+    """Tests the __init__ method within the ImportanceSampler class without round outcomes."""
+    with pytest.raises(ValueError) as e:
+        ImportanceSampler(round_outcomes=[])
+    assert str(e.value) == 'At least one round outcome is required.'
+
+
+def test_lundberg_exponent():
+    """Tests that the default tilt solves E[exp(tilt * X)] = 1."""
+    sampler = ImportanceSampler(round_outcomes=[1] * 55 + [-1] * 45)
+    assert isclose(sampler.tilt, log(0.45 / 0.55))
+    assert ImportanceSampler(round_outcomes=[1] * 45 + [-1] * 55).tilt == 0
+
+
+def test_estimate_unlimited_rounds():
+    """
+    Tests the estimate method within the ImportanceSampler class for a simple
+    random walk, where the likelihood ratio of every ruined path is exact.
+
+    """
+    sampler = ImportanceSampler(round_outcomes=[1] * 55 + [-1] * 45)
+    result = sampler.estimate(bankroll=30, number_of_sessions=500, seed=1)
+    assert isclose(result.risk_of_ruin, (0.45 / 0.55) ** 30)
+    assert result.lower <= result.risk_of_ruin <= result.upper
+
+
+def test_estimate_matches_plain_monte_carlo():
+    """Tests that the tilted estimate agrees with an untilted one over a finite number of rounds."""
+    outcomes = [1] * 55 + [-1] * 45
+    tilted = ImportanceSampler(round_outcomes=outcomes).estimate(
+        bankroll=10, rounds=200, number_of_sessions=20_000, seed=1
+    )
+    plain = ImportanceSampler(round_outcomes=outcomes, tilt=0).estimate(
+        bankroll=10, rounds=200, number_of_sessions=20_000, seed=2
+    )
+    assert abs(tilted.risk_of_ruin - plain.risk_of_ruin) < 3 * plain.standard_error
+    assert tilted.standard_error < plain.standard_error / 4
+
+
+def test_estimate_bankroll_goal():
+    """Tests that sessions reaching the bankroll goal are never counted as ruined."""
+    sampler = ImportanceSampler(round_outcomes=[1] * 55 + [-1] * 45)
+    with_goal = sampler.estimate(bankroll=10, bankroll_goal=20, number_of_sessions=5_000, seed=1)
+    # gambler's ruin: P(hit 0 before 20 from 10) = (r^10 - r^20) / (1 - r^20), r = q / p
+    r = 0.45 / 0.55
+    assert isclose(with_goal.risk_of_ruin, (r ** 10 - r ** 20) / (1 - r ** 20), rel_tol=0.05)
+
+
+def test_estimate_unlimited_rounds_negative_ev():
+    """Tests the estimate method within the ImportanceSampler class with a negative EV."""
+    sampler = ImportanceSampler(round_outcomes=[1] * 45 + [-1] * 55)
+    assert sampler.estimate(bankroll=10).risk_of_ruin == 1
+    with pytest.raises(ValueError):
+        ImportanceSampler(round_outcomes=[1] * 55 + [-1] * 45, tilt=0).estimate(bankroll=10)
+
+
+def test_estimate_unlimited_rounds_positive_tilt():
+    """Tests the estimate method within the ImportanceSampler class rejects unbounded sessions that may never end."""
+    sampler = ImportanceSampler(round_outcomes=[1] * 55 + [-1] * 45, tilt=0.1)
+    with pytest.raises(ValueError) as e:
+        sampler.estimate(bankroll=10)
+    assert str(e.value) == 'Unlimited sessions require a tilt that gives the round outcomes a negative mean.'
+    assert 0 <= sampler.estimate(bankroll=10, rounds=100, number_of_sessions=100, seed=1).risk_of_ruin <= 1
+    assert 0 <= sampler.estimate(bankroll=10, bankroll_goal=20, number_of_sessions=100, seed=1).risk_of_ruin <= 1
+
+
+def test_estimate_batches():
+    """Tests the estimate method within the ImportanceSampler class simulates sessions in batches."""
+    sampler = ImportanceSampler(round_outcomes=[1] * 55 + [-1] * 45)
+    result = sampler.estimate(bankroll=30, number_of_sessions=500, seed=1, batch_size=64)
+    assert isclose(result.risk_of_ruin, (0.45 / 0.55) ** 30)
+    assert result.number_of_sessions == 500
+
+    with pytest.raises(ValueError) as e:
+        sampler.estimate(bankroll=30, batch_size=0)
+    assert str(e.value) == 'Batch size must be at least 1.'
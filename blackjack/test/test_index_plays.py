@@ -0,0 +1,235 @@
+import pytest
+from blackjack.card_counter import CardCounter
+from blackjack.enums import CardCountingSystem
+from blackjack.hand import Hand
+from blackjack.index_plays import IndexPlays
+from blackjack.shoe import Shoe
+
+
+def make_hand(*cards, was_split=False):
+    hand = Hand(was_split=was_split)
+    for card in cards:
+        hand.add_card(card=card)
+    return hand
+
+
+@pytest.fixture
+def index_plays_s17():
+    return IndexPlays(s17=True)
+
+
+@pytest.mark.parametrize(
+    'cards, dealer_up_card, count, expected',
+    [
+        (('10', '2'), '2', 3, 'S'),   # 12 vs. 2 stands at +3
+        (('10', '2'), '2', 2, 'H'),
+        (('10', '2'), '4', -1, 'H'),  # 12 vs. 4 hits below 0
+        (('10', '3'), '2', -1, 'S'),
+        (('10', '3'), '2', -2, 'H'),
+        (('K', 'K'), '6', 4, 'P'),    # tens split vs. 6 at +4
+        (('10', '10'), '6', 3, 'S'),
+        (('6', '5'), 'A', 1, 'Dh'),
+        (('6', '5'), 'A', 0, 'H'),
+        (('7', '2'), '7', 3, 'Dh'),
+        (('7', '3'), 'Q', 4, 'Dh'),
+    ]
+)
+def test_decision(index_plays_s17, playing_strategy_s17, cards, dealer_up_card, count, expected):
+    """Tests the decision method within the IndexPlays class for the Illustrious 18."""
+    hand = make_hand(*cards)
+    assert index_plays_s17.decision(
+        playing_strategy=playing_strategy_s17,
+        hand=hand,
+        dealer_up_card=dealer_up_card,
+        count=count,
+        split_allowed=hand.cards[0] == hand.cards[1]
+    ) == expected
+
+
+@pytest.mark.parametrize(
+    'cards, dealer_up_card, count, expected',
+    [
+        (('10', '5'), 'K', 4, 'Rs'),  # surrender at 0, stand at +4
+        (('10', '5'), 'K', 0, 'Rh'),
+        (('10', '5'), 'K', -1, 'H'),  # Fab 4 overrides basic strategy surrender
+        (('10', '4'), '10', 3, 'Rh'),
+        (('10', '4'), '10', 2, 'H'),
+        (('10', '6'), '10', -5, 'Rh'),  # basic strategy surrender without an index
+        (('10', '6'), '10', 0, 'Rs'),
+    ]
+)
+def test_decision_surrender(index_plays_s17, playing_strategy_s17, cards, dealer_up_card, count, expected):
+    """Tests the decision method within the IndexPlays class for the Fab 4 surrenders."""
+    assert index_plays_s17.decision(
+        playing_strategy=playing_strategy_s17,
+        hand=make_hand(*cards),
+        dealer_up_card=dealer_up_card,
+        count=count,
+        split_allowed=False
+    ) == expected
+
+
+def test_decision_surrender_not_possible(index_plays_s17, playing_strategy_s17):
+    """
+    Tests the decision method within the IndexPlays class
+    when the hand has more than two cards or was split.
+
+    """
+    for hand in (make_hand('10', '3', '2'), make_hand('10', '5', was_split=True)):
+        assert index_plays_s17.decision(
+            playing_strategy=playing_strategy_s17,
+            hand=hand,
+            dealer_up_card='10',
+            count=4,
+            split_allowed=False
+        ) == 'S'
+        assert index_plays_s17.decision(
+            playing_strategy=playing_strategy_s17,
+            hand=hand,
+            dealer_up_card='10',
+            count=3,
+            split_allowed=False
+        ) == 'H'
+
+
+def test_decision_fallback(index_plays_s17, playing_strategy_s17, hand_with_ace):
+    """
+    Tests the decision method within the IndexPlays class
+    when there is no index play for the hand.
+
+    """
+    for count in (-10, 0, 10):
+        assert index_plays_s17.decision(
+            playing_strategy=playing_strategy_s17,
+            hand=hand_with_ace,
+            dealer_up_card='3',
+            count=count,
+            split_allowed=False
+        ) == playing_strategy_s17.soft(total=17, dealer_up_card='3')
+
+
+def test_h17_indices(playing_strategy_h17):
+    """Tests the H17 indices within the IndexPlays class."""
+    index_plays = IndexPlays(s17=False)
+    hand = make_hand('6', '5')
+    assert index_plays.decision(
+        playing_strategy=playing_strategy_h17, hand=hand, dealer_up_card='A', count=-1, split_allowed=False
+    ) == 'Dh'
+    assert index_plays.decision(
+        playing_strategy=playing_strategy_h17, hand=hand, dealer_up_card='A', count=-2, split_allowed=False
+    ) == 'H'
+    assert index_plays.decision(
+        playing_strategy=playing_strategy_h17, hand=make_hand('9', '6'), dealer_up_card='A', count=-1, split_allowed=False
+    ) == 'Rh'
+    assert index_plays.insurance == 3
+
+
+def test_init_unsupported_system():
+    """
+    Tests the __init__ method within the IndexPlays class
+    when there are no index plays for the card counting system.
+
+    """
+    with pytest.raises(ValueError) as e:
+        IndexPlays(s17=True, card_counting_system=CardCountingSystem.KO)
+    assert str(e.value) == 'No index plays are available for the KO system. Pass plays, surrenders and insurance for it.'
+
+    with pytest.raises(ValueError):
+        IndexPlays(s17=True, card_counting_system=CardCountingSystem.KO, plays=[], surrenders=[])
+
+    index_plays = IndexPlays(
+        s17=True,
+        card_counting_system=CardCountingSystem.KO,
+        plays=[('hard', 16, '10', 4, 'S', 'H')],
+        surrenders=[],
+        insurance=3
+    )
+    assert index_plays.insurance == 3
+
+
+def test_decision_surrender_double(playing_strategy_s17):
+    """
+    Tests the decision method within the IndexPlays class when a surrender
+    index applies to a hand that basic strategy doubles.
+
+    """
+    index_plays = IndexPlays(s17=True, surrenders=[('hard', 11, '10', 5)])
+    kwargs = {'playing_strategy': playing_strategy_s17, 'hand': make_hand('6', '5'), 'dealer_up_card': '10', 'split_allowed': False}
+    assert index_plays.decision(count=5, **kwargs) == 'Rh'
+    assert index_plays.decision(count=4, **kwargs) == 'Dh'
+
+
+def test_card_counter_decision(playing_strategy_s17):
+    """Tests the decision method within the CardCounter class when using index plays."""
+    card_counter = CardCounter(
+        name='Player 2',
+        bankroll=1000,
+        min_bet=10,
+        card_counting_system=CardCountingSystem.HI_LO,
+        bet_ramp={1: 10, 2: 20},
+        index_plays=IndexPlays(s17=True)
+    )
+    hand = card_counter.get_first_hand()
+    hand.add_card(card='10')
+    hand.add_card(card='6')
+    kwargs = {'playing_strategy': playing_strategy_s17, 'hand': hand, 'dealer_up_card': '9', 'max_hands': 4}
+    assert card_counter.decision(count=5, **kwargs) == 'Rs'
+    assert card_counter.decision(count=4, **kwargs) == 'Rh'
+    assert card_counter.decision(**kwargs) == 'Rh'
+    assert card_counter.insurance == 3
+
+    # the count when the decision is made takes precedence over the count the bet used
+    shoe = Shoe(shoe_size=1)
+    for card in ['2', '3', '4', '5', '6']:
+        shoe.add_to_seen_cards(card=card)
+    assert card_counter.decision(count=0, shoe=shoe, **kwargs) == 'Rs'
+
+
+def test_card_counter_decision_count_queries(playing_strategy_s17, monkeypatch):
+    """
+    Tests the decision method within the CardCounter class only asks the
+    shoe for the count when the hand has an index play.
+
+    """
+    queries = []
+    betting_count = Shoe.betting_count
+    monkeypatch.setattr(Shoe, 'betting_count', lambda self, **kwargs: queries.append(1) or betting_count(self, **kwargs))
+    shoe = Shoe(shoe_size=1)
+    kwargs = {'playing_strategy': playing_strategy_s17, 'dealer_up_card': '9', 'max_hands': 4, 'shoe': shoe}
+
+    flat = CardCounter(
+        name='Player 2', bankroll=1000, min_bet=10, card_counting_system=CardCountingSystem.HI_LO, bet_ramp={1: 10}
+    )
+    assert flat.decision(hand=make_hand('10', '6'), **kwargs) == 'Rh'
+    assert not queries
+
+    card_counter = CardCounter(
+        name='Player 3',
+        bankroll=1000,
+        min_bet=10,
+        card_counting_system=CardCountingSystem.HI_LO,
+        bet_ramp={1: 10},
+        index_plays=IndexPlays(s17=True)
+    )
+    assert card_counter.decision(hand=make_hand('10', '2'), **kwargs) == 'H'
+    assert not queries
+    assert card_counter.decision(hand=make_hand('10', '6'), **kwargs) == 'Rh'
+    assert len(queries) == 1
+
+
+def test_card_counter_index_plays_system():
+    """
+    Tests the __init__ method within the CardCounter class
+    when the index plays use a different card counting system.
+
+    """
+    with pytest.raises(ValueError) as e:
+        CardCounter(
+            name='Player 2',
+            bankroll=1000,
+            min_bet=10,
+            card_counting_system=CardCountingSystem.KO,
+            bet_ramp={1: 10, 2: 20},
+            index_plays=IndexPlays(s17=True)
+        )
+    assert str(e.value) == "Player 2's index plays must use the KO system."
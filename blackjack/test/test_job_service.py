@@ -0,0 +1,189 @@
+import asyncio
+import json
+import pytest
+from blackjack.enums import JobStatus
+from blackjack.job_service import JobService
+
+
+CONFIG = {
+    'rules': {'min_bet': 10, 'max_bet': 500},
+    'player': {
+        'type': 'CardCounter',
+        'name': 'CC_1',
+        'bankroll': 2000,
+        'min_bet': 10,
+        'card_counting_system': 'HI-LO',
+        'bet_ramp': {'0': 10, '2': 40}
+    },
+    'simulation': {'number_of_runs': 6, 'number_of_shoes': 2, 'shoe_size': 2, 'runs_per_chunk': 2}
+}
+
+
+async def request(service, method, path, body=None):
+    """Sends an HTTP request to the service and returns the status code and body."""
+    if isinstance(service.address, str):
+        reader, writer = await asyncio.open_unix_connection(service.address)
+    else:
+        reader, writer = await asyncio.open_connection(*service.address[:2])
+    data = json.dumps(body).encode() if body is not None else b''
+    writer.write(f'{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(data)}\r\n\r\n'.encode() + data)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, content = response.partition(b'\r\n\r\n')
+    return int(head.split(b' ')[1]), content
+
+
+def run(coroutine_function, **kwargs):
+    """Runs a test coroutine against a started service."""
+    async def main():
+        service = JobService(max_workers=2, **kwargs)
+        await service.start()
+        try:
+            return await coroutine_function(service)
+        finally:
+            await service.close()
+    return asyncio.run(main())
+
+
+def test_submit_and_stream(tmp_path):
+    """Tests submitting a job over HTTP and streaming its progress until the results are stored."""
+    # one run per chunk keeps the job running long enough to stream partial results
+    config = json.loads(json.dumps(CONFIG))
+    config['simulation'].update({'number_of_runs': 12, 'number_of_shoes': 5, 'runs_per_chunk': 1})
+
+    async def scenario(service):
+        status, content = await request(service, 'POST', '/jobs', config)
+        assert status == 202
+        job_id = json.loads(content)['id']
+
+        status, content = await request(service, 'GET', f'/jobs/{job_id}/events')
+        assert status == 200
+        updates = [json.loads(line) for line in content.splitlines()]
+        assert updates[-1]['status'] == 'COMPLETED'
+        # updates that arrive together are streamed once, so progress may skip chunks
+        progress = [update['runs_completed'] for update in updates]
+        assert progress == sorted(progress)
+        assert progress[-1] == 12
+        assert any(update['status'] == 'RUNNING' and 0 < update['runs_completed'] < 12 for update in updates)
+        assert all('results' in update for update in updates if update['runs_completed'])
+
+        status, content = await request(service, 'GET', f'/jobs/{job_id}')
+        return json.loads(content)
+
+    summary = run(scenario, results_directory=tmp_path)
+    assert summary['runs_completed'] == 12
+    results = summary['results']
+    assert results['bankrupt_count'] + results['goal_count'] + results['ran_out_count'] == 12
+    stored = json.loads((tmp_path / f'{summary["id"]}.json').read_text())
+    assert stored['results'] == results
+    assert stored['config'] == config
+
+
+def test_progress_while_submitting():
+    """
+    Tests that chunks are merged while the rest of the job is still waiting for
+    a free slot in the pool, rather than once every chunk has been submitted.
+
+    """
+    config = json.loads(json.dumps(CONFIG))
+    config['simulation'].update({'number_of_runs': 10, 'runs_per_chunk': 1})
+
+    async def scenario(service):
+        job = service.submit(config=config)
+        progress = []
+        while not job.is_finished:
+            await job.updated.wait()
+            if job.status == JobStatus.RUNNING:
+                progress.append(job.summary()['runs_completed'])
+        return progress
+
+    async def main():
+        service = JobService(max_workers=1)
+        await service.start()
+        try:
+            return await scenario(service)
+        finally:
+            await service.close()
+
+    progress = [runs for runs in asyncio.run(main()) if runs]
+    # before, the first chunk was merged once all but the last 2 * max_workers chunks had finished
+    assert progress and progress[0] < 8
+
+
+def test_jobs_run_in_order():
+    """Tests that queued jobs share the pool and finish in the order submitted."""
+    async def scenario(service):
+        jobs = [service.submit(config=CONFIG) for _ in range(3)]
+        assert [job.status for job in jobs] == [JobStatus.QUEUED] * 3
+        while not jobs[-1].is_finished:
+            await jobs[-1].updated.wait()
+        assert all(job.status == JobStatus.COMPLETED for job in jobs)
+        # identical configurations play identical seeds
+        assert len({json.dumps(job.summary()['results']) for job in jobs}) == 1
+        status, content = await request(service, 'GET', '/jobs')
+        return status, [job['id'] for job in json.loads(content)]
+
+    assert run(scenario) == (200, ['1', '2', '3'])
+
+
+def test_invalid_requests():
+    """Tests the service rejects invalid configurations and unknown paths."""
+    async def scenario(service):
+        status, content = await request(service, 'POST', '/jobs', {'rules': {'min_bet': 10}})
+        assert status == 400
+        assert json.loads(content)['error'].startswith('Invalid configuration:')
+        config = json.loads(json.dumps(CONFIG))
+        config['simulation']['penetration'] = 0.95
+        status, content = await request(service, 'POST', '/jobs', config)
+        assert status == 400
+        assert 'simulation.penetration must be greater than 0 and at most 0.9.' in json.loads(content)['error']
+        config = json.loads(json.dumps(CONFIG))
+        config['player']['bet_ramp'] = {'0': 5, '2': 40}
+        status, content = await request(service, 'POST', '/jobs', config)
+        assert status == 400
+        assert json.loads(content)['error'] == (
+            "Invalid configuration: CC_1's desired bet is not allowed according to the table rules."
+        )
+        config['player']['bet_ramp'] = [10, 40]
+        status, content = await request(service, 'POST', '/jobs', config)
+        assert status == 400
+        assert json.loads(content)['error'] == 'Invalid configuration: player.bet_ramp must be a dict.'
+        assert service.jobs == []
+        assert (await request(service, 'GET', '/jobs/42'))[0] == 404
+        assert (await request(service, 'GET', '/other'))[0] == 404
+        assert (await request(service, 'DELETE', '/jobs'))[0] == 405
+
+    run(scenario)
+
+
+def failing_chunk(config, first_seed, number_of_runs):
+    raise ValueError(f'Chunk starting at seed {first_seed} failed.')
+
+
+def test_failed_job(monkeypatch):
+    """Tests a job whose runs raise an exception is marked as failed."""
+    monkeypatch.setattr('blackjack.job_service.run_chunk', failing_chunk)
+
+    async def scenario(service):
+        job = service.submit(config=CONFIG)
+        while not job.is_finished:
+            await job.updated.wait()
+        return job.summary()
+
+    summary = run(scenario)
+    assert summary['status'] == 'FAILED'
+    assert summary['error'] == 'ValueError: Chunk starting at seed 0 failed.'
+
+
+def test_unix_socket(tmp_path):
+    """Tests the service listening on a Unix socket."""
+    async def main():
+        service = JobService(max_workers=1)
+        await service.start(path=str(tmp_path / 'jobs.sock'))
+        try:
+            return await request(service, 'GET', '/jobs')
+        finally:
+            await service.close()
+
+    assert asyncio.run(main()) == (200, b'[]')
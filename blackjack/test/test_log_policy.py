@@ -0,0 +1,99 @@
+import json
+import pytest
+from blackjack.blackjack import Blackjack
+from blackjack.card_counter import CardCounter
+from blackjack.enums import CardCountingSystem, RoundAction
+from blackjack.hand import Hand
+from blackjack.log_policy import LogPolicy
+
+
+def _blackjack() -> tuple[Blackjack, CardCounter]:
+    blackjack = Blackjack(min_bet=10, max_bet=500)
+    card_counter = CardCounter(
+        name='CC_1',
+        bankroll=100000,
+        min_bet=10,
+        card_counting_system=CardCountingSystem.HI_LO,
+        bet_ramp={1: 20, 2: 40, 3: 80},
+        insurance=0
+    )
+    blackjack.add_player(player=card_counter)
+    return blackjack, card_counter
+
+
+def test_init_invalid():
+    """Tests the __init__ method within the LogPolicy class with invalid arguments."""
+    with pytest.raises(ValueError) as e:
+        LogPolicy(every=0)
+    assert str(e.value) == 'Every must be at least 1.'
+
+    with pytest.raises(ValueError) as e:
+        LogPolicy(min_count=-1)
+    assert str(e.value) == 'Minimum count must be greater than or equal to 0.'
+
+
+def test_log_round(shoe):
+    """Tests the log_round method within the LogPolicy class samples every nth round of the given shoes."""
+    log_policy = LogPolicy(every=3)
+    assert [log_policy.log_round(shoe=shoe) for _ in range(7)] == [True, False, False, True, False, False, True]
+    assert log_policy.rounds == 7
+
+    assert LogPolicy(shoe_ids=[shoe.shoe_id]).log_round(shoe=shoe)
+    assert not LogPolicy(shoe_ids=['other']).log_round(shoe=shoe)
+
+
+def test_log_player(player, card_counter_balanced):
+    """Tests the log_player method within the LogPolicy class with player and count filters."""
+    log_policy = LogPolicy(players=['Player 2'], min_count=2)
+    assert log_policy.log_player(player=card_counter_balanced, count=-2, placed_bet=10)
+    assert not log_policy.log_player(player=card_counter_balanced, count=1, placed_bet=10)
+    assert not log_policy.log_player(player=player, count=3, placed_bet=10)
+    assert not LogPolicy(min_count=0).log_player(player=player, count=None, placed_bet=10)
+
+
+def test_log_player_actions(player):
+    """Tests the log_player method within the LogPolicy class with action filters."""
+    splits = LogPolicy(actions=[RoundAction.SPLIT])
+    doubles = LogPolicy(actions=[RoundAction.DOUBLE])
+    insurance = LogPolicy(actions=[RoundAction.INSURANCE])
+
+    player.get_first_hand().add_to_total_bet(amount=10)
+    assert not any(policy.log_player(player=player, count=None, placed_bet=10) for policy in (splits, doubles, insurance))
+
+    player.get_first_hand().insurance_bet = 5
+    assert insurance.log_player(player=player, count=None, placed_bet=10)
+
+    player.hands.append(Hand(was_split=True))
+    assert splits.log_player(player=player, count=None, placed_bet=10)
+
+    player.hands[-1].add_to_total_bet(amount=20)
+    assert doubles.log_player(player=player, count=None, placed_bet=10)
+
+
+def test_simulate_log_policy(tmp_path):
+    """Tests the simulate method within the Blackjack class only logs the rounds a LogPolicy keeps."""
+    blackjack, card_counter = _blackjack()
+    blackjack.simulate(
+        penetration=0.75, number_of_shoes=4, shoe_size=2, seed=2, progress_bar=False,
+        _logfile=tmp_path / 'every.json', _log_policy=LogPolicy(every=5)
+    )
+    rounds = card_counter.stats.rounds_played
+    assert len((tmp_path / 'every.json').read_text().splitlines()) == (rounds + 4) // 5
+
+    blackjack, filtered_card_counter = _blackjack()
+    blackjack.simulate(
+        penetration=0.75, number_of_shoes=4, shoe_size=2, seed=2, progress_bar=False,
+        _logfile=tmp_path / 'insurance.json', _log_policy=LogPolicy(actions=[RoundAction.INSURANCE])
+    )
+    # filtering the log never changes the cards dealt
+    assert filtered_card_counter.bankroll == card_counter.bankroll
+    entries = [json.loads(line) for line in (tmp_path / 'insurance.json').read_text().splitlines()]
+    assert entries
+    assert all(entry['dealer_hand'][1] == 'A' and entry['insurance_count'] >= 0 for entry in entries)
+
+    blackjack, _ = _blackjack()
+    blackjack.simulate(
+        penetration=0.75, number_of_shoes=1, shoe_size=2, seed=2, progress_bar=False,
+        _logfile=tmp_path / 'nobody.json', _log_policy=LogPolicy(players=['nobody'])
+    )
+    assert not (tmp_path / 'nobody.json').exists()
@@ -1,3 +1,7 @@
+from blackjack.playing_strategy import PlayingStrategy
+from blackjack.source import basic_strategy
+
+
 def test_hard_h17(playing_strategy_h17):
     """
     Tests the hard method within the PlayingStrategy class
@@ -50,3 +54,12 @@ def test_pair_s17(playing_strategy_s17):
 
     """
     assert playing_strategy_s17.pair(card='8', dealer_up_card='A') == 'P'
+
+
+def test_strategy_tables_are_shared():
+    """Tests that the strategy tables of a rule set are built once and shared by every PlayingStrategy."""
+    first, second = PlayingStrategy(s17=True), PlayingStrategy(s17=True)
+    assert first._hard_dict is second._hard_dict
+    assert basic_strategy.S17_HARD_DICT is first._hard_dict
+    assert basic_strategy.H17_PAIR_DICT['8']['A'] == 'Rp'
+    assert PlayingStrategy(s17=False)._hard_dict is not first._hard_dict
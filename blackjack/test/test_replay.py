@@ -0,0 +1,115 @@
+import json
+import random
+import pytest
+from blackjack.blackjack import Blackjack
+from blackjack.card_counter import CardCounter
+from blackjack.config import replay_shoe
+from blackjack.enums import CardCountingSystem, ShoeSampling
+from blackjack.shoe import Shoe
+
+
+def _blackjack(bankroll: float = 10000) -> tuple[Blackjack, CardCounter]:
+    blackjack = Blackjack(min_bet=10, max_bet=500)
+    card_counter = CardCounter(
+        name='CC_1',
+        bankroll=bankroll,
+        min_bet=10,
+        card_counting_system=CardCountingSystem.HI_LO,
+        bet_ramp={1: 20, 2: 40, 3: 80},
+        insurance=3
+    )
+    blackjack.add_player(player=card_counter)
+    return blackjack, card_counter
+
+
+def _logged_shoes(logfile) -> dict[str, list[dict]]:
+    shoes: dict[str, list[dict]] = {}
+    for line in logfile.read_text().splitlines():
+        entry = json.loads(line)
+        shoes.setdefault(entry['shoe_id'], []).append(entry)
+    return shoes
+
+
+@pytest.mark.parametrize('shoe_sampling', [ShoeSampling.RANDOM, ShoeSampling.ANTITHETIC])
+def test_replay_matches_simulate(tmp_path, shoe_sampling):
+    """Tests the replay method within the Blackjack class re-plays a shoe of simulate exactly."""
+    logfile = tmp_path / 'log.json'
+    blackjack, _ = _blackjack()
+    blackjack.simulate(
+        penetration=0.75, number_of_shoes=4, shoe_size=2, seed=7,
+        progress_bar=False, shoe_sampling=shoe_sampling, _logfile=logfile
+    )
+    shoe_id, logged = list(_logged_shoes(logfile=logfile).items())[3]
+
+    blackjack, card_counter = _blackjack(bankroll=logged[0]['bankroll_start'])
+    trace = []
+    shoe = blackjack.replay(
+        shoe_number=3, penetration=0.75, shoe_size=2, seed=7, shoe_sampling=shoe_sampling, _trace=trace.append
+    )
+    results = [event for event in trace if event['event'] == 'result']
+    assert shoe.shoe_id == shoe_id
+    assert [event['bankroll_end'] for event in results] == [entry['bankroll_end'] for entry in logged]
+    assert [event['round'] for event in results] == list(range(len(logged)))
+    assert {event['shoe'] for event in trace} == {3}
+
+    decisions = [event for event in trace if event['event'] == 'decision']
+    assert decisions
+    assert all(event['player'] == 'CC_1' and event['current_count'] is not None for event in decisions)
+
+
+def test_replay_rounds():
+    """Tests the replay method within the Blackjack class only traces the requested rounds."""
+    full_trace = []
+    blackjack, _ = _blackjack()
+    blackjack.replay(shoe_number=1, penetration=0.75, shoe_size=2, seed=3, _trace=full_trace.append)
+
+    trace = []
+    blackjack, card_counter = _blackjack()
+    blackjack.replay(
+        shoe_number=1, penetration=0.75, shoe_size=2, seed=3, first_round=2, last_round=4, _trace=trace.append
+    )
+    assert {event['round'] for event in trace} == {2, 3, 4}
+    assert trace == [event for event in full_trace if 2 <= event['round'] <= 4]
+    assert card_counter.stats.rounds_played == 5
+
+
+def test_replay_cards():
+    """Tests the replay method within the Blackjack class with a stored shoe."""
+    random.seed(3)
+    cards = Shoe(shoe_size=2).cards.copy()
+    random.shuffle(cards)
+
+    seeded_trace = []
+    blackjack, _ = _blackjack()
+    blackjack.replay(shoe_number=0, penetration=0.75, shoe_size=2, seed=3, _trace=seeded_trace.append)
+
+    stored_trace = []
+    blackjack, _ = _blackjack()
+    blackjack.replay(shoe_number=0, penetration=0.75, shoe_size=2, cards=cards, _trace=stored_trace.append)
+    assert stored_trace == seeded_trace
+
+
+def test_replay_invalid():
+    """Tests the replay method within the Blackjack class with invalid arguments."""
+    blackjack, _ = _blackjack()
+    with pytest.raises(ValueError) as e:
+        blackjack.replay(shoe_number=0, penetration=0.75, shoe_size=2, seed=1, shoe_sampling=ShoeSampling.STRATIFIED)
+    assert str(e.value) == 'The number of shoes is required to replay stratified sampling.'
+
+    with pytest.raises(ValueError) as e:
+        blackjack.replay(shoe_number=4, penetration=0.75, shoe_size=2, seed=1, number_of_shoes=4)
+    assert str(e.value) == 'Shoe number must be between 0 and 3.'
+
+
+def test_replay_shoe():
+    """Tests the replay_shoe function re-plays a shoe of a run with a given starting bankroll."""
+    config = {
+        'rules': {'min_bet': 10, 'max_bet': 500},
+        'player': {'type': 'CardCounter', 'name': 'CC_1', 'bankroll': 2000, 'min_bet': 10,
+                   'card_counting_system': 'HI-LO', 'bet_ramp': {'2': 40}},
+        'simulation': {'number_of_shoes': 3, 'shoe_size': 2, 'shoe_sampling': 'STRATIFIED'}
+    }
+    trace = replay_shoe(config=config, run=5, shoe_number=2, last_round=1, bankroll=1500)
+    bets = [event for event in trace if event['event'] == 'bet']
+    assert [event['round'] for event in bets] == [0, 1]
+    assert bets[0]['bankroll'] == 1500
@@ -0,0 +1,119 @@
+import json
+from importlib.util import find_spec
+import numpy as np
+import pytest
+from blackjack.blackjack import Blackjack
+from blackjack.enums import StatsCategory
+from blackjack.log_policy import LogPolicy
+from blackjack.results_export import ResultsWriter, RoundLog, read_table, round_log_columns, stats_columns
+
+FORMATS = [
+    'npz',
+    pytest.param('parquet', marks=pytest.mark.skipif(find_spec('pyarrow') is None, reason='pyarrow is not installed'))
+]
+
+
+def test_stats_columns(stats):
+    """Tests the stats_columns function."""
+    columns = stats_columns(stats=stats, run=7, player='Player 1')
+    assert columns['count'].tolist() == [1, 2, 3]
+    assert columns['run'].tolist() == [7, 7, 7]
+    assert columns['player'].tolist() == ['Player 1'] * 3
+    assert columns['total_rounds_played'].tolist() == [1, 0, 1]
+    assert columns['amount_bet'].tolist() == [25, 0, 10]
+    assert columns['insurance_net_winnings'].tolist() == [0, 25, 0]
+    assert 'total_amount_bet' not in columns
+
+
+@pytest.mark.parametrize('format', FORMATS)
+def test_write_chunks(tmp_path, format):
+    """Tests the write method within the ResultsWriter class with several chunks."""
+    with ResultsWriter(path=tmp_path, format=format) as writer:
+        writer.write(table='runs', columns={'run': np.array([0, 1]), 'outcome': np.array(['goal', 'bankrupt'])})
+        writer.write(table='runs', columns={'run': np.array([], dtype=int), 'outcome': np.array([], dtype=str)})
+        writer.write(table='runs', columns={'run': np.array([2]), 'outcome': np.array(['ran_out'])})
+    runs = read_table(path=tmp_path, table='runs')
+    assert runs['run'].tolist() == [0, 1, 2]
+    assert runs['outcome'].tolist() == ['goal', 'bankrupt', 'ran_out']
+
+
+def test_write_invalid(tmp_path):
+    """Tests the ResultsWriter class with an unknown format and uneven columns."""
+    with pytest.raises(ValueError) as e:
+        ResultsWriter(path=tmp_path, format='csv')
+    assert str(e.value) == 'Format must be one of parquet, npz.'
+
+    with ResultsWriter(path=tmp_path, format='npz') as writer:
+        with pytest.raises(ValueError) as e:
+            writer.write(table='runs', columns={'run': np.array([0, 1]), 'outcome': np.array(['goal'])})
+    assert str(e.value) == 'Every column of a chunk must have the same length.'
+
+    with pytest.raises(FileNotFoundError):
+        read_table(path=tmp_path, table='runs')
+
+
+def test_round_log_columns(tmp_path):
+    """Tests the round_log_columns function in batches."""
+    logfile = tmp_path / 'log.json'
+    entry = {
+        'shoe_id': 'abc', 'player': 'Player 1', 'dealer_hand': ['10', '7'], 'dealer_blackjack': False,
+        'count': None, 'insurance_count': None, 'player_hands': [['8', '8', '3'], ['8', '10']], 'bet': 10,
+        'bankroll_start': 1000, 'bankroll_end': 1010
+    }
+    logfile.write_text('\n'.join(json.dumps({**entry, 'count': count}) for count in (1, 2, None)) + '\n')
+    batches = list(round_log_columns(logfile=logfile, run=3, batch_size=2))
+    assert [len(batch['run']) for batch in batches] == [2, 1]
+    assert batches[0]['count'].tolist() == [1, 2]
+    assert np.isnan(batches[1]['count'][0])
+    assert batches[0]['player_hands'][0] == '8,8,3|8,10'
+    assert batches[0]['dealer_hand'][0] == '10,7'
+
+
+@pytest.mark.parametrize('format', FORMATS)
+def test_export_results(tmp_path, format, card_counter_balanced):
+    """Tests the export_results method within the Blackjack class, with a round log."""
+    logfile = tmp_path / 'log.json'
+    blackjack = Blackjack(min_bet=10, max_bet=500)
+    blackjack.add_player(player=card_counter_balanced)
+    blackjack.simulate(penetration=0.75, number_of_shoes=3, shoe_size=2, seed=1, progress_bar=False, _logfile=logfile)
+    with ResultsWriter(path=tmp_path / 'results', format=format) as writer:
+        blackjack.export_results(writer=writer, run=1)
+        writer.write_round_log(logfile=logfile, run=1, batch_size=50)
+
+    stats = card_counter_balanced.stats
+    runs = read_table(path=tmp_path / 'results', table='runs')
+    assert runs['player'].tolist() == [card_counter_balanced.name]
+    assert runs['hands_played'].tolist() == [stats.hands_played]
+    assert np.isclose(runs['winnings'][0], card_counter_balanced.bankroll - 1000)
+
+    count_stats = read_table(path=tmp_path / 'results', table='count_stats')
+    assert count_stats['total_rounds_played'].sum() == stats.rounds_played
+    assert count_stats['net_winnings'].sum() == stats.total(StatsCategory.NET_WINNINGS)
+
+    rounds = read_table(path=tmp_path / 'results', table='rounds')
+    assert len(rounds['run']) == stats.rounds_played
+    assert rounds['bankroll_end'][-1] == card_counter_balanced.bankroll
+
+
+@pytest.mark.parametrize('format', FORMATS)
+def test_write_rounds(tmp_path, format, card_counter_balanced):
+    """Tests the write_rounds method within the ResultsWriter class writes the rows the JSON round log would."""
+    logfile = tmp_path / 'log.json'
+    round_log = RoundLog(run=2)
+    blackjack = Blackjack(min_bet=10, max_bet=500)
+    blackjack.add_player(player=card_counter_balanced)
+    blackjack.simulate(
+        penetration=0.75, number_of_shoes=3, shoe_size=2, seed=1, progress_bar=False, _logfile=logfile,
+        _log_policy=LogPolicy(every=2), _round_log=round_log
+    )
+    assert len(round_log) == (card_counter_balanced.stats.rounds_played + 1) // 2
+    with ResultsWriter(path=tmp_path / 'results', format=format) as writer:
+        writer.write_rounds(round_log=round_log)
+    assert len(round_log) == 0
+
+    rounds = read_table(path=tmp_path / 'results', table='rounds')
+    logged, = round_log_columns(logfile=logfile, run=2)
+    assert rounds.keys() == logged.keys()
+    for name, column in logged.items():
+        np.testing.assert_array_equal(rounds[name], column)
+
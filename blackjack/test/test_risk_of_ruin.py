@@ -0,0 +1,107 @@
+from math import exp, inf, isclose
+import pytest
+from blackjack.enums import RiskOfRuinMethod, StatsCategory
+from blackjack.risk_of_ruin import RiskOfRuin
+from blackjack.stats import Stats, Variance
+
+
+def test_init_invalid_variance():
+    """Tests the __init__ method within the RiskOfRuin class with a non-positive variance."""
+    with pytest.raises(ValueError) as e:
+        RiskOfRuin(ev_per_round=1, variance_per_round=0)
+    assert str(e.value) == 'Variance per round must be greater than 0.'
+
+
+def test_from_counts():
+    """Tests the from_counts method within the RiskOfRuin class."""
+    risk_of_ruin = RiskOfRuin.from_counts(count_statistics={
+        0: (3, -1, 4),
+        2: (1, 7, 4)
+    })
+    assert risk_of_ruin.ev_per_round == 1
+    # E[X^2] = (3 * (4 + 1) + 1 * (4 + 49)) / 4 = 17
+    assert risk_of_ruin.variance_per_round == 16
+
+
+def test_from_counts_no_rounds():
+    """Tests the from_counts method within the RiskOfRuin class with no rounds."""
+    with pytest.raises(ValueError) as e:
+        RiskOfRuin.from_counts(count_statistics={})
+    assert str(e.value) == 'At least one round must be played to compute the risk of ruin.'
+
+
+def test_from_stats():
+    """Tests the from_stats method within the RiskOfRuin class."""
+    stats = Stats()
+    for count, winnings in [(1, 10), (1, -10), (2, 20), (2, 0)]:
+        stats.stats[(count, StatsCategory.TOTAL_ROUNDS_PLAYED)] += 1
+        stats.record_round(count=count, winnings=winnings)
+    assert stats.count_statistics() == {1: (2, 0, 100), 2: (2, 10, 100)}
+    risk_of_ruin = RiskOfRuin.from_stats(stats=stats)
+    assert risk_of_ruin.ev_per_round == 5
+    assert risk_of_ruin.variance_per_round == 125
+
+
+def test_from_variance():
+    """Tests the from_variance method within the RiskOfRuin class."""
+    variance = Variance(bankroll=100)
+    for bankroll in [110, 100, 120, 120]:
+        variance.update_aggregate(bankroll=bankroll)
+    risk_of_ruin = RiskOfRuin.from_variance(variance=variance)
+    assert isclose(risk_of_ruin.ev_per_round, 5)
+    assert isclose(risk_of_ruin.variance_per_round, 125)
+
+
+def test_n0_and_score():
+    """Tests the n0 and score properties within the RiskOfRuin class."""
+    risk_of_ruin = RiskOfRuin(ev_per_round=2, variance_per_round=400)
+    assert risk_of_ruin.n0 == 100
+    assert risk_of_ruin.score == 10_000
+    assert RiskOfRuin(ev_per_round=0, variance_per_round=400).n0 == inf
+    assert RiskOfRuin(ev_per_round=-1, variance_per_round=400).score == 0
+
+
+def test_risk_of_ruin_unlimited_rounds():
+    """Tests the risk_of_ruin method within the RiskOfRuin class over an unlimited number of rounds."""
+    risk_of_ruin = RiskOfRuin(ev_per_round=1, variance_per_round=100)
+    assert isclose(risk_of_ruin.risk_of_ruin(bankroll=500), exp(-10))
+    assert risk_of_ruin.risk_of_ruin(bankroll=0) == 1
+    assert RiskOfRuin(ev_per_round=-1, variance_per_round=100).risk_of_ruin(bankroll=500) == 1
+
+
+def test_risk_of_ruin_random_walk():
+    """Tests the risk_of_ruin method within the RiskOfRuin class using the random walk approximation."""
+    risk_of_ruin = RiskOfRuin(ev_per_round=1, variance_per_round=100)
+    random_walk = risk_of_ruin.risk_of_ruin(bankroll=500, method=RiskOfRuinMethod.RANDOM_WALK)
+    assert isclose(random_walk, (0.9 / 1.1) ** 50)
+    assert isclose(random_walk, exp(-10), rel_tol=0.05)
+    with pytest.raises(ValueError):
+        risk_of_ruin.risk_of_ruin(bankroll=500, rounds=100, method=RiskOfRuinMethod.RANDOM_WALK)
+
+
+def test_risk_of_ruin_finite_rounds():
+    """Tests the risk_of_ruin method within the RiskOfRuin class over a trip of limited length."""
+    risk_of_ruin = RiskOfRuin(ev_per_round=1, variance_per_round=100)
+    short_trip = risk_of_ruin.risk_of_ruin(bankroll=500, rounds=1_000)
+    long_trip = risk_of_ruin.risk_of_ruin(bankroll=500, rounds=100_000)
+    assert 0 < short_trip < long_trip <= risk_of_ruin.risk_of_ruin(bankroll=500)
+    assert isclose(long_trip, exp(-10), rel_tol=1e-6)
+    # a negative drift must not overflow
+    assert RiskOfRuin(ev_per_round=-5, variance_per_round=100).risk_of_ruin(bankroll=5_000, rounds=100_000) == 1
+
+
+def test_required_bankroll():
+    """Tests the required_bankroll method within the RiskOfRuin class."""
+    risk_of_ruin = RiskOfRuin(ev_per_round=1, variance_per_round=100)
+    assert isclose(risk_of_ruin.required_bankroll(target_risk_of_ruin=exp(-10)), 500)
+    assert isclose(
+        risk_of_ruin.required_bankroll(target_risk_of_ruin=(0.9 / 1.1) ** 50, method=RiskOfRuinMethod.RANDOM_WALK),
+        500
+    )
+    trip_bankroll = risk_of_ruin.required_bankroll(target_risk_of_ruin=0.05, rounds=1_000)
+    assert isclose(risk_of_ruin.risk_of_ruin(bankroll=trip_bankroll, rounds=1_000), 0.05, rel_tol=1e-6)
+    assert trip_bankroll < risk_of_ruin.required_bankroll(target_risk_of_ruin=0.05)
+    assert RiskOfRuin(ev_per_round=-1, variance_per_round=100).required_bankroll(target_risk_of_ruin=0.05) == inf
+    with pytest.raises(ValueError) as e:
+        risk_of_ruin.required_bankroll(target_risk_of_ruin=1)
+    assert str(e.value) == 'Target risk of ruin must be between 0 and 1.'
@@ -0,0 +1,108 @@
+import pytest
+from blackjack.blackjack import Blackjack
+from blackjack.enums import RunOutcome, ShoeRNG
+from blackjack.log_policy import LogPolicy
+from blackjack.player import Player
+from blackjack.runs import play_run, play_runs
+
+
+def make_blackjack():
+    return Blackjack(min_bet=10, max_bet=500)
+
+
+def make_player():
+    return Player(name='Player 1', bankroll=1000, min_bet=10)
+
+
+def test_play_run_uses_dummy_simulation(monkeypatch):
+    """Tests play_run returns RAN_OUT with zero winnings when the simulation does nothing."""
+
+    def fake_simulate(self, **kwargs):
+        return None
+
+    monkeypatch.setattr(Blackjack, 'simulate', fake_simulate)
+
+    outcome, winnings, hands_played, variance_reduction_factor, player = play_run(
+        make_blackjack=make_blackjack, make_player=make_player, run=1, number_of_shoes=1, penetration=0.5, shoe_size=1
+    )
+
+    assert outcome == RunOutcome.RAN_OUT
+    assert winnings == 0
+    assert hands_played == 0
+    assert variance_reduction_factor is None
+    assert player.name == 'Player 1'
+
+
+def test_play_run_philox():
+    """Tests PHILOX runs are dealt shoes keyed by the run, not shuffled by the random module."""
+    kwargs = {
+        'make_blackjack': make_blackjack, 'make_player': make_player, 'number_of_shoes': 2, 'penetration': 0.75,
+        'shoe_size': 2
+    }
+    philox = play_run(run=3, shoe_rng=ShoeRNG.PHILOX, **kwargs)
+    assert play_run(run=3, shoe_rng=ShoeRNG.PHILOX, **kwargs)[1:3] == philox[1:3]
+    assert play_run(run=3, **kwargs)[1:3] != philox[1:3]
+
+
+def test_play_runs_summarizes_runs(monkeypatch):
+    """Tests play_runs summarizes every run without returning each run's winnings."""
+    runs = []
+
+    def fake_play_run(run, **kwargs):
+        runs.append(run)
+        return (RunOutcome.BANKRUPT if run % 2 else RunOutcome.GOAL), run * 10, 5, 0.5, make_player()
+
+    monkeypatch.setattr('blackjack.runs.play_run', fake_play_run)
+
+    outcome_counts, total_winnings, total_hands, winnings_distribution, variance_reduction_factor_total = play_runs(
+        make_blackjack=make_blackjack, make_player=make_player, first_run=3, number_of_runs=4, number_of_shoes=1,
+        penetration=0.5, shoe_size=1
+    )
+
+    assert runs == [3, 4, 5, 6]
+    assert outcome_counts == {'bankrupt': 2, 'goal': 2}
+    assert total_winnings == 180
+    assert total_hands == 20
+    assert winnings_distribution.count == 4
+    assert winnings_distribution.mean == 45
+    assert variance_reduction_factor_total == 2.0
+
+
+def test_play_runs_export():
+    """Tests play_runs with export also returns the runs and count stats columns, and rounds only with a log policy."""
+    kwargs = {
+        'make_blackjack': make_blackjack, 'make_player': make_player, 'first_run': 3, 'number_of_runs': 2,
+        'number_of_shoes': 1, 'penetration': 0.75, 'shoe_size': 2
+    }
+    *summary, tables = play_runs(export=True, **kwargs)
+
+    plain = play_runs(**kwargs)
+    assert len(plain) == 5
+    assert summary[:3] == list(plain[:3])
+    assert tables['runs']['run'].tolist() == [3, 4]
+    assert set(tables['runs']['outcome'].tolist()) <= {outcome.value for outcome in RunOutcome}
+    assert tables['runs']['hands_played'].sum() == summary[2]
+    assert tables['runs']['winnings'].sum() == pytest.approx(summary[1])
+    assert set(tables['count_stats']['run'].tolist()) == {3, 4}
+    assert tables['count_stats']['total_hands_played'].sum() == summary[2]
+    assert 'rounds' not in tables
+    *_, tables = play_runs(export=True, make_log_policy=LogPolicy, **kwargs)
+    assert len(tables['rounds']['run']) == tables['count_stats']['total_rounds_played'].sum()
+    assert set(tables['rounds']['run'].tolist()) == {3, 4}
+
+
+def test_play_runs_export_log_policy():
+    """Tests play_runs exports the rounds each run's log policy keeps, however the runs are chunked."""
+    kwargs = {
+        'make_blackjack': make_blackjack, 'make_player': make_player, 'number_of_shoes': 2, 'penetration': 0.75,
+        'shoe_size': 2, 'export': True, 'make_log_policy': lambda: LogPolicy(every=10)
+    }
+    *_, tables = play_runs(first_run=0, number_of_runs=2, **kwargs)
+    *_, first = play_runs(first_run=0, number_of_runs=1, **kwargs)
+    *_, second = play_runs(first_run=1, number_of_runs=1, **kwargs)
+
+    rounds_played = tables['count_stats']['total_rounds_played'].sum()
+    assert 0 < len(tables['rounds']['run']) < rounds_played
+    assert tables['rounds']['bankroll_end'].tolist() == (
+        first['rounds']['bankroll_end'].tolist() + second['rounds']['bankroll_end'].tolist()
+    )
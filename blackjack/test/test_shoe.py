@@ -2,6 +2,7 @@ import random
 import pytest
 from blackjack.enums import CardCountingSystem
 from blackjack.shoe import Shoe
+from blackjack.source.remaining_decks import REMAINING_CARDS_TO_DECKS, remaining_cards_to_decks
 
 
 @pytest.mark.parametrize(
@@ -133,3 +134,42 @@ def test_true_count_zero():
     assert shoe.running_count(card_counting_system=CardCountingSystem.HI_LO) < 0
     assert shoe.remaining_decks > 0
     assert shoe.true_count(card_counting_system=CardCountingSystem.HI_LO) == 0
+
+
+def test_load(shoe):
+    """Tests the load method within the Shoe class."""
+    cards = ['A'] * 51 + ['K']
+    shoe.load(cards=cards)
+    assert len(shoe.cards) == 51
+    assert shoe.deal_card() == 'A'
+    assert shoe.seen_cards['10-J-Q-K'] == 0
+
+
+def test_load_wrong_number_of_cards(shoe):
+    """Tests the load method within the Shoe class with the wrong number of cards."""
+    with pytest.raises(ValueError) as e:
+        shoe.load(cards=['A'] * 51)
+    assert str(e.value) == 'Expected 52 cards to load into the shoe.'
+
+
+@pytest.mark.parametrize(
+    'remaining_cards, expected',
+    [
+        (0, 0.25),
+        (13, 0.25),
+        (14, 0.5),
+        (38, 0.5),
+        (39, 1),
+        (337, 6),
+        (338, 7),
+        (416, 8)
+    ]
+)
+def test_remaining_cards_to_decks(remaining_cards, expected):
+    """Tests the generated remaining decks table follows the documented rounding rules."""
+    table = remaining_cards_to_decks()
+    assert table[remaining_cards] == expected
+    assert type(table[remaining_cards]) is type(expected)
+    assert len(table) == 417
+    assert REMAINING_CARDS_TO_DECKS is table
+    assert remaining_cards_to_decks(max_decks=2) == table[:105]
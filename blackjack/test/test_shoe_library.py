@@ -0,0 +1,185 @@
+from collections import Counter
+import json
+import pickle
+import random
+import numpy as np
+import pytest
+from blackjack.blackjack import Blackjack
+from blackjack.cli import main
+from blackjack.enums import ShoeSampling
+from blackjack.player import Player
+from blackjack.results_export import RoundLog
+from blackjack.shoe_library import RANKS, PhiloxShoes, ShoeLibrary, ShoeSource, create_shoe_library
+
+
+def test_create_shoe_library(tmp_path):
+    """Tests the create_shoe_library function writes full, reproducible shoes in chunks."""
+    library = create_shoe_library(path=tmp_path / 'a.npy', number_of_shoes=5, shoe_size=2, seed=1, shoes_per_chunk=2)
+    assert len(library) == 5
+    assert library.shoe_size == 2
+    assert library.rows.dtype == np.int8
+    assert isinstance(library.rows, np.memmap)
+    for shoe_number in range(5):
+        assert Counter(library.cards(shoe_number=shoe_number)) == Counter(list(RANKS) * 8)
+    assert library.cards(shoe_number=0) != library.cards(shoe_number=1)
+
+    same_seed = create_shoe_library(path=tmp_path / 'b.npy', number_of_shoes=5, shoe_size=2, seed=1, shoes_per_chunk=2)
+    assert np.array_equal(same_seed.rows, library.rows)
+
+
+def test_create_shoe_library_invalid(tmp_path):
+    """Tests the create_shoe_library function with invalid arguments."""
+    with pytest.raises(ValueError) as e:
+        create_shoe_library(path=tmp_path / 'a.npy', number_of_shoes=5, shoe_size=9)
+    assert str(e.value) == 'Shoe size must be between 1 and 8 decks.'
+
+    np.save(tmp_path / 'b.npy', np.zeros((2, 50), dtype=np.int8))
+    with pytest.raises(ValueError) as e:
+        ShoeLibrary(path=tmp_path / 'b.npy')
+    assert str(e.value) == f'{tmp_path / "b.npy"} is not a shoe library.'
+
+
+def test_shoes(tmp_path):
+    """Tests the shoe and shoes methods within the ShoeLibrary class."""
+    library = create_shoe_library(path=tmp_path / 'a.npy', number_of_shoes=4, shoe_size=1, seed=2)
+    shoe = library.shoe(shoe_number=3, penetration=0.5)
+    # the last card is burned
+    assert shoe.cards == library.cards(shoe_number=3)[:-1]
+    assert shoe.cut_card_location == 26
+
+    assert shoe.shoe_id == 'a-3'
+
+    assert [shoe_number for _, shoe_number in library.shoes(number_of_shoes=2, first_shoe=1)] == [1, 2]
+    with pytest.raises(ValueError) as e:
+        list(library.shoes(number_of_shoes=2, first_shoe=3))
+    assert str(e.value) == 'The library has 4 shoes, not shoes 3 to 4.'
+
+
+def test_shoe_source_is_abstract():
+    """Tests a ShoeSource must define shoe_size, cards and shoe_id."""
+    class Cards(ShoeSource):
+        @property
+        def shoe_size(self) -> int:
+            return 1
+
+        def cards(self, shoe_number: int) -> list[str]:
+            return list(RANKS) * 4
+
+    with pytest.raises(TypeError):
+        ShoeSource()
+    with pytest.raises(TypeError):
+        Cards()
+
+
+def test_pickle(tmp_path):
+    """Tests a ShoeLibrary is pickled by its path."""
+    library = create_shoe_library(path=tmp_path / 'a.npy', number_of_shoes=100, shoe_size=8, seed=3)
+    assert len(pickle.dumps(library)) < 1000
+    unpickled = pickle.loads(pickle.dumps(library))
+    assert np.array_equal(unpickled.rows, library.rows)
+
+
+def test_simulate_shoe_library(tmp_path):
+    """Tests the simulate method within the Blackjack class deals from a shoe library whatever the seed."""
+    library = create_shoe_library(path=tmp_path / 'a.npy', number_of_shoes=6, shoe_size=2, seed=4)
+    bankrolls = []
+    for seed in (1, 2):
+        blackjack = Blackjack(min_bet=10, max_bet=500)
+        player = Player(name='Player 1', bankroll=10000, min_bet=10)
+        blackjack.add_player(player=player)
+        blackjack.simulate(
+            penetration=0.75, number_of_shoes=3, shoe_size=2, seed=seed, progress_bar=False,
+            shoe_library=library, first_shoe=3
+        )
+        bankrolls.append(player.bankroll)
+    assert bankrolls[0] == bankrolls[1]
+
+    with pytest.raises(ValueError) as e:
+        blackjack.simulate(
+            penetration=0.75, number_of_shoes=3, shoe_size=6, progress_bar=False, shoe_library=library
+        )
+    assert str(e.value) == 'The shoe library has shoes of 2 decks, not 6.'
+
+    with pytest.raises(ValueError) as e:
+        blackjack.simulate(
+            penetration=0.75, number_of_shoes=3, shoe_size=2, progress_bar=False, shoe_library=library,
+            shoe_sampling=ShoeSampling.ANTITHETIC
+        )
+    assert str(e.value) == 'Shoe sampling must be RANDOM when dealing from a shoe library.'
+
+
+def test_library_command(tmp_path, capsys):
+    """Tests the library command creates a shoe library, and the replay command replays its shoes."""
+    path = tmp_path / 'library.npy'
+    assert main(['library', str(path), '--shoes', '3', '--shoe-size', '2', '--seed', '1']) == 0
+    assert capsys.readouterr().out == f'Wrote 3 shoes of 2 decks to {path}.\n'
+    assert len(ShoeLibrary(path=path)) == 3
+
+    config = tmp_path / 'config.json'
+    config.write_text(json.dumps({
+        'rules': {'min_bet': 10, 'max_bet': 500},
+        'player': {'name': 'P', 'bankroll': 1000, 'min_bet': 10},
+        'simulation': {'shoe_size': 2}
+    }))
+    assert main(['replay', str(config), '--shoe', '2', '--rounds', '0:0', '--library', str(path)]) == 0
+    trace = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    blackjack = Blackjack(min_bet=10, max_bet=500)
+    blackjack.add_player(player=Player(name='P', bankroll=1000, min_bet=10))
+    expected = []
+    blackjack.replay(
+        shoe_number=2, penetration=0.75, shoe_size=2, last_round=0,
+        cards=ShoeLibrary(path=path).cards(shoe_number=2), _trace=expected.append
+    )
+    assert trace == expected
+
+
+def test_philox_shoes():
+    """Tests the PhiloxShoes class shuffles every shoe of every run independently from its key."""
+    shoes = PhiloxShoes(shoe_size=2, run=17)
+    cards = shoes.cards(shoe_number=48000)
+    assert Counter(cards) == Counter(list(RANKS) * 8)
+    assert PhiloxShoes(shoe_size=2, run=17).cards(shoe_number=48000) == cards
+    assert shoes.cards(shoe_number=47999) != cards
+    assert PhiloxShoes(shoe_size=2, run=16).cards(shoe_number=48000) != cards
+    assert PhiloxShoes(shoe_size=2, run=17, seed=1).cards(shoe_number=48000) != cards
+    assert [shoe.cards for shoe, _ in shoes.shoes(number_of_shoes=2, first_shoe=47999)][1] == cards[:-1]
+    assert shoes.shoe(shoe_number=48000).shoe_id == '17-48000'
+
+    with pytest.raises(ValueError) as e:
+        shoes.cards(shoe_number=-1)
+    assert str(e.value) == 'Shoe number must be greater than or equal to 0.'
+    with pytest.raises(ValueError) as e:
+        PhiloxShoes(shoe_size=2, run=-1)
+    assert str(e.value) == 'Run and seed must be greater than or equal to 0.'
+
+
+def test_simulate_philox_shoes():
+    """Tests the simulate method within the Blackjack class deals PhiloxShoes shards like one simulation."""
+    def bankroll(shards):
+        blackjack = Blackjack(min_bet=10, max_bet=500)
+        player = Player(name='Player 1', bankroll=10000, min_bet=10)
+        blackjack.add_player(player=player)
+        for first_shoe, number_of_shoes in shards:
+            blackjack.simulate(
+                penetration=0.75, number_of_shoes=number_of_shoes, shoe_size=2, progress_bar=False,
+                shoe_library=PhiloxShoes(shoe_size=2, run=3), first_shoe=first_shoe
+            )
+        return player.bankroll
+
+    assert bankroll(shards=[(0, 4)]) == bankroll(shards=[(0, 1), (1, 3)])
+
+
+def test_philox_shoe_ids():
+    """Tests shoes dealt from PhiloxShoes are logged under ids keyed by the run and shoe numbers, without the random module."""
+    blackjack = Blackjack(min_bet=10, max_bet=500)
+    blackjack.add_player(player=Player(name='Player 1', bankroll=10000, min_bet=10))
+    round_log = RoundLog()
+    random.seed(5)
+    state = random.getstate()
+    blackjack.simulate(
+        penetration=0.75, number_of_shoes=2, shoe_size=2, progress_bar=False,
+        shoe_library=PhiloxShoes(shoe_size=2, run=3), first_shoe=4, _round_log=round_log
+    )
+    assert random.getstate() == state
+    assert set(round_log.columns()['shoe_id'].tolist()) == {'3-4', '3-5'}
+
@@ -0,0 +1,108 @@
+import random
+from collections import Counter
+import pytest
+from blackjack.counting_system import CountingSystem
+from blackjack.enums import CardCountingSystem, ShoeSampling
+from blackjack.shoe import Shoe
+from blackjack.shoe_sampler import ShoeSampler, _running_count_distribution
+
+
+@pytest.mark.parametrize(
+    'test_card_counting_system',
+    [
+        (CardCountingSystem.HI_LO),
+        (CardCountingSystem.HALVES),
+        (CardCountingSystem.KO)
+    ]
+)
+def test_running_count_distribution(test_card_counting_system):
+    """Tests that the running count distribution at the cut card is a probability distribution."""
+    distribution = _running_count_distribution(
+        shoe_size=2, penetration=0.75, card_counting_system=test_card_counting_system
+    )
+    assert sum(distribution.values()) == pytest.approx(1)
+    assert sum(count * probability for count, probability in distribution.items()) == pytest.approx(
+        0 if test_card_counting_system != CardCountingSystem.KO else 77 * 4 / 52
+    )
+
+
+def test_running_count_distribution_all_cards_dealt():
+    """Every card but the burn card dealt leaves exactly minus the burn card's tag."""
+    distribution = _running_count_distribution(
+        shoe_size=1, penetration=1.0, card_counting_system=CardCountingSystem.HI_LO
+    )
+    assert distribution == pytest.approx({-1: 20 / 52, 0: 12 / 52, 1: 20 / 52})
+
+
+def test_running_count_distribution_thirds():
+    """Tests the running count distribution of a custom system with tags that are not multiples of 1/4."""
+    thirds = CountingSystem(
+        name='Thirds',
+        values={'2': 1 / 3, '3': 2 / 3, '4': 1, '5': 1, '6': 2 / 3, '7': 1 / 3, '8': 0, '9': 0, '10-J-Q-K': -2 / 3, 'A': -4 / 3}
+    )
+    distribution = _running_count_distribution(shoe_size=1, penetration=0.75, card_counting_system=thirds)
+    assert sum(distribution.values()) == pytest.approx(1)
+    assert sum(count * probability for count, probability in distribution.items()) == pytest.approx(0)
+    assert 1 / 3 in distribution
+
+    irrational = CountingSystem(
+        name='Irrational',
+        values={'2': 2 ** 0.5, '3': 1, '4': 1, '5': 1, '6': 1, '7': 0, '8': 0, '9': 0, '10-J-Q-K': -1, 'A': -1}
+    )
+    with pytest.raises(ValueError) as e:
+        _running_count_distribution(shoe_size=1, penetration=0.75, card_counting_system=irrational)
+    assert str(e.value) == (
+        'Card counting values must be fractions with a denominator of at most 100 to stratify shoes, not 1.4142135623730951.'
+    )
+
+
+def test_shoes_random_matches_shuffle():
+    """Random sampling draws the same shoes as shuffling a new shoe directly."""
+    random.seed(3)
+    shoes = [shoe.cards for shoe, _ in ShoeSampler(shoe_size=1, penetration=0.75).shoes(number_of_shoes=2)]
+    random.seed(3)
+    expected = []
+    for _ in range(2):
+        shoe = Shoe(shoe_size=1, penetration=0.75)
+        shoe.shuffle()
+        expected.append(shoe.cards)
+    assert shoes == expected
+
+
+def test_shoes_antithetic():
+    """Antithetic sampling pairs each shuffled shoe with its reverse order."""
+    random.seed(1)
+    sampler = ShoeSampler(shoe_size=1, penetration=0.75, sampling=ShoeSampling.ANTITHETIC)
+    (first, first_label), (second, second_label), (third, third_label) = sampler.shoes(number_of_shoes=3)
+    assert first_label == second_label == 0
+    assert third_label == 1
+    # each shoe has burned the last card of its own order
+    assert first.cards[1:] == second.cards[:0:-1]
+    assert Counter(first.cards + [second.cards[0]]) == Counter(Shoe(shoe_size=1).cards)
+
+
+def test_shoes_stratified():
+    """Stratified sampling allocates shoes to strata in proportion to their probabilities."""
+    random.seed(1)
+    sampler = ShoeSampler(shoe_size=2, penetration=0.75, sampling=ShoeSampling.STRATIFIED, strata_boundaries=(0,))
+    probabilities = sampler.stratum_probabilities
+    assert sum(probabilities) == pytest.approx(1)
+    labels = Counter()
+    for shoe, stratum in sampler.shoes(number_of_shoes=200):
+        labels[stratum] += 1
+        assert len(shoe.cards) == 103
+    assert abs(labels[0] - 200 * probabilities[0]) < 1
+    assert abs(labels[1] - 200 * probabilities[1]) < 1
+
+
+def test_variance_reduction_factor():
+    """Tests the variance_reduction_factor method within the ShoeSampler class."""
+    assert ShoeSampler(shoe_size=1, penetration=0.75).variance_reduction_factor([1, 2, 3], [0, 1, 2]) == 1
+    antithetic = ShoeSampler(shoe_size=1, penetration=0.75, sampling=ShoeSampling.ANTITHETIC)
+    # sample variance of the shoes is 11 / 3, sample variance of the pair means is 1 / 2
+    assert antithetic.variance_reduction_factor([1, -1, 3, -1], [0, 0, 1, 1]) == pytest.approx(
+        (11 / 3) / (2 * 0.5)
+    )
+    stratified = ShoeSampler(shoe_size=1, penetration=0.75, sampling=ShoeSampling.STRATIFIED, strata_boundaries=(0,))
+    stratified._stratum_probabilities = [0.5, 0.5]
+    assert stratified.variance_reduction_factor([0, 0, 10, 10.5], [0, 0, 1, 1]) > 100
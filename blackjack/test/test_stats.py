@@ -1,3 +1,8 @@
+import pickle
+from blackjack.enums import StatsCategory
+from blackjack.stats import Stats
+
+
 def test_summary_as_dictionary(stats):
     """
     Tests the summary method within the Stats class
@@ -46,3 +51,33 @@ def test_summary_as_string(stats):
         'TOTAL AMOUNT BET: $47.50\n'
         'TOTAL NET WINNINGS: -$10.00'
     )
+
+
+def test_totals(stats):
+    """Tests the Stats class totals categories across counts as values change."""
+    assert stats.total(StatsCategory.TOTAL_ROUNDS_PLAYED) == 2
+    assert stats.total(StatsCategory.AMOUNT_BET, StatsCategory.INSURANCE_AMOUNT_BET) == 47.5
+    stats.stats[(1, StatsCategory.AMOUNT_BET)] = 5
+    del stats.stats[(3, StatsCategory.AMOUNT_BET)]
+    assert stats.total(StatsCategory.AMOUNT_BET) == 5
+    assert stats.stats[(4, StatsCategory.AMOUNT_BET)] == 0
+    assert stats.summary(string=False)[StatsCategory.AMOUNT_BET.value] == 5
+    stats.stats.clear()
+    assert stats.total(StatsCategory.AMOUNT_BET) == 0
+
+
+def test_derived_metrics(stats):
+    """Tests the rounds_played, hands_played, ev_per_hand, win_rate and average_bet properties."""
+    assert (stats.rounds_played, stats.hands_played) == (2, 2)
+    assert stats.ev_per_hand == -5
+    assert stats.win_rate == 0
+    assert stats.average_bet == 17.5
+    assert Stats().ev_per_hand == 0
+
+
+def test_pickle(stats):
+    """Tests the Stats class keeps its totals through pickling, as when returned by a worker process."""
+    unpickled = pickle.loads(pickle.dumps(stats))
+    assert unpickled.summary(string=False) == stats.summary(string=False)
+    unpickled.stats[(1, StatsCategory.AMOUNT_BET)] += 10
+    assert unpickled.total(StatsCategory.AMOUNT_BET) == 45
@@ -1,4 +1,5 @@
 import pytest
+from blackjack.back_counter import BackCounter
 from blackjack.card_counter import CardCounter
 from blackjack.enums import CardCountingSystem
 from blackjack.player import Player
@@ -137,6 +138,19 @@ def test_add_player_minimum_bet_greater_than_table_maximum(table):
     assert str(e.value) == "Player 1's desired bet is not allowed according to the table rules."
 
 
+def test_validate_player(table, back_counter):
+    """
+    Tests the validate_player method within the Table class
+    checks a player against the table rules without seating it.
+
+    """
+    table.validate_player(player=back_counter)
+    with pytest.raises(ValueError) as e:
+        table.validate_player(player=Player(name='Player 1', bankroll=1000, min_bet=5))
+    assert str(e.value) == "Player 1's desired bet is not allowed according to the table rules."
+    assert table.players_and_observers == []
+
+
 def test_remove_player(table, player):
     """Tests the remove_player method within the Table class."""
     table.add_player(player=player)
@@ -176,3 +190,41 @@ def test_remove_back_counter(table, back_counter):
     assert back_counter not in table.players
     assert back_counter in table.observers
     assert not back_counter.is_seated
+
+
+def test_players_and_observers(table, player):
+    """
+    Tests the players_and_observers property within the Table class
+    keeps seating order and is only rebuilt when seating changes.
+
+    """
+    back_counters = [
+        BackCounter(
+            name=f'Back Counter {i}',
+            bankroll=1000,
+            min_bet=10,
+            card_counting_system=CardCountingSystem.HI_LO,
+            bet_ramp={1: 15, 2: 20},
+            insurance=None,
+            entry_point=3,
+            exit_point=0
+        )
+        for i in range(24)
+    ]
+    table.add_player(player=player)
+    for back_counter in back_counters:
+        table.add_player(player=back_counter)
+    view = table.players_and_observers
+    assert view == [player] + back_counters
+    assert table.players_and_observers is view
+
+    table.add_back_counter(back_counter=back_counters[5])
+    table.add_back_counter(back_counter=back_counters[2])
+    assert view == [player] + back_counters
+    assert table.players == [player, back_counters[5], back_counters[2]]
+    assert table.observers == [back_counter for i, back_counter in enumerate(back_counters) if i not in {2, 5}]
+
+    table.remove_back_counter(back_counter=back_counters[5])
+    table.remove_player(player=player)
+    assert table.players == [back_counters[2]]
+    assert table.players_and_observers[-1] is back_counters[5]
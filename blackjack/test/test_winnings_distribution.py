@@ -0,0 +1,112 @@
+import pickle
+import numpy as np
+import pytest
+from blackjack.winnings_distribution import WinningsDistribution
+
+
+@pytest.fixture
+def winnings():
+    return np.random.default_rng(1).normal(loc=50, scale=1000, size=20000)
+
+
+def test_percentiles(winnings):
+    """Tests the percentiles method within the WinningsDistribution class."""
+    winnings_distribution = WinningsDistribution(buffer_size=100)
+    for amount in winnings:
+        winnings_distribution.add(winnings=amount)
+    assert winnings_distribution.count == 20000
+    assert winnings_distribution.mean == pytest.approx(winnings.mean())
+    assert winnings_distribution.min == winnings.min()
+    assert winnings_distribution.max == winnings.max()
+    np.testing.assert_allclose(
+        winnings_distribution.percentiles([5, 20, 50, 80]),
+        np.percentile(winnings, [5, 20, 50, 80]),
+        atol=30
+    )
+    assert winnings_distribution.percentiles([0, 100]).tolist() == [winnings.min(), winnings.max()]
+
+
+def test_merge(winnings):
+    """
+    Tests the merge method within the WinningsDistribution class
+    with distributions sent from worker processes.
+
+    """
+    parts = [WinningsDistribution() for _ in range(4)]
+    for i, amount in enumerate(winnings):
+        parts[i % 4].add(winnings=amount)
+    merged = WinningsDistribution()
+    for part in parts:
+        merged.merge(pickle.loads(pickle.dumps(part)))
+    merged.merge(WinningsDistribution())
+
+    assert merged.count == 20000
+    assert merged.mean == pytest.approx(winnings.mean())
+    np.testing.assert_allclose(merged.percentiles([5, 50, 95]), np.percentile(winnings, [5, 50, 95]), atol=30)
+
+
+def test_histogram(winnings):
+    """Tests the histogram method within the WinningsDistribution class."""
+    winnings_distribution = WinningsDistribution()
+    for amount in winnings:
+        winnings_distribution.add(winnings=amount)
+    counts, edges = winnings_distribution.histogram(bins=4)
+    assert edges[0] == winnings.min()
+    assert edges[-1] == winnings.max()
+    assert counts.sum() == pytest.approx(20000)
+    np.testing.assert_allclose(counts, np.histogram(winnings, bins=edges)[0], rtol=0.05, atol=20)
+
+
+def test_empty():
+    """Tests the WinningsDistribution class before any winnings are added."""
+    winnings_distribution = pickle.loads(pickle.dumps(WinningsDistribution()))
+    assert winnings_distribution.count == 0
+    for method in (lambda: winnings_distribution.mean, lambda: winnings_distribution.percentiles(50)):
+        with pytest.raises(ValueError) as e:
+            method()
+        assert str(e.value) == 'No winnings have been added.'
+
+
+def test_single_run():
+    """Tests the WinningsDistribution class with the winnings of a single run."""
+    winnings_distribution = pickle.loads(pickle.dumps(WinningsDistribution()))
+    winnings_distribution.add(winnings=-25)
+    merged = WinningsDistribution().merge(pickle.loads(pickle.dumps(winnings_distribution)))
+    assert merged.percentiles(50) == -25
+
+
+def test_buffered_pickle():
+    """
+    Tests that a distribution with only buffered winnings is pickled without
+    a t-digest and merges into a distribution that has one.
+
+    """
+    part = WinningsDistribution()
+    for amount in (-100, 0, 50, 200):
+        part.add(winnings=amount)
+    state = part.__getstate__()
+    assert state['_digest'] is None
+    assert state['_buffer'] == [-100, 0, 50, 200]
+
+    merged = WinningsDistribution(buffer_size=2)
+    merged.add(winnings=25)
+    merged.add(winnings=75)
+    merged.merge(pickle.loads(pickle.dumps(part)))
+    assert merged.count == 6
+    assert merged.mean == pytest.approx(250 / 6)
+    assert merged.percentiles([0, 100]).tolist() == [-100, 200]
+
+
+def test_small_count_exact(winnings):
+    """Tests that percentiles and histograms are exact while every winnings is buffered."""
+    parts = [WinningsDistribution() for _ in range(4)]
+    for i, amount in enumerate(winnings[:20]):
+        parts[i % 4].add(winnings=amount)
+    merged = WinningsDistribution()
+    for part in parts:
+        merged.merge(pickle.loads(pickle.dumps(part)))
+
+    np.testing.assert_array_equal(merged.percentiles([5, 20, 80]), np.percentile(winnings[:20], [5, 20, 80]))
+    assert merged.percentiles(50) == np.percentile(winnings[:20], 50)
+    counts, edges = merged.histogram(bins=4)
+    np.testing.assert_array_equal(counts, np.histogram(winnings[:20], bins=4)[0])
@@ -0,0 +1,168 @@
+from __future__ import annotations
+from math import inf
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import numpy as np
+    from pytdigest import TDigest
+
+# NumPy and pytdigest (which imports pandas) are imported when winnings are first
+# digested, so workers that only buffer the winnings of a small chunk start quickly
+
+
+class WinningsDistribution:
+    """
+    Streaming summary of the winnings of many runs in bounded memory.
+
+    Quantiles and histograms are estimated from a t-digest, while the
+    number of runs, mean, minimum and maximum are exact. Until the first
+    buffer_size winnings are digested, quantiles and histograms are exact too. Distributions
+    built by separate workers can be merged and are picklable, so the
+    parent process never holds every run's winnings. Until the buffer is
+    full the winnings are only buffered, and are pickled as they are.
+
+    """
+    def __init__(self, compression: int = 100, buffer_size: int = 4096):
+        """
+        Parameters
+        ----------
+        compression
+            Compression of the t-digest. Higher values are more accurate in
+            the tails and use more memory
+        buffer_size
+            Number of winnings collected before they are added to the t-digest
+            in a single batch
+
+        """
+        self._compression = compression
+        self._buffer_size = buffer_size
+        self._digest: TDigest | None = None
+        self._buffer: list[float] = []
+        self._count = 0
+        self._total = 0.0
+        self._min = inf
+        self._max = -inf
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def mean(self) -> float:
+        if not self._count:
+            raise ValueError('No winnings have been added.')
+        return self._total / self._count
+
+    @property
+    def min(self) -> float:
+        return self._min
+
+    @property
+    def max(self) -> float:
+        return self._max
+
+    def add(self, winnings: float | int) -> None:
+        """Adds the winnings of a single run."""
+        self._buffer.append(winnings)
+        self._count += 1
+        self._total += winnings
+        if winnings < self._min:
+            self._min = winnings
+        if winnings > self._max:
+            self._max = winnings
+        if len(self._buffer) >= self._buffer_size:
+            self._flush()
+
+    def _digested(self) -> TDigest:
+        if self._digest is None:
+            from pytdigest import TDigest
+
+            self._digest = TDigest(compression=self._compression)
+        return self._digest
+
+    def _flush(self) -> None:
+        if not self._buffer:
+            return
+        import numpy as np
+
+        digest = self._digested()
+        if len(self._buffer) == 1:
+            # pytdigest cannot update from an array holding a single value
+            digest.update(float(self._buffer[0]))
+        else:
+            digest.update(np.array(self._buffer, dtype=float))
+        self._buffer = []
+
+    def merge(self, other: 'WinningsDistribution') -> 'WinningsDistribution':
+        """Adds every run summarized by another distribution to this one."""
+        if other._count:
+            if other._digest is None:
+                # the other distribution only buffered its winnings
+                self._buffer.extend(other._buffer)
+                if len(self._buffer) >= self._buffer_size:
+                    self._flush()
+            else:
+                from pytdigest import TDigest
+
+                self._flush()
+                other._flush()
+                self._digest = TDigest.combine(self._digested(), other._digest)
+            self._count += other._count
+            self._total += other._total
+            self._min = min(self._min, other._min)
+            self._max = max(self._max, other._max)
+        return self
+
+    def percentiles(self, q: float | list[float]) -> float | np.ndarray:
+        """
+        Estimates percentiles of the winnings, with q between 0 and 100
+        like np.percentile.
+
+        """
+        if not self._count:
+            raise ValueError('No winnings have been added.')
+        import numpy as np
+
+        if self._digest is None:
+            # every winnings is still buffered, so the percentiles are exact
+            return np.percentile(self._buffer, q)
+        self._flush()
+        return np.clip(self._digest.inverse_cdf(np.asarray(q, dtype=float) / 100), self._min, self._max)
+
+    def histogram(self, bins: int = 10) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Estimates the number of runs in equal width bins between the minimum
+        and maximum winnings. Returns the counts and bin edges like np.histogram.
+
+        """
+        if not self._count:
+            raise ValueError('No winnings have been added.')
+        import numpy as np
+
+        edges = np.linspace(self._min, self._max, bins + 1)
+        if self._digest is None:
+            return np.histogram(self._buffer, bins=edges)[0].astype(float), edges
+        self._flush()
+        cdf = np.clip(self._digest.cdf(edges), 0, 1)
+        cdf[0], cdf[-1] = 0.0, 1.0
+        return np.diff(cdf) * self._count, edges
+
+    def __getstate__(self) -> dict:
+        # the t-digest wraps a C structure, so it is pickled as its centroids
+        state = self.__dict__.copy()
+        if self._digest is not None:
+            self._flush()
+            state['_buffer'] = []
+            state['_digest'] = self._digest.get_centroids()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        centroids = state['_digest']
+        if centroids is not None:
+            from pytdigest import TDigest
+
+            state['_digest'] = (
+                TDigest.of_centroids(centroids, compression=state['_compression'])
+                if len(centroids) else TDigest(compression=state['_compression'])
+            )
+        self.__dict__.update(state)